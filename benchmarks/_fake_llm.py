@@ -0,0 +1,129 @@
+# Simulated LLM backends for benchmarks. Nothing here calls AWS.
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from myllmet.metrics.interface import AsyncLLMClientInterface, LLMClientInterface
+
+
+def latency_sampler(
+    distribution: str = "constant",
+    mean: float = 0.0,
+    spread: float = 0.5,
+    seed: Optional[int] = None,
+) -> Callable[[], float]:
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    if distribution == "constant":
+        return lambda: mean
+    if distribution == "uniform":
+        def sample_uniform() -> float:
+            with lock:
+                return rng.uniform(mean * (1 - spread), mean * (1 + spread))
+        return sample_uniform
+    if distribution == "lognormal":
+        # `spread` is the sigma of the underlying normal; mu is chosen so that the mean is `mean`.
+        mu = math.log(mean) - spread ** 2 / 2 if mean > 0 else 0.0
+
+        def sample_lognormal() -> float:
+            with lock:
+                return rng.lognormvariate(mu, spread) if mean > 0 else 0.0
+        return sample_lognormal
+
+    raise ValueError(f"Unknown latency distribution: {distribution}")
+
+
+class FakeOutputGenerator:
+    def __init__(self, claims_per_answer: int = 5, reason_chars: int = 80, seed: Optional[int] = None):
+        self.claims_per_answer = claims_per_answer
+        self.reason_chars = reason_chars
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, input_json: Dict[str, Any]) -> Dict[str, Any]:
+        if "claims" in input_json:
+            with self._lock:
+                verdicts = [self._rng.randint(0, 1) for _ in input_json["claims"]]
+            return {
+                "verdicts": [
+                    {"claim": claim, "verdict": verdict, "reason": "理" * self.reason_chars}
+                    for claim, verdict in zip(input_json["claims"], verdicts)
+                ]
+            }
+
+        return {"claims": [f"{input_json['answer'][:20]} に関する主張 {i}" for i in range(self.claims_per_answer)]}
+
+
+class FakeLLMClient(LLMClientInterface, AsyncLLMClientInterface):
+    # Returns generated outputs directly, without prompt rendering, to isolate metric overhead.
+    def __init__(
+        self,
+        generator: Optional[FakeOutputGenerator] = None,
+        latency: Optional[Callable[[], float]] = None,
+    ):
+        self.generator = generator or FakeOutputGenerator()
+        self.latency = latency or latency_sampler()
+
+    def invoke(self, instruction, fewshot_examples, input_json, output_json_schema, deadline=None):
+        delay = self.latency()
+        if delay > 0:
+            time.sleep(delay)
+        return self.generator(input_json)
+
+    async def ainvoke(self, instruction, fewshot_examples, input_json, output_json_schema, deadline=None):
+        delay = self.latency()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.generator(input_json)
+
+
+class FakeConverseRuntime:
+    # Stands in for a `bedrock-runtime` client so that `BedrockChatClient` runs its full path:
+    # prompt building, throttling retries, response parsing and usage accounting.
+    def __init__(
+        self,
+        generator: Optional[FakeOutputGenerator] = None,
+        latency: Optional[Callable[[], float]] = None,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.generator = generator or FakeOutputGenerator(seed=seed)
+        self.latency = latency or latency_sampler()
+        self.throttle_rate = throttle_rate
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttles = 0
+
+    def converse(self, modelId: str, system: List[Dict[str, Any]], messages: List[Dict[str, Any]], **kwargs):
+        with self._lock:
+            self.calls += 1
+            throttled = self._rng.random() < self.throttle_rate
+            if throttled:
+                self.throttles += 1
+
+        delay = self.latency()
+        if delay > 0:
+            time.sleep(delay)
+        if throttled:
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "Converse")
+
+        input_json = json.loads(messages[-1]["content"][0]["text"])
+        text = json.dumps(self.generator(input_json), ensure_ascii=False)
+        input_chars = sum(len(block.get("text", "")) for block in system)
+        input_chars += sum(len(block.get("text", "")) for message in messages for block in message["content"])
+
+        return {
+            "stopReason": "end_turn",
+            "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "usage": {"inputTokens": input_chars // 2, "outputTokens": len(text) // 2},
+        }
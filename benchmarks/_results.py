@@ -0,0 +1,36 @@
+# Writes benchmark results in the format `compare.py` reads: one JSON object per line with the
+# benchmark name, its parameters, the measured metrics and run metadata (commit, Python version).
+
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional
+
+
+def metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {"commit": commit, "python": platform.python_version(), "timestamp": time.time()}
+
+
+def write_results(results: Iterable[Dict[str, Any]], output_path: Optional[str] = None) -> None:
+    run_metadata = metadata()
+    output = open(output_path, "a", encoding="utf-8") if output_path else None
+    try:
+        for result in results:
+            line = json.dumps({**result, **run_metadata}, ensure_ascii=False)
+            print(line)
+            sys.stdout.flush()
+            if output is not None:
+                output.write(line + "\n")
+    finally:
+        if output is not None:
+            output.close()
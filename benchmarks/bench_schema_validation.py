@@ -0,0 +1,85 @@
+# Compares validation throughput of judge outputs across validator backends.
+#
+#   PYTHONPATH=src python benchmarks/bench_schema_validation.py [--claims 1 10 50 200] [--output results.jsonl]
+#
+# Results are written in the same format as `bench_scoring.py`, so `benchmarks/compare.py` can
+# compare them across runs.
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import jsonschema
+from _results import write_results
+
+from myllmet.metrics.components.faithfulness_judge import OUTPUT_JSON_SCHEMA
+from myllmet.metrics.components.schema_validator import get_validator
+
+
+def build_payload(num_claims: int) -> Dict[str, Any]:
+    return {
+        "verdicts": [
+            {
+                "claim": f"主張 {i}: 文書に記載された事実についての説明文です。",
+                "verdict": i % 2,
+                "reason": "文脈の該当箇所に同じ内容が明示的に記載されているため、この主張は文脈から直接推論できます。",
+            }
+            for i in range(num_claims)
+        ]
+    }
+
+
+def measure(validate: Callable[[Any], None], payload: Dict[str, Any], seconds: float) -> Dict[str, float]:
+    validate(payload)
+
+    calls = 0
+    started_at = time.perf_counter()
+    deadline = started_at + seconds
+    while True:
+        for _ in range(10):
+            validate(payload)
+        calls += 10
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+
+    elapsed = now - started_at
+    return {"calls": calls, "calls_per_second": calls / elapsed, "mean_us": elapsed / calls * 1e6}
+
+
+def backends() -> Dict[str, Callable[[Any], None]]:
+    result: Dict[str, Callable[[Any], None]] = {
+        "jsonschema.validate": lambda instance: jsonschema.validate(instance, OUTPUT_JSON_SCHEMA),
+        "compiled:jsonschema": get_validator(OUTPUT_JSON_SCHEMA, backend="jsonschema"),
+    }
+    try:
+        result["compiled:fastjsonschema"] = get_validator(OUTPUT_JSON_SCHEMA, backend="fastjsonschema")
+    except ImportError:
+        print("fastjsonschema is not installed. Skipping its backend.", file=sys.stderr)
+
+    return result
+
+
+def bench_schema_validation(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    for num_claims in args.claims:
+        payload = build_payload(num_claims)
+        for name, validate in backends().items():
+            yield {
+                "benchmark": "schema_validation",
+                "params": {"backend": name, "claims": num_claims},
+                "metrics": measure(validate, payload, args.seconds),
+            }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--claims", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--output", help="Append results to this JSONL file in addition to stdout.")
+    args = parser.parse_args(argv)
+
+    write_results(bench_schema_validation(args), args.output)
+
+if __name__ == "__main__":
+    main()
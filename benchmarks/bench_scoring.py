@@ -0,0 +1,165 @@
+# Benchmarks the scoring path against a simulated Bedrock backend.
+#
+#   PYTHONPATH=src python benchmarks/bench_scoring.py [--only end_to_end stages overhead] [--output results.jsonl]
+#
+# Results are written as JSON lines (see `_results.py`). Compare two result files with
+# `benchmarks/compare.py`.
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from _fake_llm import FakeConverseRuntime, FakeLLMClient, FakeOutputGenerator, latency_sampler
+from _results import write_results
+
+from myllmet import Faithfulness
+from myllmet.io_aws import BedrockChatClient
+from myllmet.metrics.components.faithfulness_judge import OUTPUT_JSON_SCHEMA
+from myllmet.metrics.components.schema_validator import validate
+from myllmet.trackers import JSONLTracker, ListTracker, SQLiteTracker
+
+
+def records(n: int) -> List[tuple]:
+    return [
+        (f"質問 {i}", f"回答 {i}: 東京は日本の首都であり、人口は約1400万人です。", "文脈: " + "東京に関する説明。" * 50)
+        for i in range(n)
+    ]
+
+
+def time_per_call(func: Callable[[], Any], seconds: float) -> Dict[str, float]:
+    func()
+    samples: List[float] = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline or len(samples) < 5:
+        started_at = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started_at)
+
+    return {
+        "calls": len(samples),
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": statistics.median(samples) * 1e6,
+        "p99_us": sorted(samples)[int(len(samples) * 0.99) - 1] * 1e6,
+    }
+
+
+def bench_end_to_end(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    for concurrency in args.concurrency:
+        runtime = FakeConverseRuntime(
+            generator=FakeOutputGenerator(claims_per_answer=args.claims, reason_chars=args.reason_chars, seed=0),
+            latency=latency_sampler(args.latency_distribution, args.latency_mean, args.latency_spread, seed=0),
+            throttle_rate=args.throttle_rate,
+            seed=0,
+        )
+        client: BedrockChatClient = BedrockChatClient("fake-model", max_wait=0, bedrock_runtime_client=runtime)
+        metric = Faithfulness.from_clients(claim_extractor_client=client, faithfulness_judge_client=client)
+
+        started_at = time.perf_counter()
+        result = metric.score_batch(records(args.rows), max_workers=concurrency)
+        elapsed = time.perf_counter() - started_at
+
+        yield {
+            "benchmark": "end_to_end",
+            "params": {
+                "concurrency": concurrency,
+                "rows": args.rows,
+                "claims": args.claims,
+                "latency_distribution": args.latency_distribution,
+                "latency_mean": args.latency_mean,
+                "throttle_rate": args.throttle_rate,
+            },
+            "metrics": {
+                "rows_per_second": args.rows / elapsed,
+                "elapsed_seconds": elapsed,
+                "errors": len(result.errors),
+                "converse_calls": runtime.calls,
+                "throttles": runtime.throttles,
+            },
+        }
+
+
+def bench_stages(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    generator = FakeOutputGenerator(claims_per_answer=args.claims, reason_chars=args.reason_chars, seed=0)
+    runtime = FakeConverseRuntime(generator=generator)
+    client: BedrockChatClient = BedrockChatClient("fake-model", bedrock_runtime_client=runtime)
+    metric = Faithfulness.from_clients(claim_extractor_client=client, faithfulness_judge_client=client)
+    judge = metric.faithfulness_judge
+
+    question, answer, context = records(1)[0]
+    claims = generator({"question": question, "answer": answer})["claims"]
+    request = judge.build_request(context, claims)
+    system, messages = client._build_prompt(**request)
+    response = runtime.converse(modelId="fake-model", system=system, messages=messages)
+    output = client.parse_batch_model_output(response)
+    intermediates = {"claims": claims, "verdicts": output["verdicts"]}
+    prompts = {"faithfulness_judge": {"instruction": judge.instruction, "fewshot_examples": judge.fewshot_examples}}
+
+    def log_to(tracker) -> Callable[[], None]:
+        return lambda: tracker.log(question, answer, context, "", 0.5, intermediates, prompts)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sqlite_tracker = SQLiteTracker(os.path.join(tmp_dir, "tracker.db"))
+        jsonl_tracker = JSONLTracker(os.path.join(tmp_dir, "jsonl"), fsync_interval=None)
+        stages: Dict[str, Callable[[], Any]] = {
+            "prompt_build": lambda: client._build_prompt(**request),
+            "json_parse": lambda: client.parse_batch_model_output(response),
+            "validation": lambda: validate(output, OUTPUT_JSON_SCHEMA),
+            "tracker_log:list": log_to(ListTracker()),
+            "tracker_log:sqlite": log_to(sqlite_tracker),
+            "tracker_log:jsonl": log_to(jsonl_tracker),
+        }
+        for stage, func in stages.items():
+            yield {
+                "benchmark": "stages",
+                "params": {"stage": stage, "claims": args.claims},
+                "metrics": time_per_call(func, args.seconds),
+            }
+        sqlite_tracker.close()
+        jsonl_tracker.close()
+
+
+def bench_overhead(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    # Zero-latency clients leave only the metric's own work in `Faithfulness.score`.
+    generator = FakeOutputGenerator(claims_per_answer=args.claims, reason_chars=args.reason_chars, seed=0)
+    question, answer, context = records(1)[0]
+    for name, client in (
+        ("direct", FakeLLMClient(generator)),
+        ("bedrock_chat", BedrockChatClient("fake-model", bedrock_runtime_client=FakeConverseRuntime(generator))),
+    ):
+        metric = Faithfulness.from_clients(claim_extractor_client=client, faithfulness_judge_client=client)
+        yield {
+            "benchmark": "overhead",
+            "params": {"client": name, "claims": args.claims},
+            "metrics": time_per_call(lambda: metric.score(question, answer, context), args.seconds),
+        }
+
+
+BENCHMARKS = {
+    "end_to_end": bench_end_to_end,
+    "stages": bench_stages,
+    "overhead": bench_overhead,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--output", help="Append results to this JSONL file in addition to stdout.")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--claims", type=int, default=10)
+    parser.add_argument("--reason-chars", type=int, default=80)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--latency-distribution", choices=["constant", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-mean", type=float, default=0.05)
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time budget per micro-benchmark.")
+    args = parser.parse_args(argv)
+
+    write_results((result for name in args.only for result in BENCHMARKS[name](args)), args.output)
+
+if __name__ == "__main__":
+    main()
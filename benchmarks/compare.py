@@ -0,0 +1,57 @@
+# Compares two benchmark result files written by the benchmarks' `--output` option.
+#
+#   python benchmarks/compare.py baseline.jsonl current.jsonl [--threshold 0.1]
+#
+# Results are matched by benchmark name and parameters. Exits with 1 if any metric moved in
+# the wrong direction by more than the threshold.
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Metrics where a larger value is better. All other compared metrics are latencies.
+HIGHER_IS_BETTER = {"rows_per_second", "calls_per_second"}
+COMPARED_METRICS = {"rows_per_second", "calls_per_second", "mean_us", "p50_us"}
+
+
+def load(path: str) -> Dict[Tuple[str, str], Dict[str, float]]:
+    # The last result for each key wins, so appending runs to one file keeps the newest.
+    results: Dict[Tuple[str, str], Dict[str, float]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                result = json.loads(line)
+                key = (result["benchmark"], json.dumps(result.get("params", {}), sort_keys=True))
+                results[key] = result["metrics"]
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed relative regression.")
+    args = parser.parse_args(argv)
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+
+    regressed = False
+    for key in sorted(baseline.keys() & current.keys()):
+        for metric in sorted(COMPARED_METRICS & baseline[key].keys() & current[key].keys()):
+            before, after = baseline[key][metric], current[key][metric]
+            if before == 0:
+                continue
+            change = (after - before) / before
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = "REGRESSION" if worse > args.threshold else ""
+            regressed = regressed or bool(flag)
+            print(f"{key[0]:<18} {key[1]:<80} {metric:<16} {before:>12.2f} -> {after:>12.2f} ({change:+.1%}) {flag}")
+
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,14 @@
-from .metrics import Faithfulness
+from typing import TYPE_CHECKING
+
+from myllmet._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .metrics import Faithfulness
 
 __all__ = [
     "Faithfulness",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Faithfulness": ".metrics",
+})
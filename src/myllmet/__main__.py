@@ -0,0 +1,5 @@
+import sys
+
+from myllmet.cli import main
+
+sys.exit(main())
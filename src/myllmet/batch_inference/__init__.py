@@ -0,0 +1,8 @@
+from ._faithfulness import FaithfulnessBatchInference
+from ._local import LocalBatchJobRunner, LocalBatchStorage
+
+__all__ = [
+    "FaithfulnessBatchInference",
+    "LocalBatchJobRunner",
+    "LocalBatchStorage",
+]
@@ -0,0 +1,222 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from myllmet.batch_inference.interface import BatchJobRunnerInterface, BatchModelClientInterface, BatchStorageInterface
+from myllmet.metrics import BatchError, BatchScoreResult, Faithfulness
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLES_NAME = "samples.jsonl"
+CLAIM_EXTRACTOR_INPUT_NAME = "claim_extractor/input.jsonl"
+FAITHFULNESS_JUDGE_INPUT_NAME = "faithfulness_judge/input.jsonl"
+
+
+class FaithfulnessBatchInference:
+    def __init__(
+        self,
+        metric: Faithfulness,
+        storage: BatchStorageInterface,
+        job_runner: Optional[BatchJobRunnerInterface] = None,
+    ):
+        self.metric = metric
+        self.storage = storage
+        self.job_runner = job_runner
+
+    def run(self, run_name: str, records: Iterable[Tuple[str, str, str]]) -> BatchScoreResult:
+        if self.job_runner is None:
+            raise ValueError(f"`job_runner` must be provided to use {self.__class__.__name__}.run.")
+
+        extractor_input = self.prepare_claim_extraction(run_name, records)
+        extractor_output = self.job_runner.run(
+            job_name=f"{run_name}-claim-extractor",
+            model_id=self._claim_extractor_client.model_id,
+            input_name=extractor_input,
+            output_prefix=f"{run_name}/claim_extractor/output"
+        )
+
+        judge_input = self.prepare_faithfulness_judge(run_name, extractor_output)
+        judge_output = self.job_runner.run(
+            job_name=f"{run_name}-faithfulness-judge",
+            model_id=self._faithfulness_judge_client.model_id,
+            input_name=judge_input,
+            output_prefix=f"{run_name}/faithfulness_judge/output"
+        )
+
+        return self.finalize(run_name, extractor_output, judge_output)
+
+    # Stage 1: samples -> claim extraction requests
+    def prepare_claim_extraction(self, run_name: str, records: Iterable[Tuple[str, str, str]]) -> str:
+        extractor = self.metric.claim_extractor
+        client = self._claim_extractor_client
+
+        # Samples are persisted first so that later stages can join outputs back to them
+        # without keeping the dataset in memory.
+        self.storage.write_lines(
+            f"{run_name}/{SAMPLES_NAME}",
+            (
+                json.dumps(
+                    {"recordId": _record_id(index), "question": question, "answer": answer, "context": context},
+                    ensure_ascii=False
+                )
+                for index, (question, answer, context) in enumerate(records)
+            )
+        )
+
+        def requests() -> Iterator[str]:
+            for sample in self._read_samples(run_name):
+                model_input = client.build_batch_model_input(
+                    **extractor.build_request(sample["question"], sample["answer"])
+                )
+                yield json.dumps({"recordId": sample["recordId"], "modelInput": model_input}, ensure_ascii=False)
+
+        input_name = f"{run_name}/{CLAIM_EXTRACTOR_INPUT_NAME}"
+        self.storage.write_lines(input_name, requests())
+
+        return input_name
+
+    # Stage 2: claim extraction output -> judge requests
+    def prepare_faithfulness_judge(self, run_name: str, claim_extractor_output_name: str) -> str:
+        judge = self.metric.faithfulness_judge
+        client = self._faithfulness_judge_client
+        extractor_outputs = self._read_outputs(
+            claim_extractor_output_name,
+            self._claim_extractor_client,
+            self.metric.claim_extractor.validate_output
+        )
+
+        def requests() -> Iterator[str]:
+            for index, sample in enumerate(self._read_samples(run_name)):
+                output = extractor_outputs.get(sample["recordId"])
+                if output is None or isinstance(output, Exception):
+                    continue
+                for record_id, claims in self._judge_chunks(index, output["claims"]):
+                    model_input = client.build_batch_model_input(**judge.build_request(sample["context"], claims))
+                    yield json.dumps({"recordId": record_id, "modelInput": model_input}, ensure_ascii=False)
+
+        input_name = f"{run_name}/{FAITHFULNESS_JUDGE_INPUT_NAME}"
+        self.storage.write_lines(input_name, requests())
+
+        return input_name
+
+    # Stage 3: judge output -> scores and tracker records
+    def finalize(
+        self,
+        run_name: str,
+        claim_extractor_output_name: str,
+        faithfulness_judge_output_name: str,
+    ) -> BatchScoreResult:
+
+        extractor_outputs = self._read_outputs(
+            claim_extractor_output_name,
+            self._claim_extractor_client,
+            self.metric.claim_extractor.validate_output
+        )
+        judge_outputs = self._read_outputs(
+            faithfulness_judge_output_name,
+            self._faithfulness_judge_client,
+            self.metric.faithfulness_judge.validate_output
+        )
+
+        scores: List[Optional[float]] = []
+        errors: List[BatchError] = []
+        for index, sample in enumerate(self._read_samples(run_name)):
+            record_id = sample["recordId"]
+            try:
+                extractor_output = _unwrap_output(extractor_outputs, record_id, "claim extraction")
+                chunks = self._judge_chunks(index, extractor_output["claims"])
+                judge_output = self.metric.faithfulness_judge.merge_chunk_outputs(
+                    [claims for _, claims in chunks],
+                    [_unwrap_output(judge_outputs, chunk_id, "faithfulness judge") for chunk_id, _ in chunks]
+                )
+                score: Optional[float] = self.metric.score_from_outputs(
+                    question=sample["question"],
+                    answer=sample["answer"],
+                    context=sample["context"],
+                    claim_extractor_output=extractor_output,
+                    faithfulness_judge_output=judge_output
+                )
+            except Exception as e:
+                logger.warning("Failed to score record %s: %r", record_id, e)
+                errors.append(BatchError(row_index=index, exception=e))
+                score = None
+            scores.append(score)
+
+        return BatchScoreResult(scores=scores, errors=errors)
+
+    @property
+    def _claim_extractor_client(self) -> BatchModelClientInterface:
+        return _require_batch_client(self.metric.claim_extractor.client)
+
+    @property
+    def _faithfulness_judge_client(self) -> BatchModelClientInterface:
+        return _require_batch_client(self.metric.faithfulness_judge.client)
+
+    def _judge_chunks(self, index: int, claims: List[str]) -> List[Tuple[str, List[str]]]:
+        # Claims are split into the same chunks as in online scoring, so verdicts are judged on the
+        # same (reduced) contexts. Each chunk is its own record and `finalize` merges them back.
+        chunks = self.metric.faithfulness_judge.split_claims(claims)
+        if len(chunks) <= 1:
+            return [(_record_id(index), claims)]
+
+        return [(_chunk_record_id(index, i), chunk) for i, chunk in enumerate(chunks)]
+
+    def _read_samples(self, run_name: str) -> Iterator[Dict[str, Any]]:
+        for line in self.storage.read_lines(f"{run_name}/{SAMPLES_NAME}"):
+            yield json.loads(line)
+
+    def _read_outputs(
+        self,
+        output_name: str,
+        client: BatchModelClientInterface,
+        validate: Callable[[Any], Any],
+    ) -> Dict[str, Union[Any, Exception]]:
+
+        # Batch jobs do not preserve record order, so outputs are indexed by record id.
+        outputs: Dict[str, Union[Any, Exception]] = {}
+        for line in self.storage.read_lines(output_name):
+            record = json.loads(line)
+            record_id = record["recordId"]
+            try:
+                if "error" in record:
+                    raise ValueError(f"Batch inference failed: {record['error']}")
+                outputs[record_id] = validate(client.parse_batch_model_output(record["modelOutput"]))
+            except Exception as e:
+                outputs[record_id] = e
+
+        return outputs
+
+
+def _record_id(index: int) -> str:
+    return f"{index:011d}"
+
+
+def _chunk_record_id(index: int, chunk: int) -> str:
+    # Record ids are 11 characters, so chunked requests use 7 digits for the sample and 3 for the chunk.
+    if index >= 10 ** 7 or chunk >= 10 ** 3:
+        raise ValueError(
+            f"Cannot build a record id for chunk {chunk} of record {index}. Split the run into smaller ones."
+        )
+
+    return f"{index:07d}c{chunk:03d}"
+
+
+def _unwrap_output(outputs: Dict[str, Union[Any, Exception]], record_id: str, stage: str) -> Any:
+    output = outputs.get(record_id)
+    if output is None:
+        raise KeyError(f"No {stage} output for record {record_id}.")
+    if isinstance(output, Exception):
+        raise output
+
+    return output
+
+
+def _require_batch_client(client: Any) -> BatchModelClientInterface:
+    if not isinstance(client, BatchModelClientInterface):
+        raise TypeError(
+            "Batch inference requires a client implementing `build_batch_model_input` and "
+            f"`parse_batch_model_output`. Got: {type(client).__name__}"
+        )
+
+    return client
@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+import posixpath
+from typing import Any, Callable, Dict, Iterable, Iterator, Union
+
+from myllmet.batch_inference.interface import BatchJobRunnerInterface, BatchStorageInterface
+
+logger = logging.getLogger(__name__)
+
+
+class LocalBatchStorage(BatchStorageInterface):
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self.directory = os.fspath(directory)
+
+    def write_lines(self, name: str, lines: Iterable[str]) -> None:
+        path = self.uri(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first so that readers never see a partial file.
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+        os.replace(tmp_path, path)
+
+    def read_lines(self, name: str) -> Iterator[str]:
+        with open(self.uri(name), encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line:
+                    yield line
+
+    def uri(self, name: str) -> str:
+        return os.path.join(self.directory, *name.split("/"))
+
+
+class LocalBatchJobRunner(BatchJobRunnerInterface):
+    def __init__(
+        self,
+        storage: BatchStorageInterface,
+        handler: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    ):
+        # `handler(model_id, model_input)` returns the model output for one record, e.g. by
+        # calling the Converse API directly or by returning canned responses in tests.
+        self.storage = storage
+        self.handler = handler
+
+    def run(self, job_name: str, model_id: str, input_name: str, output_prefix: str) -> str:
+        output_name = posixpath.join(output_prefix, f"{posixpath.basename(input_name)}.out")
+        logger.debug("Running local batch job %s: %s -> %s", job_name, input_name, output_name)
+
+        def outputs() -> Iterator[str]:
+            for line in self.storage.read_lines(input_name):
+                record = json.loads(line)
+                try:
+                    record["modelOutput"] = self.handler(model_id, record["modelInput"])
+                except Exception as e:
+                    record["error"] = {"errorMessage": repr(e)}
+                yield json.dumps(record, ensure_ascii=False)
+
+        self.storage.write_lines(output_name, outputs())
+        return output_name
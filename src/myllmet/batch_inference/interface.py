@@ -0,0 +1,33 @@
+from typing import Any, Dict, Iterable, Iterator, List, Protocol, runtime_checkable
+
+from myllmet.metrics.interface import IS, OS, FewshotExample, JSONSchema
+
+
+@runtime_checkable
+class BatchStorageInterface(Protocol):
+    def write_lines(self, name: str, lines: Iterable[str]) -> None: ...
+
+    def read_lines(self, name: str) -> Iterator[str]: ...
+
+    def uri(self, name: str) -> str: ...
+
+
+@runtime_checkable
+class BatchJobRunnerInterface(Protocol):
+    # Runs a batch job over the JSONL file `input_name` and returns the name of its output file.
+    def run(self, job_name: str, model_id: str, input_name: str, output_prefix: str) -> str: ...
+
+
+@runtime_checkable
+class BatchModelClientInterface(Protocol[IS, OS]):
+    model_id: str
+
+    def build_batch_model_input(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+    ) -> Dict[str, Any]: ...
+
+    def parse_batch_model_output(self, model_output: Dict[str, Any]) -> OS: ...
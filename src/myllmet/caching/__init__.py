@@ -0,0 +1,9 @@
+from ._cached_client import CachedLLMClient
+from ._memory_store import MemoryCacheStore
+from ._sqlite_store import SQLiteCacheStore
+
+__all__ = [
+    "CachedLLMClient",
+    "MemoryCacheStore",
+    "SQLiteCacheStore",
+]
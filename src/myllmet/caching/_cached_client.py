@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Generic, List, Optional, Union
+
+from myllmet.metrics.components.schema_validator import validate as validate_schema
+from myllmet.metrics.interface import (
+    IS,
+    OS,
+    AsyncLLMClientInterface,
+    CacheStoreInterface,
+    Deadline,
+    FewshotExample,
+    JSONSchema,
+    LLMClientInterface,
+    deadline_kwargs,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLMClient(LLMClientInterface[IS, OS], Generic[IS, OS]):
+    def __init__(
+        self,
+        client: Union[LLMClientInterface[IS, OS], AsyncLLMClientInterface[IS, OS]],
+        store: CacheStoreInterface,
+        validate: Optional[Callable[[IS, OS], None]] = None,
+    ):
+        self.client = client
+        self.store = store
+        self.validate = validate
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def model_id(self) -> Optional[str]:
+        return getattr(self.client, "model_id", None)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def invoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS:
+
+        if not isinstance(self.client, LLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.invoke` requires a client implementing `invoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
+
+        key = self.cache_key(instruction, fewshot_examples, input_json, output_json_schema)
+        cached = self._lookup(key, input_json, output_json_schema)
+        if cached is not None:
+            return cached
+
+        result = self.client.invoke(
+            instruction=instruction,
+            fewshot_examples=fewshot_examples,
+            input_json=input_json,
+            output_json_schema=output_json_schema,
+            **deadline_kwargs(deadline)
+        )
+
+        # Only results the caller would accept are stored, so a bad response is requested
+        # again on the next run instead of failing the same way from the cache.
+        self._check(input_json, result, output_json_schema)
+        self.store.set(key, json.dumps(result, ensure_ascii=False))
+        return result
+
+    async def ainvoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS:
+
+        if not isinstance(self.client, AsyncLLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.ainvoke` requires a client implementing `ainvoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
+
+        key = self.cache_key(instruction, fewshot_examples, input_json, output_json_schema)
+        cached = self._lookup(key, input_json, output_json_schema)
+        if cached is not None:
+            return cached
+
+        result = await self.client.ainvoke(
+            instruction=instruction,
+            fewshot_examples=fewshot_examples,
+            input_json=input_json,
+            output_json_schema=output_json_schema,
+            **deadline_kwargs(deadline)
+        )
+
+        # Only results the caller would accept are stored, so a bad response is requested
+        # again on the next run instead of failing the same way from the cache.
+        self._check(input_json, result, output_json_schema)
+        self.store.set(key, json.dumps(result, ensure_ascii=False))
+        return result
+
+    def cache_key(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+    ) -> str:
+
+        # Prefer the exact request the wrapped client would send (e.g. `BedrockChatClient`),
+        # so that any change in prompt rendering invalidates the cache.
+        build_system_prompt = getattr(self.client, "_build_system_prompt", None)
+        build_messages = getattr(self.client, "_build_messages", None)
+
+        key_material: Dict[str, Any] = {
+            "model_id": self.model_id,
+            "inference_config": getattr(self.client, "inference_config", None),
+        }
+        if build_system_prompt is not None and build_messages is not None:
+            key_material["system"] = build_system_prompt(instruction, output_json_schema)
+            key_material["messages"] = build_messages(fewshot_examples, input_json)
+        else:
+            key_material["client"] = type(self.client).__qualname__
+            key_material["instruction"] = instruction
+            key_material["output_json_schema"] = output_json_schema
+            key_material["fewshot_examples"] = fewshot_examples
+            key_material["input_json"] = input_json
+
+        serialized = json.dumps(key_material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _check(self, input_json: IS, result: OS, output_json_schema: JSONSchema) -> None:
+        validate_schema(result, output_json_schema)
+        if self.validate is not None:
+            self.validate(input_json, result)
+
+    def _lookup(self, key: str, input_json: IS, output_json_schema: JSONSchema) -> Optional[OS]:
+        cached = self.store.get(key)
+        result: Optional[OS] = None
+        if cached is not None:
+            result = json.loads(cached)
+            try:
+                self._check(input_json, result, output_json_schema)
+            except Exception as e:
+                # Entries written before validation was added (or with a looser validator) are
+                # requested again and overwritten.
+                logger.debug("Ignoring cached result that fails validation: %s: %r", key, e)
+                result = None
+
+        with self._lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if result is None:
+            logger.debug("Cache miss: %s", key)
+            return None
+
+        logger.debug("Cache hit: %s", key)
+        return result
@@ -0,0 +1,32 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from myllmet.metrics.interface import CacheStoreInterface
+
+
+class MemoryCacheStore(CacheStoreInterface):
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,149 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Union
+
+from myllmet.metrics.interface import CacheStoreInterface
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at);
+"""
+
+
+class SQLiteCacheStore(CacheStoreInterface):
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        evict_every: int = 100,
+        busy_timeout: float = 30.0,
+    ):
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.evict_every = evict_every
+        self.busy_timeout = busy_timeout
+
+        # sqlite3 connections must not be shared across threads, so each thread opens its own.
+        # Concurrent processes are coordinated by SQLite itself through WAL and busy timeouts.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+
+        self._connect().executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[str]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, created_at FROM cache_entries WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        value, created_at = row
+        now = time.time()
+        if self.max_age is not None and now - created_at > self.max_age:
+            with conn:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+
+        with conn:
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+
+        with self._lock:
+            self._writes_since_eviction += 1
+            should_evict = self._writes_since_eviction >= self.evict_every
+            if should_evict:
+                self._writes_since_eviction = 0
+
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        conn = self._connect()
+        removed = 0
+        with conn:
+            if self.max_age is not None:
+                removed += conn.execute(
+                    "DELETE FROM cache_entries WHERE created_at < ?",
+                    (time.time() - self.max_age,)
+                ).rowcount
+
+            if self.max_entries is not None:
+                removed += conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    " SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self.max_entries,)
+                ).rowcount
+
+            if self.max_bytes is not None:
+                # Keep the most recently accessed entries whose cumulative size fits the budget.
+                removed += conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    " SELECT key FROM ("
+                    "  SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS cumulative_size"
+                    "  FROM cache_entries"
+                    " ) WHERE cumulative_size > ?"
+                    ")",
+                    (self.max_bytes,)
+                ).rowcount
+
+        if removed:
+            logger.debug("Evicted %s cache entries from %s", removed, self.path)
+
+        return removed
+
+    def clear(self) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        return conn
@@ -0,0 +1,107 @@
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from myllmet.metrics import Faithfulness
+from myllmet.pipeline import ColumnMapping, ProgressReporter, evaluate_file
+from myllmet.pipeline._readers import SUPPORTED_FORMATS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="myllmet")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    eval_parser = subparsers.add_parser("eval", help="Score a dataset file with the Faithfulness metric.")
+    eval_parser.add_argument("input", help="Input dataset (.jsonl, .csv or .parquet).")
+    eval_parser.add_argument("-o", "--output", required=True, help="Output file (.jsonl or .csv).")
+    eval_parser.add_argument("--input-format", choices=SUPPORTED_FORMATS)
+    eval_parser.add_argument("--output-format", choices=("jsonl", "csv"))
+    eval_parser.add_argument("--model-id", required=True, help="Bedrock model ID for claim extraction.")
+    eval_parser.add_argument(
+        "--judge-model-id",
+        help="Bedrock model ID for the faithfulness judge. Defaults to --model-id."
+    )
+    eval_parser.add_argument("--region", help="AWS region of the Bedrock runtime endpoint.")
+    eval_parser.add_argument("--max-workers", type=int, default=8)
+    eval_parser.add_argument(
+        "--prewarm-connections",
+        type=int,
+        default=0,
+        help="Open this many Bedrock connections before scoring starts (needs bedrock:ListAsyncInvokes)."
+    )
+    eval_parser.add_argument("--timeout", type=float, help="Per-row timeout in seconds.")
+    eval_parser.add_argument("--question-column", default="question")
+    eval_parser.add_argument("--answer-column", default="answer")
+    eval_parser.add_argument("--context-column", default="context")
+    eval_parser.add_argument("--ground-truth-column", default="ground_truth")
+    eval_parser.add_argument("--id-column", help="Column with stable row IDs for checkpoints. Defaults to row index.")
+    eval_parser.add_argument(
+        "--checkpoint-dir",
+        help="Directory to record completed rows in. Re-running with the same directory resumes the run."
+    )
+    eval_parser.add_argument(
+        "--affinity-window",
+        type=int,
+        help="Score rows sharing a context back to back within windows of this many rows."
+    )
+    eval_parser.add_argument("--progress-interval", type=float, default=5.0, help="Seconds between progress lines.")
+    eval_parser.add_argument("-v", "--verbose", action="store_true")
+
+    return parser
+
+
+def build_metric(args: argparse.Namespace) -> Faithfulness:
+    from myllmet.io_aws import BedrockChatClient, get_runtime_client
+
+    # Both components share one pooled client. Each row has at most one call in flight.
+    runtime_client = get_runtime_client(
+        region_name=args.region,
+        max_pool_connections=max(args.max_workers, 10),
+        prewarm_connections=args.prewarm_connections
+    )
+    return Faithfulness.from_clients(
+        claim_extractor_client=BedrockChatClient(args.model_id, bedrock_runtime_client=runtime_client),
+        faithfulness_judge_client=BedrockChatClient(
+            args.judge_model_id or args.model_id,
+            bedrock_runtime_client=runtime_client
+        ),
+    )
+
+
+def run_eval(args: argparse.Namespace) -> int:
+    summary = evaluate_file(
+        build_metric(args),
+        args.input,
+        args.output,
+        input_format=args.input_format,
+        output_format=args.output_format,
+        max_workers=args.max_workers,
+        timeout=args.timeout,
+        columns=ColumnMapping(
+            question=args.question_column,
+            answer=args.answer_column,
+            context=args.context_column,
+            ground_truth=args.ground_truth_column,
+            id=args.id_column
+        ),
+        progress=ProgressReporter(interval=args.progress_interval),
+        checkpoint_dir=args.checkpoint_dir,
+        affinity_window=args.affinity_window,
+    )
+
+    sys.stderr.write(
+        f"Scored {summary.total} rows ({summary.failed} failed) in {summary.elapsed:.1f}s "
+        f"({summary.rows_per_second:.2f} rows/s). Results written to {args.output}\n"
+    )
+    return 1 if summary.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    if args.command == "eval":
+        return run_eval(args)
+
+    return 2
@@ -1,5 +1,35 @@
-from ._bedrock_chat import BedrockChatClient
+from typing import TYPE_CHECKING
+
+from myllmet._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._async_bedrock_chat import AsyncBedrockChatClient
+    from ._bedrock_batch import BedrockBatchJobRunner, S3BatchStorage
+    from ._bedrock_chat import BedrockChatClient
+    from ._client_pool import get_runtime_client, prewarm_client
+    from ._load_balancer import LoadBalancedChatClient
+    from ._rate_limiter import AdaptiveRateLimiter, get_rate_limiter
 
 __all__ = [
+    "AdaptiveRateLimiter",
+    "AsyncBedrockChatClient",
+    "BedrockBatchJobRunner",
     "BedrockChatClient",
+    "LoadBalancedChatClient",
+    "S3BatchStorage",
+    "get_rate_limiter",
+    "get_runtime_client",
+    "prewarm_client",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AdaptiveRateLimiter": "._rate_limiter",
+    "AsyncBedrockChatClient": "._async_bedrock_chat",
+    "BedrockBatchJobRunner": "._bedrock_batch",
+    "BedrockChatClient": "._bedrock_chat",
+    "LoadBalancedChatClient": "._load_balancer",
+    "S3BatchStorage": "._bedrock_batch",
+    "get_rate_limiter": "._rate_limiter",
+    "get_runtime_client": "._client_pool",
+    "prewarm_client": "._client_pool",
+})
@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+from myllmet.io_aws._bedrock_chat import _BedrockChatBase
+from myllmet.io_aws._client_pool import DEFAULT_MAX_POOL_CONNECTIONS, build_client_config
+from myllmet.io_aws._rate_limiter import AdaptiveRateLimiter
+from myllmet.metrics.interface import IS, OS, AsyncLLMClientInterface, Deadline, FewshotExample, JSONSchema
+
+logger = logging.getLogger(__name__)
+
+# Cancel message for calls still running when their attempt times out. They are reported to the
+# rate limiter as overload, unlike hedges cancelled because the other request won.
+_ATTEMPT_TIMED_OUT = "Converse attempt timed out."
+
+
+class AsyncBedrockChatClient(_BedrockChatBase[IS, OS], AsyncLLMClientInterface[IS, OS]):
+    def __init__(
+        self,
+        model_id: str,
+        max_attempts: int = 5,
+        max_wait: int = 60,
+        bedrock_runtime_client: Optional[Any] = None,
+        inference_config: Optional[Dict[str, Any]] = None,
+        prompt_caching: bool = False,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        call_timeout: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        cached_input_keys: Sequence[str] = ("context",),
+        region_name: Optional[str] = None,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ):
+        super().__init__(
+            model_id=model_id,
+            max_attempts=max_attempts,
+            max_wait=max_wait,
+            inference_config=inference_config,
+            prompt_caching=prompt_caching,
+            rate_limiter=rate_limiter,
+            call_timeout=call_timeout,
+            hedge_percentile=hedge_percentile,
+            hedge_min_samples=hedge_min_samples,
+            cached_input_keys=cached_input_keys
+        )
+
+        # An injected client is owned by the caller. Otherwise an aiobotocore client is
+        # created on first use and closed by `close()` / `async with`. Its pool is sized for the
+        # many calls a single event loop keeps in flight (aiobotocore's default is 10).
+        self._client = bedrock_runtime_client
+        self.region_name = region_name
+        self._client_config_kwargs: Dict[str, Any] = {
+            "max_pool_connections": max_pool_connections,
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+        }
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncBedrockChatClient[IS, OS]":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
+
+    async def ainvoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS:
+
+        system, messages = self._build_prompt(instruction, fewshot_examples, input_json, output_json_schema)
+
+        started_at = time.monotonic()
+        backoff_seconds = 0.0
+        for attempt in range(1, self.max_attempts + 1):
+            if deadline is not None:
+                deadline.check()
+            try:
+                result, response_metrics = await self._invoke_attempt(system, messages, deadline)
+            except ClientError as e:
+                wait_time = self._retry_wait_time(e, attempt, deadline)
+                backoff_seconds += wait_time
+                await asyncio.sleep(wait_time)
+            else:
+                break
+
+        self._report_call_metrics(response_metrics, attempt, backoff_seconds, started_at)
+        return result
+
+    async def _invoke_attempt(self, system, messages, deadline: Optional[Deadline]) -> Tuple[OS, Dict[str, Any]]:
+        timeout = self._attempt_timeout(deadline)
+        hedge_delay = self._hedge_delay()
+
+        if timeout is None and hedge_delay is None:
+            return await self._call_and_parse(system, messages)
+
+        started_at = time.monotonic()
+        attempt_deadline = None if timeout is None else Deadline(started_at + timeout)
+        sent = asyncio.Event()
+        primary = asyncio.ensure_future(self._call_and_parse(system, messages, attempt_deadline, sent))
+        pending: Set[asyncio.Future] = {primary}
+        hedge: Optional[asyncio.Future] = None
+        timed_out = False
+
+        try:
+            if hedge_delay is not None:
+                # The hedge delay counts from when the primary request is sent. Time queued in the
+                # rate limiter means capacity is exhausted, which a hedge would only make worse.
+                sent_waiter = asyncio.ensure_future(sent.wait())
+                try:
+                    await asyncio.wait(
+                        {primary, sent_waiter},
+                        timeout=self._remaining(timeout, started_at),
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    sent_waiter.cancel()
+                sent_at = time.monotonic()
+                if not primary.done() and sent.is_set() and (
+                    timeout is None or sent_at - started_at + hedge_delay < timeout
+                ):
+                    done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+                    if not done:
+                        logger.debug("No response after %.2f seconds. Sending a hedged request.", hedge_delay)
+                        hedge = asyncio.ensure_future(self._call_and_parse(system, messages, attempt_deadline))
+                        pending.add(hedge)
+                        self._count_hedge_stat("hedges_issued")
+                    else:
+                        pending = done
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._remaining(timeout, started_at),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self._count_hedge_stat("timeouts")
+                    timed_out = True
+                    raise TimeoutError(f"Converse call did not complete within {timeout:.2f} seconds.")
+
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        if future is hedge:
+                            self._count_hedge_stat("hedges_won")
+                        return future.result()
+
+            assert error is not None
+            raise error
+
+        finally:
+            for future in pending:
+                future.cancel(_ATTEMPT_TIMED_OUT if timed_out else None)
+
+    async def _call_and_parse(
+        self,
+        system,
+        messages,
+        deadline: Optional[Deadline] = None,
+        sent: Optional[asyncio.Event] = None,
+    ) -> Tuple[OS, Dict[str, Any]]:
+
+        response, latency = await self._call_converse_api_rate_limited(system, messages, deadline, sent)
+
+        return self._parse_result(response, latency)
+
+    async def _call_converse_api_rate_limited(
+        self,
+        system,
+        messages,
+        deadline: Optional[Deadline] = None,
+        sent: Optional[asyncio.Event] = None,
+    ) -> Tuple[Any, float]:
+
+        # Latency is measured from when the request is sent, so time queued in the rate limiter
+        # does not inflate the hedging percentile.
+        if self.rate_limiter is None:
+            if sent is not None:
+                sent.set()
+            started_at = time.monotonic()
+            return await self._call_converse_api(system, messages), time.monotonic() - started_at
+
+        estimated_tokens = self._estimate_tokens(system, messages)
+        await self.rate_limiter.aacquire(estimated_tokens, deadline)
+        if sent is not None:
+            sent.set()
+        started_at = time.monotonic()
+        try:
+            response = await self._call_converse_api(system, messages)
+        except asyncio.CancelledError as e:
+            self._release_rate_limit(estimated_tokens, error=e, timed_out=e.args == (_ATTEMPT_TIMED_OUT,))
+            raise
+        except BaseException as e:
+            self._release_rate_limit(estimated_tokens, error=e)
+            raise
+
+        self._release_rate_limit(estimated_tokens, response=response)
+        return response, time.monotonic() - started_at
+
+    async def _call_converse_api(self, system, messages, converse_kwargs=None):
+        logger.debug("Calling converse API with model ID: %s", self.model_id)
+
+        request = self._build_converse_request(system, messages, converse_kwargs)
+        logger.debug("Sending request: %s", request)
+
+        client = await self._get_client()
+        response = await client.converse(
+            modelId=self.model_id,
+            **request
+        )
+
+        logger.debug("Received response: %s", response)
+        return response
+
+    async def _get_client(self):
+        if self._client is not None:
+            return self._client
+
+        async with self._client_lock:
+            if self._client is None:
+                try:
+                    from aiobotocore.config import AioConfig  # type: ignore[import-not-found]
+                    from aiobotocore.session import get_session  # type: ignore[import-not-found]
+                except ImportError as e:
+                    raise ImportError(
+                        f"`aiobotocore` is required to use {self.__class__.__name__} without an explicit"
+                        " `bedrock_runtime_client`. Install it with `pip install myllmet[aio]`."
+                    ) from e
+
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    get_session().create_client(
+                        "bedrock-runtime",
+                        region_name=self.region_name,
+                        config=build_client_config(**self._client_config_kwargs, config_class=AioConfig)
+                    )
+                )
+                self._exit_stack = exit_stack
+
+        return self._client
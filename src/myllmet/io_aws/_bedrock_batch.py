@@ -0,0 +1,94 @@
+import logging
+import posixpath
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import boto3
+from botocore.client import BaseClient
+
+from myllmet.batch_inference.interface import BatchJobRunnerInterface, BatchStorageInterface
+
+logger = logging.getLogger(__name__)
+
+
+class S3BatchStorage(BatchStorageInterface):
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        s3_client: Optional[BaseClient] = None,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self._client: Any = s3_client or boto3.client("s3")
+
+    def write_lines(self, name: str, lines: Iterable[str]) -> None:
+        # Spool to a temporary file so that large inputs are uploaded as a multipart stream.
+        with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as f:
+            for line in lines:
+                f.write(line.encode("utf-8"))
+                f.write(b"\n")
+            f.seek(0)
+            self._client.upload_fileobj(f, self.bucket, self._key(name))
+
+    def read_lines(self, name: str) -> Iterator[str]:
+        response = self._client.get_object(Bucket=self.bucket, Key=self._key(name))
+        for line in response["Body"].iter_lines():
+            if line:
+                yield line.decode("utf-8")
+
+    def uri(self, name: str) -> str:
+        return f"s3://{self.bucket}/{self._key(name)}"
+
+    def _key(self, name: str) -> str:
+        return posixpath.join(self.prefix, name) if self.prefix else name
+
+
+class BedrockBatchJobRunner(BatchJobRunnerInterface):
+    def __init__(
+        self,
+        storage: S3BatchStorage,
+        role_arn: str,
+        bedrock_client: Optional[BaseClient] = None,
+        poll_interval: float = 60.0,
+        timeout_duration_in_hours: Optional[int] = None,
+    ):
+        self.storage = storage
+        self.role_arn = role_arn
+        self.poll_interval = poll_interval
+        self.timeout_duration_in_hours = timeout_duration_in_hours
+        self._client: Any = bedrock_client or boto3.client("bedrock")
+
+    def run(self, job_name: str, model_id: str, input_name: str, output_prefix: str) -> str:
+        request: Dict[str, Any] = {
+            "jobName": job_name,
+            "roleArn": self.role_arn,
+            "modelId": model_id,
+            "inputDataConfig": {
+                "s3InputDataConfig": {"s3Uri": self.storage.uri(input_name), "s3InputFormat": "JSONL"}
+            },
+            "outputDataConfig": {
+                "s3OutputDataConfig": {"s3Uri": self.storage.uri(output_prefix) + "/"}
+            },
+        }
+        if self.timeout_duration_in_hours is not None:
+            request["timeoutDurationInHours"] = self.timeout_duration_in_hours
+
+        job_arn = self._client.create_model_invocation_job(**request)["jobArn"]
+        logger.info("Submitted batch inference job %s (%s)", job_name, job_arn)
+
+        while True:
+            job = self._client.get_model_invocation_job(jobIdentifier=job_arn)
+            status = job["status"]
+            if status in ("Completed", "PartiallyCompleted"):
+                break
+            if status in ("Failed", "Stopped", "Expired"):
+                raise RuntimeError(f"Batch inference job {job_arn} ended with status {status}: {job.get('message')}")
+
+            logger.debug("Batch inference job %s is %s", job_arn, status)
+            time.sleep(self.poll_interval)
+
+        # Bedrock writes `<input file>.out` under a directory named after the job id.
+        job_id = job_arn.rsplit("/", 1)[-1]
+        return posixpath.join(output_prefix, job_id, f"{posixpath.basename(input_name)}.out")
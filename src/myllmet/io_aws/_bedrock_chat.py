@@ -1,70 +1,292 @@
 import json
 import logging
+import math
+import random
+import threading
 import time
-from typing import Generic, List, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Generic, List, Optional, Sequence, Set, Tuple
 
-import boto3
 from botocore.client import BaseClient
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 
-from myllmet.metrics.interface import IS, OS, FewshotExample, JSONSchema, LLMClientInterface
+from myllmet.io_aws._client_pool import get_runtime_client
+from myllmet.io_aws._rate_limiter import AdaptiveRateLimiter
+from myllmet.metrics._call_metrics import record_call_metrics
+from myllmet.metrics.interface import (
+    IS,
+    OS,
+    Deadline,
+    FewshotExample,
+    JSONSchema,
+    LLMClientInterface,
+    TruncatedResponseError,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class BedrockChatClient(LLMClientInterface, Generic[IS, OS]):
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+_PROMPT_PREFIX_CACHE_SIZE = 32
+
+# Rough upper bound used to reserve tokens-per-minute budget before a call; the
+# reservation is settled against the reported usage afterwards.
+_CHARS_PER_TOKEN_ESTIMATE = 2
+
+
+def _is_throttling(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] == "ThrottlingException"
+
+
+def _is_overload(error: BaseException) -> bool:
+    # Server errors, timeouts and dropped connections. Request errors (4xx) and cancellations
+    # say nothing about the backend's capacity.
+    if isinstance(error, ClientError):
+        return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500
+    return isinstance(error, (TimeoutError, BotoConnectionError, HTTPClientError))
+
+
+class _BedrockChatBase(Generic[IS, OS]):
     def __init__(
         self,
         model_id: str,
         max_attempts: int = 5,
         max_wait: int = 60,
-        bedrock_runtime_client: Optional[BaseClient] = None
+        inference_config: Optional[Dict[str, Any]] = None,
+        prompt_caching: bool = False,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        call_timeout: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        cached_input_keys: Sequence[str] = ("context",),
     ):
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            raise ValueError(f"`hedge_percentile` must be in (0, 100). Got: {hedge_percentile}")
+
         self.model_id = model_id
         self.max_attempts = max_attempts
         self.max_wait = max_wait
-        self._client = bedrock_runtime_client or boto3.client("bedrock-runtime")
+        self.inference_config = {"temperature": 0.0} if inference_config is None else inference_config
+        self.prompt_caching = prompt_caching
+        self.cached_input_keys = tuple(cached_input_keys)
+        self.rate_limiter = rate_limiter
+        self.call_timeout = call_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
 
-    def invoke(
+        self._latencies: Deque[float] = deque(maxlen=1000)
+        self._hedge_lock = threading.Lock()
+        self._hedge_stats = {
+            "hedges_issued": 0,
+            "hedges_won": 0,
+            "timeouts": 0,
+        }
+
+        self._prefix_cache: OrderedDict[Tuple[str, int, int], Tuple[Any, Any, List, List]] = OrderedDict()
+        self._usage_lock = threading.Lock()
+        self._usage_totals = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_write_input_tokens": 0,
+        }
+
+    @property
+    def usage_totals(self) -> Dict[str, int]:
+        with self._usage_lock:
+            return dict(self._usage_totals)
+
+    @property
+    def hedge_stats(self) -> Dict[str, int]:
+        with self._hedge_lock:
+            return dict(self._hedge_stats)
+
+    def build_batch_model_input(
         self,
         instruction: str,
         fewshot_examples: List[FewshotExample[IS, OS]],
         input_json: IS,
         output_json_schema: JSONSchema,
-    ) -> OS:
+    ) -> Dict[str, Any]:
 
-        system = [{"text": self._build_system_prompt(instruction, output_json_schema)}]
-        messages = self._build_messages(fewshot_examples, input_json)
+        # Batch inference records use the same request body as the Converse API. Override this
+        # and `parse_batch_model_output` for models that need their native InvokeModel format.
+        system, messages = self._build_prompt(instruction, fewshot_examples, input_json, output_json_schema)
+        return self._build_converse_request(system, messages)
 
-        for attempt in range(1, self.max_attempts + 1):
-            try:
-                response = self._call_converse_api(system, messages)
+    def parse_batch_model_output(self, model_output: Dict[str, Any]) -> OS:
+        self._record_usage(model_output)
+        llm_text = self._parse_response(model_output)
 
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                if error_code == "ThrottlingException":
-                    logger.debug("ThrottlingException occurred: %s", e)
-                else:
-                    raise
-
-                if attempt < self.max_attempts:
-                    wait_time = min(2 ** attempt, self.max_wait)
-                    logger.debug("Retrying in %s seconds...", wait_time)
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Max attempts reached (%s).", self.max_attempts)
-                    raise
-            else:
-                break
+        return json.loads(llm_text)
+
+    def _build_prompt(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+    ) -> Tuple[List[Dict[str, Any]], List]:
+
+        system, fewshot_messages = self._build_prompt_prefix(instruction, fewshot_examples, output_json_schema)
+        messages = fewshot_messages + [self._build_user_message(input_json)]
+
+        return system, messages
+
+    def _build_prompt_prefix(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        output_json_schema: JSONSchema,
+    ) -> Tuple[List[Dict[str, Any]], List]:
+
+        # Components pass the same few-shot list and schema objects on every call, so the
+        # serialized prefix is memoized by identity (the objects are kept alive in the entry
+        # so their ids cannot be reused).
+        key = (instruction, id(fewshot_examples), id(output_json_schema))
+        entry = self._prefix_cache.get(key)
+        if entry is not None and entry[0] is fewshot_examples and entry[1] is output_json_schema:
+            return entry[2], entry[3]
+
+        system: List[Dict[str, Any]] = [{"text": self._build_system_prompt(instruction, output_json_schema)}]
+        fewshot_messages = self._build_fewshot_messages(fewshot_examples)
+
+        if self.prompt_caching:
+            system.append(CACHE_POINT)
+            if fewshot_messages:
+                last = fewshot_messages[-1]
+                fewshot_messages[-1] = {**last, "content": last["content"] + [CACHE_POINT]}
+
+        self._prefix_cache[key] = (fewshot_examples, output_json_schema, system, fewshot_messages)
+        if len(self._prefix_cache) > _PROMPT_PREFIX_CACHE_SIZE:
+            self._prefix_cache.popitem(last=False)
+
+        return system, fewshot_messages
+
+    def _release_rate_limit(
+        self,
+        estimated_tokens: int,
+        response=None,
+        error: Optional[BaseException] = None,
+        timed_out: bool = False,
+    ) -> None:
 
+        assert self.rate_limiter is not None
+        usage = (response or {}).get("usage") or {}
+        actual_tokens = usage.get("inputTokens", 0) + usage.get("outputTokens", 0) if usage else None
+
+        throttled = isinstance(error, ClientError) and _is_throttling(error)
+        self.rate_limiter.release(
+            throttled=throttled,
+            estimated_tokens=estimated_tokens,
+            actual_tokens=actual_tokens,
+            failed=not throttled and (timed_out or (error is not None and _is_overload(error))),
+            succeeded=error is None
+        )
+
+    def _record_usage(self, response) -> None:
+        usage = response.get("usage") or {}
+        cache_read = usage.get("cacheReadInputTokens", 0)
+        cache_write = usage.get("cacheWriteInputTokens", 0)
+
+        if self.prompt_caching:
+            logger.debug("Prompt cache read tokens: %s, write tokens: %s", cache_read, cache_write)
+
+        with self._usage_lock:
+            self._usage_totals["input_tokens"] += usage.get("inputTokens", 0)
+            self._usage_totals["output_tokens"] += usage.get("outputTokens", 0)
+            self._usage_totals["cache_read_input_tokens"] += cache_read
+            self._usage_totals["cache_write_input_tokens"] += cache_write
+
+    def _retry_wait_time(self, error: ClientError, attempt: int, deadline: Optional[Deadline] = None) -> float:
+        if _is_throttling(error):
+            logger.debug("ThrottlingException occurred: %s", error)
+        else:
+            raise error
+
+        if attempt >= self.max_attempts:
+            logger.error("Max attempts reached (%s).", self.max_attempts)
+            raise error
+
+        # Full jitter keeps clients that were throttled together from retrying in lockstep.
+        wait_time = random.uniform(0, min(2 ** attempt, self.max_wait))
+        if deadline is not None and wait_time >= deadline.remaining():
+            raise TimeoutError("Deadline exceeded while backing off from throttling.") from error
+
+        logger.debug("Retrying in %.2f seconds...", wait_time)
+        return wait_time
+
+    def _attempt_timeout(self, deadline: Optional[Deadline]) -> Optional[float]:
+        if deadline is None:
+            return self.call_timeout
+        return deadline.timeout(self.call_timeout)
+
+    @staticmethod
+    def _remaining(timeout: Optional[float], started_at: float) -> Optional[float]:
+        return None if timeout is None else max(0.0, timeout - (time.monotonic() - started_at))
+
+    def _hedge_delay(self) -> Optional[float]:
+        if self.hedge_percentile is None:
+            return None
+
+        latencies = sorted(self._latencies)
+        if len(latencies) < self.hedge_min_samples:
+            return None
+
+        index = min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))
+        return latencies[index]
+
+    def _count_hedge_stat(self, name: str) -> None:
+        with self._hedge_lock:
+            self._hedge_stats[name] += 1
+
+    def _parse_result(self, response, latency: float) -> Tuple[OS, Dict[str, Any]]:
+        self._latencies.append(latency)
+        self._record_usage(response)
         llm_text = self._parse_response(response)
-        result = json.loads(llm_text)
 
-        return result
+        return json.loads(llm_text), self._response_metrics(response)
+
+    def _response_metrics(self, response) -> Dict[str, Any]:
+        usage = response.get("usage") or {}
+        return {
+            "input_tokens": usage.get("inputTokens", 0),
+            "output_tokens": usage.get("outputTokens", 0),
+            "cache_read_input_tokens": usage.get("cacheReadInputTokens", 0),
+            "cache_write_input_tokens": usage.get("cacheWriteInputTokens", 0),
+            "latency_ms": (response.get("metrics") or {}).get("latencyMs", 0),
+        }
+
+    def _report_call_metrics(
+        self,
+        response_metrics: Dict[str, Any],
+        attempts: int,
+        backoff_seconds: float,
+        started_at: float,
+    ) -> None:
+
+        record_call_metrics({
+            "model_id": self.model_id,
+            **response_metrics,
+            "duration_ms": (time.monotonic() - started_at) * 1000,
+            "attempts": attempts,
+            "backoff_seconds": backoff_seconds,
+        })
+
+    def _estimate_tokens(self, system, messages) -> int:
+        chars = sum(len(block.get("text", "")) for block in system)
+        chars += sum(len(block.get("text", "")) for message in messages for block in message["content"])
+
+        return int(chars // _CHARS_PER_TOKEN_ESTIMATE + self.inference_config.get("maxTokens", 0))
 
     def _parse_response(self, response) -> str:
         stop_reason = response["stopReason"]
 
+        if stop_reason == "max_tokens":
+            raise TruncatedResponseError("Response was truncated at the output token limit (stopReason: max_tokens).")
         if stop_reason != "end_turn":
             raise ValueError(f"Expected stopReason to be `end_turn`. Got: {stop_reason}")
 
@@ -80,22 +302,12 @@ class BedrockChatClient(LLMClientInterface, Generic[IS, OS]):
 
         return contents[0]["text"]
 
-    def _call_converse_api(self, system, messages, converse_kwargs=None):
-        logger.debug("Calling converse API with model ID: %s", self.model_id)
-
-        # TODO: Resolve temperature hardcoded value
+    def _build_converse_request(self, system, messages, converse_kwargs=None) -> Dict[str, Any]:
         request = {"system": system, "messages": messages} \
-            | {"inferenceConfig": {"temperature": 0.0}} \
+            | {"inferenceConfig": self.inference_config} \
             | (converse_kwargs or {})
-        logger.debug("Sending request: %s", request)
-
-        response = self._client.converse(
-            modelId=self.model_id,
-            **request
-        )
 
-        logger.debug("Received response: %s", response)
-        return response
+        return request
 
     def _build_messages(
         self,
@@ -103,6 +315,16 @@ class BedrockChatClient(LLMClientInterface, Generic[IS, OS]):
         input_json: IS,
     ) -> List:
 
+        messages = self._build_fewshot_messages(fewshot_examples)
+        messages.append(self._build_user_message(input_json))
+
+        return messages
+
+    def _build_fewshot_messages(
+        self,
+        fewshot_examples: List,
+    ) -> List:
+
         messages = []
         for ex in fewshot_examples:
             messages += [
@@ -119,15 +341,34 @@ class BedrockChatClient(LLMClientInterface, Generic[IS, OS]):
                     ]
                 }
             ]
-        messages.append({
-            "role": "user",
-            "content": [
-                {"text": json.dumps(input_json, ensure_ascii=False)}
-            ]
-        })
 
         return messages
 
+    def _build_user_message(
+        self,
+        input_json: IS,
+    ) -> Dict[str, Any]:
+
+        text = json.dumps(input_json, ensure_ascii=False)
+        if not self.prompt_caching or not isinstance(input_json, dict):
+            return {"role": "user", "content": [{"text": text}]}
+
+        keys = list(input_json)
+        n_cached = 0
+        while n_cached < len(keys) - 1 and keys[n_cached] in self.cached_input_keys:
+            n_cached += 1
+        if n_cached == 0:
+            return {"role": "user", "content": [{"text": text}]}
+
+        # Leading inputs that many requests share (e.g. the judge's context) get their own block
+        # followed by a cache point, so requests with the same context reuse the cached prefix.
+        # The blocks still concatenate to the same JSON text.
+        prefix = json.dumps({key: input_json[key] for key in keys[:n_cached]}, ensure_ascii=False)[:-1] + ", "
+        return {
+            "role": "user",
+            "content": [{"text": prefix}, CACHE_POINT, {"text": text[len(prefix):]}]
+        }
+
     def _build_system_prompt(
         self,
         instruction: str,
@@ -144,3 +385,248 @@ class BedrockChatClient(LLMClientInterface, Generic[IS, OS]):
         )
 
         return system
+
+
+class BedrockChatClient(_BedrockChatBase[IS, OS], LLMClientInterface[IS, OS]):
+    def __init__(
+        self,
+        model_id: str,
+        max_attempts: int = 5,
+        max_wait: int = 60,
+        bedrock_runtime_client: Optional[BaseClient] = None,
+        inference_config: Optional[Dict[str, Any]] = None,
+        prompt_caching: bool = False,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        call_timeout: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        executor_max_workers: int = 64,
+        region_name: Optional[str] = None,
+        max_pool_connections: Optional[int] = None,
+        cached_input_keys: Sequence[str] = ("context",),
+    ):
+        super().__init__(
+            model_id=model_id,
+            max_attempts=max_attempts,
+            max_wait=max_wait,
+            inference_config=inference_config,
+            prompt_caching=prompt_caching,
+            rate_limiter=rate_limiter,
+            call_timeout=call_timeout,
+            hedge_percentile=hedge_percentile,
+            hedge_min_samples=hedge_min_samples,
+            cached_input_keys=cached_input_keys
+        )
+        # Without an injected client, a pooled runtime client is shared with other instances
+        # that use the same region and pool size. Its read timeout follows `call_timeout`, so
+        # calls abandoned after the timeout also end instead of holding a worker and connection.
+        self._client = bedrock_runtime_client or get_runtime_client(
+            region_name=region_name,
+            max_pool_connections=executor_max_workers if max_pool_connections is None else max_pool_connections,
+            read_timeout=call_timeout
+        )
+
+        # Calls only go through a thread pool when they need a timeout or hedging.
+        self.executor_max_workers = executor_max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._calls_lock = threading.Lock()
+        self._in_flight_calls = 0
+        self._abandoned_calls: Set[Future] = set()
+
+    @property
+    def abandoned_calls(self) -> int:
+        with self._calls_lock:
+            return len(self._abandoned_calls)
+
+    def invoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS:
+
+        system, messages = self._build_prompt(instruction, fewshot_examples, input_json, output_json_schema)
+
+        started_at = time.monotonic()
+        backoff_seconds = 0.0
+        for attempt in range(1, self.max_attempts + 1):
+            if deadline is not None:
+                deadline.check()
+            try:
+                result, response_metrics = self._invoke_attempt(system, messages, deadline)
+            except ClientError as e:
+                wait_time = self._retry_wait_time(e, attempt, deadline)
+                backoff_seconds += wait_time
+                time.sleep(wait_time)
+            else:
+                break
+
+        self._report_call_metrics(response_metrics, attempt, backoff_seconds, started_at)
+        return result
+
+    def _invoke_attempt(self, system, messages, deadline: Optional[Deadline]) -> Tuple[OS, Dict[str, Any]]:
+        timeout = self._attempt_timeout(deadline)
+        hedge_delay = self._hedge_delay()
+
+        if timeout is None and hedge_delay is None:
+            return self._call_and_parse(system, messages)
+
+        executor = self._get_executor()
+        started_at = time.monotonic()
+        # Calls still waiting for the rate limiter when the attempt ends give up instead of
+        # sending requests nobody waits for.
+        attempt_deadline = Deadline(math.inf if timeout is None else started_at + timeout)
+        sent = threading.Event()
+        primary = self._submit_call(executor, system, messages, attempt_deadline, sent)
+        pending: Set[Future] = {primary}
+        hedge: Optional[Future] = None
+
+        try:
+            if hedge_delay is not None:
+                # The hedge delay counts from when the primary request is sent. Time queued in the
+                # rate limiter means capacity is exhausted, which a hedge would only make worse.
+                primary.add_done_callback(lambda _: sent.set())
+                sent.wait(timeout=self._remaining(timeout, started_at))
+                sent_at = time.monotonic()
+                if not primary.done() and sent.is_set() and (
+                    timeout is None or sent_at - started_at + hedge_delay < timeout
+                ):
+                    done, pending = wait(pending, timeout=hedge_delay)
+                    if not done:
+                        logger.debug("No response after %.2f seconds. Sending a hedged request.", hedge_delay)
+                        hedge = self._submit_call(executor, system, messages, attempt_deadline)
+                        pending.add(hedge)
+                        self._count_hedge_stat("hedges_issued")
+                    else:
+                        pending = done
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = wait(pending, timeout=self._remaining(timeout, started_at), return_when=FIRST_COMPLETED)
+                if not done:
+                    self._count_hedge_stat("timeouts")
+                    raise TimeoutError(f"Converse call did not complete within {timeout:.2f} seconds.")
+
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        if future is hedge:
+                            self._count_hedge_stat("hedges_won")
+                        return future.result()
+
+            assert error is not None
+            raise error
+
+        finally:
+            # Abandoned calls finish in the background; their results are discarded.
+            self._abandon_calls(pending, attempt_deadline)
+
+    def _call_and_parse(
+        self,
+        system,
+        messages,
+        deadline: Optional[Deadline] = None,
+        sent: Optional[threading.Event] = None,
+    ) -> Tuple[OS, Dict[str, Any]]:
+
+        response, latency = self._call_converse_api_rate_limited(system, messages, deadline, sent)
+
+        return self._parse_result(response, latency)
+
+    def _submit_call(
+        self,
+        executor: ThreadPoolExecutor,
+        system,
+        messages,
+        deadline: Deadline,
+        sent: Optional[threading.Event] = None,
+    ) -> Future:
+
+        with self._calls_lock:
+            # A new call would only queue behind calls that nobody waits for anymore and time
+            # out without being sent, so fail fast while the workers are held by hung calls.
+            if self._in_flight_calls >= self.executor_max_workers and self._abandoned_calls:
+                logger.warning(
+                    "All %s call workers are busy, %s of them with abandoned calls that have not returned.",
+                    self.executor_max_workers,
+                    len(self._abandoned_calls)
+                )
+                raise TimeoutError("Call workers are saturated by abandoned Converse calls.")
+            self._in_flight_calls += 1
+
+        future = executor.submit(self._call_and_parse, system, messages, deadline, sent)
+        future.add_done_callback(self._on_call_done)
+        return future
+
+    def _on_call_done(self, future: Future) -> None:
+        with self._calls_lock:
+            self._in_flight_calls -= 1
+            self._abandoned_calls.discard(future)
+
+    def _abandon_calls(self, futures: Set[Future], deadline: Deadline) -> None:
+        with self._calls_lock:
+            self._abandoned_calls.update(future for future in futures if not future.done())
+        if futures:
+            deadline.expire()
+            if self.rate_limiter is not None:
+                self.rate_limiter.wake_waiters()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.executor_max_workers,
+                        thread_name_prefix=f"{self.__class__.__name__}-call"
+                    )
+
+        return self._executor
+
+    def _call_converse_api_rate_limited(
+        self,
+        system,
+        messages,
+        deadline: Optional[Deadline] = None,
+        sent: Optional[threading.Event] = None,
+    ) -> Tuple[Any, float]:
+
+        # Latency is measured from when the request is sent, so time queued in the rate limiter
+        # does not inflate the hedging percentile.
+        if self.rate_limiter is None:
+            if deadline is not None:
+                deadline.check()
+            if sent is not None:
+                sent.set()
+            started_at = time.monotonic()
+            return self._call_converse_api(system, messages), time.monotonic() - started_at
+
+        estimated_tokens = self._estimate_tokens(system, messages)
+        self.rate_limiter.acquire(estimated_tokens, deadline)
+        if sent is not None:
+            sent.set()
+        started_at = time.monotonic()
+        try:
+            response = self._call_converse_api(system, messages)
+        except BaseException as e:
+            self._release_rate_limit(estimated_tokens, error=e)
+            raise
+
+        self._release_rate_limit(estimated_tokens, response=response)
+        return response, time.monotonic() - started_at
+
+    def _call_converse_api(self, system, messages, converse_kwargs=None):
+        logger.debug("Calling converse API with model ID: %s", self.model_id)
+
+        request = self._build_converse_request(system, messages, converse_kwargs)
+        logger.debug("Sending request: %s", request)
+
+        response = self._client.converse(
+            modelId=self.model_id,
+            **request
+        )
+
+        logger.debug("Received response: %s", response)
+        return response
@@ -0,0 +1,132 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple, Type
+
+import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger(__name__)
+
+
+# botocore's default pool keeps 10 connections; concurrent calls beyond that wait for a free
+# connection or open throwaway ones, so shared clients are sized to the caller's concurrency.
+DEFAULT_MAX_POOL_CONNECTIONS = 64
+
+def build_client_config(
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    tcp_keepalive: bool = True,
+    total_max_attempts: int = 1,
+    config_class: Type[Config] = Config,
+) -> Config:
+
+    if max_pool_connections < 1:
+        raise ValueError(f"`max_pool_connections` must be >= 1. Got: {max_pool_connections}")
+    if total_max_attempts < 1:
+        raise ValueError(f"`total_max_attempts` must be >= 1. Got: {total_max_attempts}")
+
+    # Timeouts are only set when given, so botocore's defaults (60 seconds each) apply otherwise.
+    timeouts: Dict[str, Any] = {
+        name: value
+        for name, value in (("connect_timeout", connect_timeout), ("read_timeout", read_timeout))
+        if value is not None
+    }
+    # Chat clients retry throttles themselves (with jitter and rate limiting), so botocore's own
+    # retries are off by default. Otherwise its legacy mode retries every call up to 4 more times
+    # before the client or rate limiter sees the error.
+    return config_class(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=tcp_keepalive,
+        retries={"total_max_attempts": total_max_attempts, "mode": "standard"},
+        **timeouts
+    )
+
+
+_clients: Dict[Tuple[Any, ...], Tuple[Optional[boto3.Session], BaseClient]] = {}
+_clients_lock = threading.Lock()
+
+
+def get_runtime_client(
+    region_name: Optional[str] = None,
+    profile_name: Optional[str] = None,
+    session: Optional[boto3.Session] = None,
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    tcp_keepalive: bool = True,
+    prewarm_connections: int = 0,
+    total_max_attempts: int = 1,
+) -> BaseClient:
+
+    # Clients are thread-safe once created, so one client (and its connection pool) is shared
+    # per region, credentials and config instead of one per BedrockChatClient.
+    key = (
+        region_name,
+        profile_name,
+        None if session is None else id(session),
+        max_pool_connections,
+        connect_timeout,
+        read_timeout,
+        tcp_keepalive,
+        total_max_attempts,
+    )
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is not None:
+            return entry[1]
+
+        config = build_client_config(
+            max_pool_connections,
+            connect_timeout,
+            read_timeout,
+            tcp_keepalive,
+            total_max_attempts
+        )
+        # Sessions are not thread-safe, so clients are created under the registry lock.
+        if session is None and profile_name is None:
+            client = boto3.client("bedrock-runtime", region_name=region_name, config=config)
+        else:
+            client = (session or boto3.Session(profile_name=profile_name)).client(
+                "bedrock-runtime",
+                region_name=region_name,
+                config=config
+            )
+        # An explicit session is kept alive in the entry so its id cannot be reused.
+        _clients[key] = (session, client)
+
+    if prewarm_connections > 0:
+        prewarm_client(client, min(prewarm_connections, max_pool_connections))
+
+    return client
+
+
+def prewarm_client(client: Any, connections: int) -> int:
+    # botocore has no API to open pooled connections, so concurrent read-only ListAsyncInvokes
+    # calls are sent to the runtime endpoint instead. Each one completes the TCP and TLS
+    # handshakes and returns its connection to the pool. The call needs the
+    # `bedrock:ListAsyncInvokes` permission; without it the connection is still opened, but
+    # the denied call is logged by AWS, so leave prewarming off in that case and let the pool
+    # warm up lazily on the first requests.
+    def open_connection(_: int) -> bool:
+        try:
+            client.list_async_invokes(maxResults=1)
+        except ClientError as e:
+            logger.debug("Prewarm request was rejected: %s", e)
+            return True
+        except BotoCoreError as e:
+            logger.warning("Failed to prewarm a Bedrock runtime connection: %s", e)
+            return False
+        return True
+
+    if connections < 1:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        opened = sum(executor.map(open_connection, range(connections)))
+
+    logger.debug("Prewarmed %s of %s Bedrock runtime connections.", opened, connections)
+    return opened
@@ -0,0 +1,258 @@
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+
+from myllmet.io_aws._bedrock_chat import BedrockChatClient, _is_throttling
+from myllmet.metrics.interface import IS, OS, Deadline, FewshotExample, JSONSchema, LLMClientInterface, deadline_kwargs
+
+logger = logging.getLogger(__name__)
+
+
+RoutingPolicy = Literal["least_outstanding", "weighted"]
+
+_BACKEND_ERROR_CODES = frozenset({
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "InternalServerException",
+})
+
+
+def _is_backend_error(error: BaseException, deadline: Optional[Deadline]) -> bool:
+    # Only errors that say something about the backend (quota, availability, connectivity) fail
+    # over to another backend. Request errors (e.g. a ValidationException for a too long input)
+    # would fail the same way on every backend, so they are raised to the caller as is.
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return code in _BACKEND_ERROR_CODES or status >= 500
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, TimeoutError):
+        # A per-call timeout is the backend's fault; the caller's own deadline running out is not.
+        return deadline is None or not deadline.expired
+
+    return False
+
+
+class _Backend:
+    __slots__ = (
+        "name", "client", "weight", "outstanding", "requests", "successes", "failures", "throttles",
+        "ejections", "consecutive_failures", "consecutive_ejections", "ejected_until", "latency_ewma",
+    )
+
+    def __init__(self, name: str, client: LLMClientInterface, weight: float):
+        self.name = name
+        self.client = client
+        self.weight = weight
+        self.outstanding = 0
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.throttles = 0
+        self.ejections = 0
+        self.consecutive_failures = 0
+        self.consecutive_ejections = 0
+        self.ejected_until = 0.0
+        self.latency_ewma: Optional[float] = None
+
+
+class LoadBalancedChatClient(LLMClientInterface[IS, OS]):
+    def __init__(
+        self,
+        backends: Sequence[LLMClientInterface[IS, OS]],
+        weights: Optional[Sequence[float]] = None,
+        names: Optional[Sequence[str]] = None,
+        routing: RoutingPolicy = "least_outstanding",
+        max_attempts: Optional[int] = None,
+        failure_threshold: int = 3,
+        ejection_seconds: float = 5.0,
+        max_ejection_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not backends:
+            raise ValueError("At least one backend is required.")
+        if routing not in ("least_outstanding", "weighted"):
+            raise ValueError(f"Unknown routing policy: {routing}. Expected one of: least_outstanding, weighted")
+        weights = [1.0] * len(backends) if weights is None else list(weights)
+        names = [_backend_name(client, i) for i, client in enumerate(backends)] if names is None else list(names)
+        if len(weights) != len(backends) or len(names) != len(backends):
+            raise ValueError("`weights` and `names` must have one entry per backend.")
+        if any(w <= 0 for w in weights):
+            raise ValueError(f"`weights` must be positive. Got: {weights}")
+
+        self.routing = routing
+        self.max_attempts = 2 * len(backends) if max_attempts is None else max_attempts
+        self.failure_threshold = failure_threshold
+        self.ejection_seconds = ejection_seconds
+        self.max_ejection_seconds = max_ejection_seconds
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._backends = [_Backend(name, client, weight) for name, client, weight in zip(names, backends, weights)]
+
+    @classmethod
+    def from_regions(
+        cls,
+        targets: Sequence[Tuple[str, str]],
+        weights: Optional[Sequence[float]] = None,
+        routing: RoutingPolicy = "least_outstanding",
+        **client_kwargs: Any,
+    ) -> "LoadBalancedChatClient[IS, OS]":
+
+        # Backends fail fast on throttling so the balancer can move the request to another
+        # backend instead of backing off on the throttled one.
+        client_kwargs.setdefault("max_attempts", 1)
+        return cls(
+            backends=[
+                BedrockChatClient(model_id, region_name=region, **client_kwargs)
+                for region, model_id in targets
+            ],
+            weights=weights,
+            names=[f"{region}/{model_id}" for region, model_id in targets],
+            routing=routing
+        )
+
+    @property
+    def model_id(self) -> str:
+        # Verdict caches and checkpoints key results by model, so all backend models are included.
+        return "|".join(sorted({str(getattr(b.client, "model_id", b.name)) for b in self._backends}))
+
+    @property
+    def health(self) -> List[Dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            return [
+                {
+                    "name": b.name,
+                    "weight": b.weight,
+                    "available": b.ejected_until <= now,
+                    "ejected_for_seconds": max(0.0, b.ejected_until - now),
+                    "outstanding": b.outstanding,
+                    "requests": b.requests,
+                    "successes": b.successes,
+                    "failures": b.failures,
+                    "throttles": b.throttles,
+                    "ejections": b.ejections,
+                    "latency_ewma_seconds": b.latency_ewma,
+                }
+                for b in self._backends
+            ]
+
+    def invoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS:
+
+        error: Optional[BaseException] = None
+        for _ in range(self.max_attempts):
+            if deadline is not None:
+                deadline.check()
+            backend = self._acquire(deadline)
+            started_at = self._clock()
+            try:
+                result = backend.client.invoke(
+                    instruction=instruction,
+                    fewshot_examples=fewshot_examples,
+                    input_json=input_json,
+                    output_json_schema=output_json_schema,
+                    **deadline_kwargs(deadline)
+                )
+            except BaseException as e:
+                if not _is_backend_error(e, deadline):
+                    self._release(backend, started_at, None, counted=False)
+                    raise
+                self._release(backend, started_at, e)
+                logger.debug("Backend %s failed: %r. Trying another backend.", backend.name, e)
+                error = e
+                continue
+
+            self._release(backend, started_at, None)
+            return result
+
+        assert error is not None
+        raise error
+
+    def _acquire(self, deadline: Optional[Deadline]) -> _Backend:
+        with self._lock:
+            now = self._clock()
+            available = [b for b in self._backends if b.ejected_until <= now]
+            if not available:
+                # Every backend is ejected. Wait for the first one to come back instead of
+                # sending more requests to backends that are known to be failing.
+                backend = min(self._backends, key=lambda b: b.ejected_until)
+                wait_time = backend.ejected_until - now
+                if deadline is not None and wait_time >= deadline.remaining():
+                    raise TimeoutError("Deadline exceeded while all backends are ejected.")
+            else:
+                backend = self._choose(available)
+                wait_time = 0.0
+            backend.outstanding += 1
+            backend.requests += 1
+
+        if wait_time > 0:
+            self._sleep(wait_time)
+
+        return backend
+
+    def _choose(self, available: List[_Backend]) -> _Backend:
+        if self.routing == "weighted":
+            return random.choices(available, weights=[b.weight for b in available])[0]
+
+        # Ties go to the backend that has served fewer requests, so idle backends share load evenly.
+        return min(available, key=lambda b: (b.outstanding / b.weight, b.requests / b.weight))
+
+    def _release(
+        self,
+        backend: _Backend,
+        started_at: float,
+        error: Optional[BaseException],
+        counted: bool = True,
+    ) -> None:
+
+        now = self._clock()
+        with self._lock:
+            backend.outstanding -= 1
+            if not counted:
+                return
+            if error is None:
+                elapsed = now - started_at
+                backend.latency_ewma = elapsed if backend.latency_ewma is None else (
+                    0.8 * backend.latency_ewma + 0.2 * elapsed
+                )
+                backend.successes += 1
+                backend.consecutive_failures = 0
+                backend.consecutive_ejections = 0
+                return
+
+            backend.failures += 1
+            backend.consecutive_failures += 1
+            throttled = isinstance(error, ClientError) and _is_throttling(error)
+            if throttled:
+                backend.throttles += 1
+
+            # A throttled backend is ejected at once since retrying it only adds to the throttling.
+            # Other errors eject it after `failure_threshold` failures in a row.
+            if throttled or backend.consecutive_failures >= self.failure_threshold:
+                ejection = min(self.ejection_seconds * 2 ** backend.consecutive_ejections, self.max_ejection_seconds)
+                backend.ejected_until = now + ejection
+                backend.ejections += 1
+                backend.consecutive_ejections += 1
+                backend.consecutive_failures = 0
+                logger.warning("Ejecting backend %s for %.1f seconds after %r.", backend.name, ejection, error)
+
+
+def _backend_name(client: Any, index: int) -> str:
+    model_id = getattr(client, "model_id", None)
+    return f"{index}:{model_id}" if model_id is not None else str(index)
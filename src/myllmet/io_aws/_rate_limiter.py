@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from myllmet.metrics.interface import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float, burst_seconds: float, now: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        # Requests larger than the bucket are admitted once it is full, leaving it in debt,
+        # instead of waiting forever.
+        needed = min(amount, self.capacity) - self.tokens
+        return 0.0 if needed <= 0 else needed / self.rate
+
+
+class AdaptiveRateLimiter:
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+        burst_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"`decrease_factor` must be in (0, 1). Got: {decrease_factor}")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Expected 1 <= min_concurrency <= max_concurrency. Got: {min_concurrency}, {max_concurrency}"
+            )
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._clock = clock
+        now = clock()
+        self._request_bucket = None if requests_per_minute is None else _TokenBucket(
+            requests_per_minute, burst_seconds, now
+        )
+        self._token_bucket = None if tokens_per_minute is None else _TokenBucket(
+            tokens_per_minute, burst_seconds, now
+        )
+
+        self._condition = threading.Condition()
+        # Coroutines cannot wait on the condition without blocking their loop, so each waiting
+        # coroutine registers an event that `release` sets on the coroutine's own loop.
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._concurrency = float(initial_concurrency or max_concurrency)
+        self._in_flight = 0
+        self._last_decrease_at = -math.inf
+
+        self._throttle_count = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self.min_concurrency, int(self._concurrency))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def throttle_count(self) -> int:
+        return self._throttle_count
+
+    def acquire(self, estimated_tokens: int = 0, deadline: Optional[Deadline] = None) -> None:
+        with self._condition:
+            while True:
+                wait_time = self._try_acquire_locked(estimated_tokens, deadline)
+                if wait_time is None:
+                    return
+                self._condition.wait(timeout=_wait_timeout(wait_time, deadline))
+
+    async def aacquire(self, estimated_tokens: int = 0, deadline: Optional[Deadline] = None) -> None:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        try:
+            while True:
+                with self._condition:
+                    wait_time = self._try_acquire_locked(estimated_tokens, deadline)
+                    if wait_time is None:
+                        return
+                    waiter[1].clear()
+                    self._async_waiters.add(waiter)
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout=_wait_timeout(wait_time, deadline))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+
+    def wake_waiters(self) -> None:
+        # Lets waiters re-check their deadlines, e.g. after their caller gave up on them.
+        with self._condition:
+            self._wake_locked()
+
+    def release(
+        self,
+        throttled: bool = False,
+        estimated_tokens: int = 0,
+        actual_tokens: Optional[int] = None,
+        failed: bool = False,
+        succeeded: bool = True,
+    ) -> None:
+
+        with self._condition:
+            self._in_flight -= 1
+
+            if self._token_bucket is not None and actual_tokens is not None:
+                # Settle the reservation against the usage reported by the service.
+                self._token_bucket.tokens += estimated_tokens - actual_tokens
+
+            if throttled:
+                self._throttle_count += 1
+                self._decrease()
+            elif failed:
+                # Timeouts and dropped connections are as much a sign of overload as throttles.
+                self._decrease()
+            elif succeeded:
+                # Additive increase: roughly +1 to the limit per window of successful calls.
+                self._concurrency = min(
+                    float(self.max_concurrency),
+                    self._concurrency + 1.0 / max(self._concurrency, 1.0)
+                )
+            # Anything else (request errors, cancelled hedges) says nothing about capacity, so
+            # the slot is released without changing the limit.
+
+            self._wake_locked()
+
+    def _wake_locked(self) -> None:
+        self._condition.notify_all()
+        for loop, event in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop is closed, so nothing is waiting on it anymore.
+                pass
+        self._async_waiters.clear()
+
+    def _decrease(self) -> None:
+        # Throttles from calls already in flight reflect the old limit, so decrease at most
+        # once per cooldown instead of collapsing the limit on a single burst.
+        now = self._clock()
+        if now - self._last_decrease_at < self.decrease_cooldown:
+            return
+
+        self._last_decrease_at = now
+        self._concurrency = max(float(self.min_concurrency), self._concurrency * self.decrease_factor)
+        logger.debug("Throttled or failed. Reduced concurrency limit to %s", self.concurrency_limit)
+
+    def _try_acquire_locked(self, estimated_tokens: int, deadline: Optional[Deadline] = None) -> Optional[float]:
+        if deadline is not None and deadline.expired:
+            raise TimeoutError("Deadline exceeded while waiting for the rate limiter.")
+
+        now = self._clock()
+        wait_time = 0.0
+        for bucket, amount in ((self._request_bucket, 1), (self._token_bucket, estimated_tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                wait_time = max(wait_time, bucket.wait_time(amount))
+
+        if wait_time > 0 or self._in_flight >= self.concurrency_limit:
+            return wait_time
+
+        if self._request_bucket is not None:
+            self._request_bucket.tokens -= 1
+        if self._token_bucket is not None:
+            self._token_bucket.tokens -= estimated_tokens
+        self._in_flight += 1
+
+        return None
+
+
+def _wait_timeout(wait_time: float, deadline: Optional[Deadline]) -> Optional[float]:
+    # A wait of 0 means only the concurrency limit blocks us, so wait for a release, but not past
+    # the deadline. Deadlines without an expiry time (inf) do not bound the wait.
+    timeout = wait_time or None
+    if deadline is not None and math.isfinite(deadline.expires_at):
+        remaining = deadline.remaining()
+        timeout = remaining if timeout is None else min(timeout, remaining)
+
+    return timeout
+
+
+_registry: Dict[Tuple[str, Optional[str]], AdaptiveRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(model_id: str, region_name: Optional[str] = None, **kwargs) -> AdaptiveRateLimiter:
+    key = (model_id, region_name)
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**kwargs)
+            _registry[key] = limiter
+        elif kwargs:
+            logger.debug("Rate limiter for %s already exists. Ignoring new settings.", key)
+
+    return limiter
@@ -1,5 +1,22 @@
-from ._faithfulness import Faithfulness
+from typing import TYPE_CHECKING
+
+from myllmet._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._batch import BatchError, BatchScoreResult
+    from ._call_metrics import CallMetricsAggregator
+    from ._faithfulness import Faithfulness
 
 __all__ = [
+    "BatchError",
+    "BatchScoreResult",
+    "CallMetricsAggregator",
     "Faithfulness"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BatchError": "._batch",
+    "BatchScoreResult": "._batch",
+    "CallMetricsAggregator": "._call_metrics",
+    "Faithfulness": "._faithfulness",
+})
@@ -0,0 +1,138 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchError(NamedTuple):
+    row_index: int
+    exception: BaseException
+
+
+class BatchScoreResult(NamedTuple):
+    scores: List[Optional[float]]
+    errors: List[BatchError]
+
+
+def imap_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterator[Tuple[Optional[R], Optional[BaseException]]]:
+    if max_in_flight < 1:
+        raise ValueError(f"`max_in_flight` must be >= 1. Got: {max_in_flight}")
+
+    # Results are yielded in input order. Reading ahead up to twice the worker count keeps
+    # the workers busy behind a slow head item while bounding memory for long iterables.
+    window_size = max_in_flight * 2
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        window: Deque[Future] = deque()
+        for item in items:
+            if len(window) >= window_size:
+                yield _outcome(window.popleft())
+            window.append(executor.submit(func, item))
+
+        while window:
+            yield _outcome(window.popleft())
+
+
+def group_by_affinity(
+    items: Iterable[T],
+    key: Callable[[T], Hashable],
+    window_size: int,
+) -> Iterator[Tuple[int, T]]:
+    if window_size < 1:
+        raise ValueError(f"`window_size` must be >= 1. Got: {window_size}")
+
+    # Items are reordered only within consecutive windows, so an item is delayed by at most
+    # one window. Groups are emitted in the order their keys first appear.
+    indexed = enumerate(items)
+    while True:
+        window = list(islice(indexed, window_size))
+        if not window:
+            return
+
+        groups: Dict[Hashable, List[Tuple[int, T]]] = {}
+        for index, item in window:
+            groups.setdefault(key(item), []).append((index, item))
+        for group in groups.values():
+            yield from group
+
+
+def imap_bounded_grouped(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+    key: Callable[[T], Hashable],
+    window_size: int,
+) -> Iterator[Tuple[Optional[R], Optional[BaseException]]]:
+
+    # Items sharing a key run back to back, but outcomes are still yielded in input order.
+    # Out-of-order outcomes are held until their predecessors finish, which is bounded by
+    # the reordering window plus the in-flight window.
+    scheduled_indices: Deque[int] = deque()
+
+    def scheduled() -> Iterator[T]:
+        for index, item in group_by_affinity(items, key, window_size):
+            scheduled_indices.append(index)
+            yield item
+
+    finished: Dict[int, Tuple[Optional[R], Optional[BaseException]]] = {}
+    next_index = 0
+    for outcome in imap_bounded(func, scheduled(), max_in_flight):
+        finished[scheduled_indices.popleft()] = outcome
+        while next_index in finished:
+            yield finished.pop(next_index)
+            next_index += 1
+
+
+def _outcome(future: Future) -> Tuple[Optional[R], Optional[BaseException]]:
+    error = future.exception()
+    if error is not None:
+        return None, error
+    return future.result(), None
+
+
+async def agather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> List[Tuple[Optional[R], Optional[BaseException]]]:
+    if max_in_flight < 1:
+        raise ValueError(f"`max_in_flight` must be >= 1. Got: {max_in_flight}")
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def run(item: T) -> Tuple[Optional[R], Optional[BaseException]]:
+        try:
+            return await func(item), None
+        except Exception as e:
+            return None, e
+        finally:
+            semaphore.release()
+
+    # Acquiring before creating each task keeps the number of pending coroutines bounded
+    # even when `items` is a long lazy iterable.
+    tasks = []
+    for item in items:
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(run(item)))
+
+    return list(await asyncio.gather(*tasks))
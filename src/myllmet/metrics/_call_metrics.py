@@ -0,0 +1,96 @@
+import statistics
+import threading
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+CALL_METRIC_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_write_input_tokens",
+    "latency_ms",
+    "duration_ms",
+    "attempts",
+    "backoff_seconds",
+)
+
+# Clients report each completed call to the collector active in the calling context, so the
+# metric can attribute calls to a stage without threading metrics through return values.
+_collector: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("myllmet_call_metrics", default=None)
+
+
+@contextmanager
+def collect_call_metrics() -> Iterator[List[Dict[str, Any]]]:
+    calls: List[Dict[str, Any]] = []
+    token = _collector.set(calls)
+    try:
+        yield calls
+    finally:
+        _collector.reset(token)
+
+
+def record_call_metrics(call: Dict[str, Any]) -> None:
+    calls = _collector.get()
+    if calls is not None:
+        calls.append(call)
+
+
+def summarize_calls(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"calls": len(calls)}
+    for field in CALL_METRIC_FIELDS:
+        summary[field] = sum(call.get(field, 0) for call in calls)
+
+    return summary
+
+
+class CallMetricsAggregator:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, Any]] = {}
+        self._latencies: Dict[str, array] = {}
+        self._durations: Dict[str, array] = {}
+
+    def add(self, stage: str, calls: List[Dict[str, Any]]) -> None:
+        if not calls:
+            return
+
+        summary = summarize_calls(calls)
+        with self._lock:
+            totals = self._totals.setdefault(stage, {key: 0 for key in summary})
+            for key, value in summary.items():
+                totals[key] += value
+
+            latencies = self._latencies.setdefault(stage, array("d"))
+            durations = self._durations.setdefault(stage, array("d"))
+            for call in calls:
+                latencies.append(call.get("latency_ms", 0))
+                durations.append(call.get("duration_ms", 0))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            result = {}
+            for stage, totals in self._totals.items():
+                result[stage] = {
+                    **totals,
+                    **_percentiles("latency_ms", self._latencies[stage]),
+                    **_percentiles("duration_ms", self._durations[stage]),
+                }
+
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self._latencies.clear()
+            self._durations.clear()
+
+
+def _percentiles(name: str, values: array) -> Dict[str, float]:
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return {f"{name}_p50": value, f"{name}_p90": value, f"{name}_p99": value}
+
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"{name}_p50": cuts[49], f"{name}_p90": cuts[89], f"{name}_p99": cuts[98]}
@@ -1,8 +1,23 @@
 import logging
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from myllmet.metrics._batch import (
+    BatchError,
+    BatchScoreResult,
+    agather_bounded,
+    group_by_affinity,
+    imap_bounded,
+    imap_bounded_grouped,
+)
+from myllmet.metrics._call_metrics import CallMetricsAggregator, collect_call_metrics, summarize_calls
 from myllmet.metrics.components import ClaimExtractor, FaithfulnessJudge
-from myllmet.metrics.interface import LLMClientInterface, TrackerInterface
+from myllmet.metrics.interface import (
+    AsyncLLMClientInterface,
+    Deadline,
+    LLMClientInterface,
+    TrackerInterface,
+    deadline_kwargs,
+)
 from myllmet.trackers import NoOPTracker
 
 if TYPE_CHECKING:
@@ -26,12 +41,19 @@ class Faithfulness:
         self._faithfulness_judge = faithfulness_judge
 
         self._tracker: TrackerInterface = NoOPTracker()
+        self._call_metrics = CallMetricsAggregator()
 
     @classmethod
     def from_clients(
         cls,
-        claim_extractor_client: LLMClientInterface["ClaimExtractorIS", "ClaimExtractorOS"],
-        faithfulness_judge_client: LLMClientInterface["FaithfulnessJudgeIS", "FaithfulnessJudgeOS"],
+        claim_extractor_client: Union[
+            LLMClientInterface["ClaimExtractorIS", "ClaimExtractorOS"],
+            AsyncLLMClientInterface["ClaimExtractorIS", "ClaimExtractorOS"],
+        ],
+        faithfulness_judge_client: Union[
+            LLMClientInterface["FaithfulnessJudgeIS", "FaithfulnessJudgeOS"],
+            AsyncLLMClientInterface["FaithfulnessJudgeIS", "FaithfulnessJudgeOS"],
+        ],
         kwargs_claim_extractor: Optional[Dict] = None,
         kwargs_faithfulness_judge: Optional[Dict] = None,
     ) -> "Faithfulness":
@@ -50,6 +72,18 @@ class Faithfulness:
             faithfulness_judge=faithfulness_judge
         )
 
+    @property
+    def claim_extractor(self) -> ClaimExtractor:
+        return self._claim_extractor
+
+    @property
+    def faithfulness_judge(self) -> FaithfulnessJudge:
+        return self._faithfulness_judge
+
+    @property
+    def call_metrics(self) -> CallMetricsAggregator:
+        return self._call_metrics
+
     def set_tracker(self, tracker: TrackerInterface) -> None:
         self._tracker = tracker
 
@@ -59,20 +93,246 @@ class Faithfulness:
         answer: str,
         context: Optional[str] = None,
         ground_truth: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> float:
 
-        if context is None:
-            raise ValueError(f"`context` must be provided in {self.__class__.__name__} score calculation.")
-        if ground_truth is not None:
-            logger.warning(
-                f"`ground_truth` is not used in {self.__class__.__name__} score calculation. "
-                "It will be ignored."
+        context = self._check_inputs(context, ground_truth)
+        score, _, _ = self.score_stages(question, answer, context, timeout=timeout)
+
+        return score
+
+    def score_stages(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        timeout: Optional[float] = None,
+        claim_extractor_output: Optional["ClaimExtractorOS"] = None,
+        faithfulness_judge_output: Optional["FaithfulnessJudgeOS"] = None,
+        on_claims_extracted: Optional[Callable[["ClaimExtractorOS"], None]] = None,
+    ) -> Tuple[float, "ClaimExtractorOS", "FaithfulnessJudgeOS"]:
+
+        # Stages whose outputs are passed in (e.g. restored from a checkpoint) are not run again.
+        deadline = self._deadline_kwargs(timeout)
+
+        with collect_call_metrics() as claim_extractor_calls:
+            if claim_extractor_output is None:
+                claim_extractor_output = self._claim_extractor.invoke(question, answer, **deadline)
+                if on_claims_extracted is not None:
+                    on_claims_extracted(claim_extractor_output)
+        with collect_call_metrics() as faithfulness_judge_calls:
+            if faithfulness_judge_output is None:
+                faithfulness_judge_output = self._faithfulness_judge.invoke(
+                    context,
+                    claim_extractor_output["claims"],
+                    **deadline
+                )
+
+        score = self.score_from_outputs(
+            question=question,
+            answer=answer,
+            context=context,
+            claim_extractor_output=claim_extractor_output,
+            faithfulness_judge_output=faithfulness_judge_output,
+            call_metrics={
+                "claim_extractor": claim_extractor_calls,
+                "faithfulness_judge": faithfulness_judge_calls,
+            }
+        )
+
+        return score, claim_extractor_output, faithfulness_judge_output
+
+    async def ascore(
+        self,
+        question: str,
+        answer: str,
+        context: Optional[str] = None,
+        ground_truth: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+
+        context = self._check_inputs(context, ground_truth)
+        deadline = self._deadline_kwargs(timeout)
+
+        with collect_call_metrics() as claim_extractor_calls:
+            claim_extractor_output = await self._claim_extractor.ainvoke(question, answer, **deadline)
+        with collect_call_metrics() as faithfulness_judge_calls:
+            faithfulness_judge_output = await self._faithfulness_judge.ainvoke(
+                context,
+                claim_extractor_output["claims"],
+                **deadline
             )
 
-        claim_extractor_output = self._claim_extractor.invoke(question,answer)
-        claims = claim_extractor_output["claims"]
+        return self.score_from_outputs(
+            question=question,
+            answer=answer,
+            context=context,
+            claim_extractor_output=claim_extractor_output,
+            faithfulness_judge_output=faithfulness_judge_output,
+            call_metrics={
+                "claim_extractor": claim_extractor_calls,
+                "faithfulness_judge": faithfulness_judge_calls,
+            }
+        )
+
+    def score_contexts(
+        self,
+        question: str,
+        answer: str,
+        contexts: Sequence[str],
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[float]:
+
+        deadline = self._deadline_kwargs(timeout)
+
+        # Claims depend only on (question, answer), so they are extracted once and
+        # judged against every context. The extraction calls are attributed to the first context.
+        with collect_call_metrics() as claim_extractor_calls:
+            claim_extractor_output = self._claim_extractor.invoke(question, answer, **deadline)
+
+        def score_context(indexed_context: Tuple[int, str]) -> float:
+            index, context = indexed_context
+            with collect_call_metrics() as faithfulness_judge_calls:
+                faithfulness_judge_output = self._faithfulness_judge.invoke(
+                    context,
+                    claim_extractor_output["claims"],
+                    **deadline
+                )
+            return self.score_from_outputs(
+                question=question,
+                answer=answer,
+                context=context,
+                claim_extractor_output=claim_extractor_output,
+                faithfulness_judge_output=faithfulness_judge_output,
+                call_metrics={
+                    "claim_extractor": claim_extractor_calls if index == 0 else [],
+                    "faithfulness_judge": faithfulness_judge_calls,
+                }
+            )
+
+        scores: List[float] = []
+        for score, error in imap_bounded(score_context, enumerate(contexts), max_workers):
+            if error is not None:
+                raise error
+            assert score is not None
+            scores.append(score)
 
-        faithfulness_judge_output = self._faithfulness_judge.invoke(context, claims)
+        return scores
+
+    async def ascore_contexts(
+        self,
+        question: str,
+        answer: str,
+        contexts: Sequence[str],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[float]:
+
+        deadline = self._deadline_kwargs(timeout)
+        with collect_call_metrics() as claim_extractor_calls:
+            claim_extractor_output = await self._claim_extractor.ainvoke(question, answer, **deadline)
+
+        async def score_context(indexed_context: Tuple[int, str]) -> float:
+            index, context = indexed_context
+            with collect_call_metrics() as faithfulness_judge_calls:
+                faithfulness_judge_output = await self._faithfulness_judge.ainvoke(
+                    context,
+                    claim_extractor_output["claims"],
+                    **deadline
+                )
+            return self.score_from_outputs(
+                question=question,
+                answer=answer,
+                context=context,
+                claim_extractor_output=claim_extractor_output,
+                faithfulness_judge_output=faithfulness_judge_output,
+                call_metrics={
+                    "claim_extractor": claim_extractor_calls if index == 0 else [],
+                    "faithfulness_judge": faithfulness_judge_calls,
+                }
+            )
+
+        scores: List[float] = []
+        for score, error in await agather_bounded(score_context, enumerate(contexts), max_concurrency):
+            if error is not None:
+                raise error
+            assert score is not None
+            scores.append(score)
+
+        return scores
+
+    def score_batch(
+        self,
+        records: Iterable[Tuple[str, str, str]],
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        affinity_window: Optional[int] = None,
+    ) -> BatchScoreResult:
+
+        def score_record(record: Tuple[str, str, str]) -> float:
+            question, answer, context = record
+            return self.score(question=question, answer=answer, context=context, timeout=timeout)
+
+        if affinity_window is None:
+            return self._collect_batch_outcomes(imap_bounded(score_record, records, max_workers))
+
+        # Records that share a context are judged back to back, so the identical prompt prefix
+        # (the judge input starts with the context) and per-context caches are reused while warm.
+        return self._collect_batch_outcomes(
+            imap_bounded_grouped(score_record, records, max_workers, key=_record_context, window_size=affinity_window)
+        )
+
+    async def ascore_batch(
+        self,
+        records: Iterable[Tuple[str, str, str]],
+        max_concurrency: int = 64,
+        timeout: Optional[float] = None,
+        affinity_window: Optional[int] = None,
+    ) -> BatchScoreResult:
+
+        async def score_record(record: Tuple[str, str, str]) -> float:
+            question, answer, context = record
+            return await self.ascore(question=question, answer=answer, context=context, timeout=timeout)
+
+        if affinity_window is None:
+            return self._collect_batch_outcomes(await agather_bounded(score_record, records, max_concurrency))
+
+        scheduled = list(group_by_affinity(records, _record_context, affinity_window))
+        outcomes = await agather_bounded(score_record, (record for _, record in scheduled), max_concurrency)
+
+        ordered: List[Tuple[Optional[float], Optional[BaseException]]] = [(None, None)] * len(scheduled)
+        for (index, _), outcome in zip(scheduled, outcomes):
+            ordered[index] = outcome
+
+        return self._collect_batch_outcomes(ordered)
+
+    def _collect_batch_outcomes(
+        self,
+        outcomes: Iterable[Tuple[Optional[float], Optional[BaseException]]],
+    ) -> BatchScoreResult:
+
+        scores: List[Optional[float]] = []
+        errors: List[BatchError] = []
+        for index, (score, error) in enumerate(outcomes):
+            if error is not None:
+                logger.warning("Failed to score record %s: %r", index, error)
+                errors.append(BatchError(row_index=index, exception=error))
+            scores.append(score)
+
+        return BatchScoreResult(scores=scores, errors=errors)
+
+    def score_from_outputs(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        claim_extractor_output: "ClaimExtractorOS",
+        faithfulness_judge_output: "FaithfulnessJudgeOS",
+        call_metrics: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> float:
+
+        claims = claim_extractor_output["claims"]
         verdicts = [v["verdict"] for v in faithfulness_judge_output["verdicts"]]
 
         if len(claims) != len(verdicts):
@@ -83,17 +343,36 @@ class Faithfulness:
 
         score = sum(verdicts) / len(claims)
 
+        for stage, calls in (call_metrics or {}).items():
+            self._call_metrics.add(stage, calls)
+
         self._log_to_tracker(
             question=question,
             answer=answer,
             context=context,
             score=score,
             claim_extractor_output=claim_extractor_output,
-            faithfulness_judge_output=faithfulness_judge_output
+            faithfulness_judge_output=faithfulness_judge_output,
+            call_metrics=call_metrics
         )
 
         return score
 
+    def _deadline_kwargs(self, timeout: Optional[float]) -> Dict[str, Deadline]:
+        # The deadline is shared by both stages, so the judge gets whatever time extraction left.
+        return deadline_kwargs(None if timeout is None else Deadline.after(timeout))
+
+    def _check_inputs(self, context: Optional[str], ground_truth: Optional[str]) -> str:
+        if context is None:
+            raise ValueError(f"`context` must be provided in {self.__class__.__name__} score calculation.")
+        if ground_truth is not None:
+            logger.warning(
+                f"`ground_truth` is not used in {self.__class__.__name__} score calculation. "
+                "It will be ignored."
+            )
+
+        return context
+
     def _log_to_tracker(
         self,
         question: str,
@@ -102,12 +381,18 @@ class Faithfulness:
         score: float,
         claim_extractor_output: "ClaimExtractorOS",
         faithfulness_judge_output: "FaithfulnessJudgeOS",
+        call_metrics: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     ) -> None:
 
-        intermediates = {
+        intermediates: Dict[str, Any] = {
             "claims": claim_extractor_output["claims"],
             "verdicts": faithfulness_judge_output["verdicts"],
         }
+        # Only clients that report call metrics (e.g. Bedrock chat clients) add this entry.
+        if call_metrics and any(call_metrics.values()):
+            intermediates["call_metrics"] = {
+                stage: summarize_calls(calls) for stage, calls in call_metrics.items()
+            }
         prompts = {
             "claim_extractor": {
                 "instruction": self._claim_extractor.instruction,
@@ -128,3 +413,7 @@ class Faithfulness:
             intermediates=intermediates,
             prompts=prompts,
         )
+
+
+def _record_context(record: Tuple[str, str, str]) -> str:
+    return record[2]
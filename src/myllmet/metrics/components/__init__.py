@@ -1,7 +1,11 @@
 from .claim_extractor import ClaimExtractor
+from .context_reducer import ContextReducer
 from .faithfulness_judge import FaithfulnessJudge
+from .verdict_cache import VerdictCache
 
 __all__ = [
     "ClaimExtractor",
+    "ContextReducer",
     "FaithfulnessJudge",
+    "VerdictCache",
 ]
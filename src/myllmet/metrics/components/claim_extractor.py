@@ -5,11 +5,10 @@
 
 
 import logging
-from typing import List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict, Union
 
-import jsonschema
-
-from myllmet.metrics.interface import LLMClientInterface
+from myllmet.metrics.components.schema_validator import validate
+from myllmet.metrics.interface import AsyncLLMClientInterface, Deadline, LLMClientInterface, deadline_kwargs
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +74,10 @@ DEFAULT_FEWSHOT_EXAMPLES: List[FewShotExample] = [
 class ClaimExtractor:
     def __init__(
         self,
-        client: LLMClientInterface[InputSchema, OutputSchema],
+        client: Union[
+            LLMClientInterface[InputSchema, OutputSchema],
+            AsyncLLMClientInterface[InputSchema, OutputSchema],
+        ],
         *,
         instruction: Optional[str] = None,
         fewshot_examples: Optional[List[FewShotExample]] = None
@@ -115,20 +117,75 @@ class ClaimExtractor:
     def invoke(
         self,
         question: str,
-        answer: str
+        answer: str,
+        deadline: Optional[Deadline] = None
     ) -> OutputSchema:
 
-        input_json: InputSchema = {
-            "question": question,
-            "answer": answer
-        }
+        if not isinstance(self.client, LLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.invoke` requires a client implementing `invoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
 
         result = self.client.invoke(
             instruction=self.instruction,
             fewshot_examples=self.fewshot_examples,
-            input_json=input_json,
-            output_json_schema=OUTPUT_JSON_SCHEMA
+            input_json=self._build_input_json(question, answer),
+            output_json_schema=OUTPUT_JSON_SCHEMA,
+            **deadline_kwargs(deadline)
+        )
+
+        return self.validate_output(result)
+
+    async def ainvoke(
+        self,
+        question: str,
+        answer: str,
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        if not isinstance(self.client, AsyncLLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.ainvoke` requires a client implementing `ainvoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
+
+        result = await self.client.ainvoke(
+            instruction=self.instruction,
+            fewshot_examples=self.fewshot_examples,
+            input_json=self._build_input_json(question, answer),
+            output_json_schema=OUTPUT_JSON_SCHEMA,
+            **deadline_kwargs(deadline)
         )
 
-        jsonschema.validate(instance=result, schema=OUTPUT_JSON_SCHEMA)
+        return self.validate_output(result)
+
+    def build_request(
+        self,
+        question: str,
+        answer: str
+    ) -> Dict[str, Any]:
+
+        return {
+            "instruction": self.instruction,
+            "fewshot_examples": self.fewshot_examples,
+            "input_json": self._build_input_json(question, answer),
+            "output_json_schema": OUTPUT_JSON_SCHEMA,
+        }
+
+    def validate_output(self, result: Any) -> OutputSchema:
+        validate(result, OUTPUT_JSON_SCHEMA)
         return result
+
+    def _build_input_json(
+        self,
+        question: str,
+        answer: str
+    ) -> InputSchema:
+
+        input_json: InputSchema = {
+            "question": question,
+            "answer": answer
+        }
+
+        return input_json
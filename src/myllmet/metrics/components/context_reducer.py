@@ -0,0 +1,146 @@
+import hashlib
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Dict, List, Set, Tuple
+
+# Sentence ends in Japanese and English text. Passages are packed from whole sentences so a
+# retrieved passage never starts or ends mid-sentence unless the sentence itself is too long.
+_SENTENCE_END = re.compile(r"(?<=[。！？!?.\n])")
+_IGNORED_CHARS = re.compile(r"[\s\W_]+")
+
+
+def char_ngrams(text: str, n: int = 2) -> List[str]:
+    normalized = _IGNORED_CHARS.sub("", unicodedata.normalize("NFKC", text).lower())
+    if len(normalized) <= n:
+        return [normalized] if normalized else []
+
+    return [normalized[i:i + n] for i in range(len(normalized) - n + 1)]
+
+
+def split_passages(text: str, passage_chars: int) -> List[str]:
+    passages: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text):
+        while len(sentence) > passage_chars:
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(sentence[:passage_chars])
+            sentence = sentence[passage_chars:]
+
+        if current and len(current) + len(sentence) > passage_chars:
+            passages.append(current)
+            current = ""
+        current += sentence
+
+    if current.strip():
+        passages.append(current)
+
+    return [p for p in passages if p.strip()]
+
+
+class PassageIndex:
+    def __init__(self, passages: List[str], ngram_size: int = 2, k1: float = 1.5, b: float = 0.75):
+        self.passages = passages
+        self.ngram_size = ngram_size
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+        for i, passage in enumerate(passages):
+            terms = Counter(char_ngrams(passage, ngram_size))
+            self._lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                self._postings.setdefault(term, []).append((i, tf))
+
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    def scores(self, query: str) -> List[float]:
+        scores = [0.0] * len(self.passages)
+        n = len(self.passages)
+        for term in set(char_ngrams(query, self.ngram_size)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for i, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[i] / self._avg_length)
+                scores[i] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return scores
+
+    def top_k(self, query: str, k: int) -> List[int]:
+        scores = self.scores(query)
+        ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+
+        return [i for i in ranked[:k] if scores[i] > 0]
+
+
+class ContextReducer:
+    def __init__(
+        self,
+        top_k: int = 3,
+        passage_chars: int = 400,
+        ngram_size: int = 2,
+        min_context_chars: int = 4000,
+        separator: str = "\n...\n",
+        cache_size: int = 128,
+    ):
+        if top_k < 1:
+            raise ValueError(f"`top_k` must be >= 1. Got: {top_k}")
+        if passage_chars < 1:
+            raise ValueError(f"`passage_chars` must be >= 1. Got: {passage_chars}")
+
+        self.top_k = top_k
+        self.passage_chars = passage_chars
+        self.ngram_size = ngram_size
+        self.min_context_chars = min_context_chars
+        self.separator = separator
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[str, PassageIndex] = OrderedDict()
+
+    @property
+    def fingerprint(self) -> str:
+        return f"{self.top_k}:{self.passage_chars}:{self.ngram_size}:{self.min_context_chars}:{self.separator!r}"
+
+    def reduce(self, context: str, claims: List[str]) -> str:
+        # Short contexts are cheap enough to send whole, and reducing them only risks dropping evidence.
+        if len(context) <= self.min_context_chars:
+            return context
+
+        index = self.get_index(context)
+        selected: Set[int] = set()
+        for claim in claims:
+            selected.update(index.top_k(claim, self.top_k))
+
+        if not selected:
+            return context
+
+        return self.separator.join(index.passages[i] for i in sorted(selected))
+
+    def get_index(self, context: str) -> PassageIndex:
+        key = hashlib.sha256(context.encode("utf-8")).hexdigest()
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+
+        # Building outside the lock lets different contexts be indexed in parallel; a context
+        # indexed twice concurrently just keeps the last build.
+        index = PassageIndex(split_passages(context, self.passage_chars), ngram_size=self.ngram_size)
+        with self._lock:
+            self._indexes[key] = index
+            if len(self._indexes) > self.cache_size:
+                self._indexes.popitem(last=False)
+
+        return index
@@ -4,12 +4,21 @@
 # No source code from RAGAS has been copied or included.
 
 
+import contextvars
 import logging
-from typing import List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union, cast
 
-import jsonschema
-
-from myllmet.metrics.interface import LLMClientInterface
+from myllmet.metrics._batch import agather_bounded, imap_bounded
+from myllmet.metrics.components.context_reducer import ContextReducer
+from myllmet.metrics.components.schema_validator import validate
+from myllmet.metrics.components.verdict_cache import VerdictCache
+from myllmet.metrics.interface import (
+    AsyncLLMClientInterface,
+    Deadline,
+    LLMClientInterface,
+    TruncatedResponseError,
+    deadline_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -105,18 +114,47 @@ DEFAULT_FEWSHOT_EXAMPLES: List[FewShotExample] = [
 ]
 
 
+# Each verdict echoes its claim and adds a short reason. Claims are mostly Japanese, where a
+# token is roughly two characters.
+_CHARS_PER_TOKEN_ESTIMATE = 2
+_VERDICT_OVERHEAD_TOKENS = 64
+
+
+def _estimate_verdict_tokens(claim: str) -> int:
+    return len(claim) // _CHARS_PER_TOKEN_ESTIMATE + _VERDICT_OVERHEAD_TOKENS
+
+
 class FaithfulnessJudge:
     def __init__(
         self,
-        client: LLMClientInterface[InputSchema, OutputSchema],
+        client: Union[
+            LLMClientInterface[InputSchema, OutputSchema],
+            AsyncLLMClientInterface[InputSchema, OutputSchema],
+        ],
         *,
         instruction: Optional[str] = None,
-        fewshot_examples: Optional[List[FewShotExample]] = None
+        fewshot_examples: Optional[List[FewShotExample]] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+        max_claims_per_call: Optional[int] = None,
+        max_output_tokens_per_call: Optional[int] = None,
+        max_concurrent_calls: int = 4,
+        context_reducer: Optional[ContextReducer] = None
     ):
+        if max_claims_per_call is not None and max_claims_per_call < 1:
+            raise ValueError(f"`max_claims_per_call` must be >= 1. Got: {max_claims_per_call}")
+        if max_output_tokens_per_call is not None and max_output_tokens_per_call < 1:
+            raise ValueError(f"`max_output_tokens_per_call` must be >= 1. Got: {max_output_tokens_per_call}")
+
         self.client = client
+        self.verdict_cache = verdict_cache
+        self.max_claims_per_call = max_claims_per_call
+        self.max_output_tokens_per_call = max_output_tokens_per_call
+        self.max_concurrent_calls = max_concurrent_calls
+        self.context_reducer = context_reducer
 
         self._instruction = instruction
         self._fewshot_examples = fewshot_examples
+        self._prompt_fingerprint: Optional[str] = None
 
     @property
     def instruction(self) -> str:
@@ -148,20 +186,302 @@ class FaithfulnessJudge:
     def invoke(
         self,
         context: str,
-        claims: List[str]
+        claims: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        if not isinstance(self.client, LLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.invoke` requires a client implementing `invoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
+
+        if self.verdict_cache is None:
+            return self._judge(context, claims, deadline)
+
+        keys, verdicts = self._lookup_cached_verdicts(context, claims)
+        missing = [i for i, v in enumerate(verdicts) if v is None]
+        if missing:
+            fresh_output = self._judge(context, [claims[i] for i in missing], deadline)
+            self._merge_fresh_verdicts(keys, verdicts, missing, fresh_output)
+
+        return {"verdicts": cast(List[SingleFaithfulnessJudgResult], verdicts)}
+
+    async def ainvoke(
+        self,
+        context: str,
+        claims: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        if not isinstance(self.client, AsyncLLMClientInterface):
+            raise TypeError(
+                f"`{self.__class__.__name__}.ainvoke` requires a client implementing `ainvoke`. "
+                f"Got: {type(self.client).__name__}"
+            )
+
+        if self.verdict_cache is None:
+            return await self._ajudge(context, claims, deadline)
+
+        keys, verdicts = self._lookup_cached_verdicts(context, claims)
+        missing = [i for i, v in enumerate(verdicts) if v is None]
+        if missing:
+            fresh_output = await self._ajudge(context, [claims[i] for i in missing], deadline)
+            self._merge_fresh_verdicts(keys, verdicts, missing, fresh_output)
+
+        return {"verdicts": cast(List[SingleFaithfulnessJudgResult], verdicts)}
+
+    def split_claims(self, claims: List[str]) -> List[List[str]]:
+        if self.max_claims_per_call is None and self.max_output_tokens_per_call is None:
+            return [claims]
+
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        chunk_tokens = 0
+        for claim in claims:
+            tokens = _estimate_verdict_tokens(claim)
+            if chunk and (
+                (self.max_claims_per_call is not None and len(chunk) >= self.max_claims_per_call)
+                or (
+                    self.max_output_tokens_per_call is not None
+                    and chunk_tokens + tokens > self.max_output_tokens_per_call
+                )
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(claim)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _judge(
+        self,
+        context: str,
+        claims: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        chunks = self.split_claims(claims)
+        if len(chunks) <= 1:
+            return self._judge_chunk(context, claims, deadline)
+
+        # Worker threads do not inherit context variables, so each chunk runs in a copy of the
+        # caller's context (e.g. to keep call metrics attributed to the judge stage).
+        def judge_chunk(item: Tuple[contextvars.Context, List[str]]) -> OutputSchema:
+            ctx, chunk = item
+            return ctx.run(self._judge_chunk, context, chunk, deadline)
+
+        items = [(contextvars.copy_context(), chunk) for chunk in chunks]
+        outcomes = list(imap_bounded(judge_chunk, items, self.max_concurrent_calls))
+
+        return self._merge_chunk_outcomes(chunks, outcomes)
+
+    async def _ajudge(
+        self,
+        context: str,
+        claims: List[str],
+        deadline: Optional[Deadline] = None
     ) -> OutputSchema:
 
+        chunks = self.split_claims(claims)
+        if len(chunks) <= 1:
+            return await self._ajudge_chunk(context, claims, deadline)
+
+        async def judge_chunk(chunk: List[str]) -> OutputSchema:
+            return await self._ajudge_chunk(context, chunk, deadline)
+
+        outcomes = await agather_bounded(judge_chunk, chunks, self.max_concurrent_calls)
+
+        return self._merge_chunk_outcomes(chunks, outcomes)
+
+    def _judge_chunk(
+        self,
+        context: str,
+        claims: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        assert isinstance(self.client, LLMClientInterface)
+        try:
+            result = self.client.invoke(
+                instruction=self.instruction,
+                fewshot_examples=self.fewshot_examples,
+                input_json=self._build_input_json(self._reduce_context(context, claims), claims),
+                output_json_schema=OUTPUT_JSON_SCHEMA,
+                **deadline_kwargs(deadline)
+            )
+        except TruncatedResponseError:
+            if len(claims) <= 1:
+                raise
+            logger.debug("Judge response for %s claims was truncated. Splitting and retrying.", len(claims))
+            middle = len(claims) // 2
+            halves = [claims[:middle], claims[middle:]]
+            return self.merge_chunk_outputs(halves, [self._judge_chunk(context, half, deadline) for half in halves])
+
+        return self.validate_output(result)
+
+    async def _ajudge_chunk(
+        self,
+        context: str,
+        claims: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> OutputSchema:
+
+        assert isinstance(self.client, AsyncLLMClientInterface)
+        try:
+            result = await self.client.ainvoke(
+                instruction=self.instruction,
+                fewshot_examples=self.fewshot_examples,
+                input_json=self._build_input_json(self._reduce_context(context, claims), claims),
+                output_json_schema=OUTPUT_JSON_SCHEMA,
+                **deadline_kwargs(deadline)
+            )
+        except TruncatedResponseError:
+            if len(claims) <= 1:
+                raise
+            logger.debug("Judge response for %s claims was truncated. Splitting and retrying.", len(claims))
+            middle = len(claims) // 2
+            halves = [claims[:middle], claims[middle:]]
+            return self.merge_chunk_outputs(
+                halves,
+                [await self._ajudge_chunk(context, half, deadline) for half in halves]
+            )
+
+        return self.validate_output(result)
+
+    def _reduce_context(self, context: str, claims: List[str]) -> str:
+        if self.context_reducer is None:
+            return context
+        return self.context_reducer.reduce(context, claims)
+
+    def _merge_chunk_outcomes(
+        self,
+        chunks: List[List[str]],
+        outcomes: List[Tuple[Optional[OutputSchema], Optional[BaseException]]]
+    ) -> OutputSchema:
+
+        for _, error in outcomes:
+            if error is not None:
+                raise error
+
+        return self.merge_chunk_outputs(chunks, [cast(OutputSchema, output) for output, _ in outcomes])
+
+    def merge_chunk_outputs(self, chunks: List[List[str]], outputs: List[OutputSchema]) -> OutputSchema:
+        verdicts: List[SingleFaithfulnessJudgResult] = []
+        for chunk, output in zip(chunks, outputs):
+            # Counts are checked per chunk. A chunk with a missing verdict and another with an extra
+            # one would otherwise add up to the right total and pair verdicts with the wrong claims.
+            if len(output["verdicts"]) != len(chunk):
+                raise ValueError(
+                    f"Number of claims in chunk ({len(chunk)}) "
+                    f"does not match number of verdicts ({len(output['verdicts'])})."
+                )
+            verdicts.extend(output["verdicts"])
+
+        return {"verdicts": verdicts}
+
+    def _lookup_cached_verdicts(
+        self,
+        context: str,
+        claims: List[str]
+    ) -> Tuple[List[str], List[Optional[SingleFaithfulnessJudgResult]]]:
+
+        assert self.verdict_cache is not None
+        if self._prompt_fingerprint is None:
+            self._prompt_fingerprint = VerdictCache.prompt_fingerprint(
+                self.instruction,
+                self.fewshot_examples,
+                OUTPUT_JSON_SCHEMA
+            )
+            if self.context_reducer is not None:
+                # Verdicts judged on reduced contexts must not be served to runs that judge the full context.
+                self._prompt_fingerprint = VerdictCache.prompt_fingerprint(
+                    self._prompt_fingerprint,
+                    [],
+                    {"context_reducer": self.context_reducer.fingerprint}
+                )
+
+        keys = self.verdict_cache.keys(
+            model_id=getattr(self.client, "model_id", None),
+            prompt_fingerprint=self._prompt_fingerprint,
+            context=context,
+            claims=claims
+        )
+
+        verdicts: List[Optional[SingleFaithfulnessJudgResult]] = []
+        for claim, cached in zip(claims, self.verdict_cache.get_many(keys)):
+            if cached is None:
+                verdicts.append(None)
+            else:
+                # Normalized claims share a cache entry, but the verdict should echo the claim as given.
+                verdicts.append({"claim": claim, "verdict": cached["verdict"], "reason": cached["reason"]})
+
+        return keys, verdicts
+
+    def _merge_fresh_verdicts(
+        self,
+        keys: List[str],
+        verdicts: List[Optional[SingleFaithfulnessJudgResult]],
+        missing: List[int],
+        fresh_output: OutputSchema,
+    ) -> None:
+
+        assert self.verdict_cache is not None
+        fresh_verdicts = fresh_output["verdicts"]
+        if len(fresh_verdicts) != len(missing):
+            raise ValueError(
+                f"Number of uncached claims ({len(missing)}) "
+                f"does not match number of verdicts ({len(fresh_verdicts)})."
+            )
+
+        for i, verdict in zip(missing, fresh_verdicts):
+            verdicts[i] = verdict
+
+        self.verdict_cache.set_many(
+            [keys[i] for i in missing],
+            [dict(v) for v in fresh_verdicts]
+        )
+
+    def build_request(
+        self,
+        context: str,
+        claims: List[str]
+    ) -> Dict[str, Any]:
+
+        return {
+            "instruction": self.instruction,
+            "fewshot_examples": self.fewshot_examples,
+            "input_json": self._build_input_json(self._reduce_context(context, claims), claims),
+            "output_json_schema": OUTPUT_JSON_SCHEMA,
+        }
+
+    def validate_output(self, result: Any) -> OutputSchema:
+        validate(result, OUTPUT_JSON_SCHEMA)
+        return result
+
+    @staticmethod
+    def check_verdict_count(input_json: InputSchema, output: OutputSchema) -> None:
+        # For `CachedLLMClient(..., validate=FaithfulnessJudge.check_verdict_count)`, so responses
+        # that leave out or add verdicts are not cached.
+        if len(output["verdicts"]) != len(input_json["claims"]):
+            raise ValueError(
+                f"Number of claims ({len(input_json['claims'])}) "
+                f"does not match number of verdicts ({len(output['verdicts'])})."
+            )
+
+    def _build_input_json(
+        self,
+        context: str,
+        claims: List[str]
+    ) -> InputSchema:
+
         input_json: InputSchema = {
             "context": context,
             "claims": claims
         }
 
-        result = self.client.invoke(
-            instruction=self.instruction,
-            fewshot_examples=self.fewshot_examples,
-            input_json=input_json,
-            output_json_schema=OUTPUT_JSON_SCHEMA
-        )
-
-        jsonschema.validate(instance=result, schema=OUTPUT_JSON_SCHEMA)
-        return result
+        return input_json
@@ -0,0 +1,71 @@
+import threading
+from typing import Any, Callable, Dict, Literal, Tuple
+
+Backend = Literal["auto", "jsonschema", "fastjsonschema"]
+Validator = Callable[[Any], None]
+
+
+# Schemas are module-level constants, so validators are cached by schema identity. The cache
+# also holds a reference to each schema, which keeps its id from being reused.
+_validators: Dict[Tuple[int, str], Tuple[Dict[str, Any], Validator]] = {}
+_validators_lock = threading.Lock()
+
+
+def get_validator(schema: Dict[str, Any], backend: Backend = "auto") -> Validator:
+    key = (id(schema), backend)
+    cached = _validators.get(key)
+    if cached is not None:
+        return cached[1]
+
+    with _validators_lock:
+        cached = _validators.get(key)
+        if cached is None:
+            cached = (schema, _compile(schema, backend))
+            _validators[key] = cached
+
+    return cached[1]
+
+
+def validate(instance: Any, schema: Dict[str, Any], backend: Backend = "auto") -> None:
+    get_validator(schema, backend)(instance)
+
+
+def _compile(schema: Dict[str, Any], backend: Backend) -> Validator:
+    # Imported here so that importing the components does not load jsonschema.
+    import jsonschema
+    from jsonschema.exceptions import best_match
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+
+    def validate_with_jsonschema(instance: Any) -> None:
+        # Same error as `jsonschema.validate`, without re-checking the schema on every call.
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    if backend == "jsonschema":
+        return validate_with_jsonschema
+
+    try:
+        import fastjsonschema  # type: ignore[import-not-found,import-untyped]
+    except ImportError:
+        if backend == "fastjsonschema":
+            raise ImportError(
+                "`fastjsonschema` is required for the fastjsonschema backend. "
+                "Install it with `pip install myllmet[fastjsonschema]`."
+            )
+        return validate_with_jsonschema
+
+    fast_validate = fastjsonschema.compile(schema)
+
+    def validate_with_fastjsonschema(instance: Any) -> None:
+        # Only rejected instances are re-checked with jsonschema, so callers keep getting
+        # `jsonschema.ValidationError` with the usual detail and jsonschema has the final say.
+        try:
+            fast_validate(instance)
+        except fastjsonschema.JsonSchemaException:
+            validate_with_jsonschema(instance)
+
+    return validate_with_fastjsonschema
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import threading
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from myllmet.metrics.interface import CacheStoreInterface
+
+
+def normalize_claim(claim: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", claim).split())
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    def __init__(self, store: CacheStoreInterface):
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @staticmethod
+    def prompt_fingerprint(
+        instruction: str,
+        fewshot_examples: List[Any],
+        output_json_schema: Dict[str, Any],
+    ) -> str:
+        return _sha256(json.dumps(
+            {
+                "instruction": instruction,
+                "fewshot_examples": fewshot_examples,
+                "output_json_schema": output_json_schema,
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        ))
+
+    def keys(
+        self,
+        model_id: Optional[str],
+        prompt_fingerprint: str,
+        context: str,
+        claims: List[str],
+    ) -> List[str]:
+        prefix = f"{model_id}\x00{prompt_fingerprint}\x00{_sha256(context)}\x00"
+        return [_sha256(prefix + normalize_claim(claim)) for claim in claims]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        values = [self.store.get(key) for key in keys]
+
+        hits = sum(value is not None for value in values)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(values) - hits
+
+        return [None if value is None else json.loads(value) for value in values]
+
+    def set_many(self, keys: List[str], verdicts: List[Dict[str, Any]]) -> None:
+        for key, verdict in zip(keys, verdicts):
+            self.store.set(key, json.dumps(verdict, ensure_ascii=False))
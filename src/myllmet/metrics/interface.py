@@ -1,4 +1,5 @@
-from typing import Any, Dict, Generic, List, Protocol, TypedDict, TypeVar, runtime_checkable
+import time
+from typing import Any, Dict, Generic, List, Optional, Protocol, TypedDict, TypeVar, runtime_checkable
 
 type JSONSchema = Dict[str, Any]
 
@@ -11,6 +12,44 @@ class FewshotExample(TypedDict, Generic[IS, OS]):
     assistant: OS
 
 
+class Deadline:
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at  # In `time.monotonic()` seconds
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        if self.expired:
+            raise TimeoutError("Deadline exceeded.")
+
+    def expire(self) -> None:
+        self.expires_at = min(self.expires_at, time.monotonic())
+
+    def timeout(self, limit: Optional[float] = None) -> float:
+        remaining = self.remaining()
+        return remaining if limit is None else min(remaining, limit)
+
+
+class TruncatedResponseError(ValueError):
+    # Raised by clients when the model stopped at its output token limit, so callers can
+    # retry with a smaller request instead of failing.
+    pass
+
+
+def deadline_kwargs(deadline: Optional[Deadline]) -> Dict[str, Deadline]:
+    # `deadline` is only forwarded when set, so clients and components that predate it keep working.
+    return {} if deadline is None else {"deadline": deadline}
+
+
 @runtime_checkable
 class LLMClientInterface(Protocol, Generic[IS, OS]):
     def invoke(
@@ -19,6 +58,19 @@ class LLMClientInterface(Protocol, Generic[IS, OS]):
         fewshot_examples: List[FewshotExample[IS, OS]],
         input_json: IS,
         output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
+    ) -> OS: ...
+
+
+@runtime_checkable
+class AsyncLLMClientInterface(Protocol, Generic[IS, OS]):
+    async def ainvoke(
+        self,
+        instruction: str,
+        fewshot_examples: List[FewshotExample[IS, OS]],
+        input_json: IS,
+        output_json_schema: JSONSchema,
+        deadline: Optional[Deadline] = None,
     ) -> OS: ...
 
 
@@ -34,3 +86,10 @@ class TrackerInterface(Protocol):
         intermediates: Dict[str, Any],
         prompts: Dict[str, Any],
     ) -> None: ...
+
+
+@runtime_checkable
+class CacheStoreInterface(Protocol):
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str) -> None: ...
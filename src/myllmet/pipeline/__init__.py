@@ -0,0 +1,19 @@
+from ._checkpoint import RowCheckpoint, RunCheckpoint
+from ._pipeline import ColumnMapping, EvaluationSummary, evaluate_file, evaluate_rows
+from ._progress import ProgressReporter
+from ._readers import iter_rows
+from ._writers import CSVResultWriter, JSONLResultWriter, open_result_writer
+
+__all__ = [
+    "ColumnMapping",
+    "CSVResultWriter",
+    "EvaluationSummary",
+    "JSONLResultWriter",
+    "ProgressReporter",
+    "RowCheckpoint",
+    "RunCheckpoint",
+    "evaluate_file",
+    "evaluate_rows",
+    "iter_rows",
+    "open_result_writer",
+]
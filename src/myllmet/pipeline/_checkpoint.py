@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Union
+
+from myllmet.metrics import Faithfulness
+from myllmet.metrics.components.verdict_cache import VerdictCache
+
+if TYPE_CHECKING:
+    from myllmet.metrics.components.claim_extractor import OutputSchema as ClaimExtractorOS
+    from myllmet.metrics.components.faithfulness_judge import OutputSchema as FaithfulnessJudgeOS
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_NAME = "manifest.json"
+LOG_NAME = "log.jsonl"
+_CHECKPOINT_VERSION = 1
+
+
+class RowCheckpoint(NamedTuple):
+    score: Optional[float]
+    claim_extractor_output: Optional["ClaimExtractorOS"]
+
+
+class RunCheckpoint:
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        config: Optional[Dict[str, Any]] = None,
+        fsync: bool = False,
+    ):
+        self.directory = os.fspath(directory)
+        self.fsync = fsync
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = self._load_or_create_manifest(config)
+
+        # Only scores of completed rows and claims of partially completed rows are kept in
+        # memory. Full verdicts stay in the log for auditing.
+        self._scores: Dict[str, float] = {}
+        self._claims: Dict[str, "ClaimExtractorOS"] = {}
+        self._load_log()
+
+        self._lock = threading.Lock()
+        self._log: IO[str] = open(self.log_path, "a", encoding="utf-8")
+
+    @classmethod
+    def for_metric(
+        cls,
+        directory: Union[str, os.PathLike],
+        metric: Faithfulness,
+        fsync: bool = False,
+    ) -> "RunCheckpoint":
+        return cls(directory, config=run_config(metric), fsync=fsync)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    @property
+    def log_path(self) -> str:
+        return os.path.join(self.directory, LOG_NAME)
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._scores)
+
+    @property
+    def partial_count(self) -> int:
+        return len(self._claims)
+
+    def get(self, row_id: str) -> RowCheckpoint:
+        with self._lock:
+            return RowCheckpoint(
+                score=self._scores.get(row_id),
+                claim_extractor_output=self._claims.get(row_id)
+            )
+
+    def record_claims(self, row_id: str, claim_extractor_output: "ClaimExtractorOS") -> None:
+        with self._lock:
+            self._append({"row_id": row_id, "claims": claim_extractor_output})
+            self._claims[row_id] = claim_extractor_output
+
+    def record_score(
+        self,
+        row_id: str,
+        score: float,
+        claim_extractor_output: "ClaimExtractorOS",
+        faithfulness_judge_output: "FaithfulnessJudgeOS",
+    ) -> None:
+
+        with self._lock:
+            self._append({
+                "row_id": row_id,
+                "claims": claim_extractor_output,
+                "verdicts": faithfulness_judge_output,
+                "score": score
+            })
+            self._claims.pop(row_id, None)
+            self._scores[row_id] = score
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._log.closed:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._log.close()
+
+    def __enter__(self) -> "RunCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self._log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+
+    def _load_or_create_manifest(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            if manifest.get("version") != _CHECKPOINT_VERSION:
+                raise ValueError(f"Unsupported checkpoint version: {manifest.get('version')}")
+            if config is not None and manifest.get("config") != config:
+                raise ValueError(
+                    f"Checkpoint in {self.directory!r} was created with a different configuration. "
+                    "Use a new checkpoint directory to start a fresh run."
+                )
+
+            logger.info("Resuming run from checkpoint %s", self.directory)
+            return manifest
+
+        manifest = {"version": _CHECKPOINT_VERSION, "created_at": time.time(), "config": config}
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+        return manifest
+
+    def _load_log(self) -> None:
+        if not os.path.exists(self.log_path):
+            return
+
+        valid_size = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                # Entries are appended with a single write, so only a crash mid-append can leave
+                # a last line without its newline. That entry is discarded and re-run.
+                if not line.endswith(b"\n"):
+                    logger.warning("Discarding incomplete last entry of %s", self.log_path)
+                    break
+
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Corrupted checkpoint log: {self.log_path}") from e
+
+                valid_size += len(line)
+                row_id = entry["row_id"]
+                if "score" in entry:
+                    self._scores[row_id] = entry["score"]
+                    self._claims.pop(row_id, None)
+                elif row_id not in self._scores:
+                    self._claims[row_id] = entry["claims"]
+
+        if valid_size != os.path.getsize(self.log_path):
+            with open(self.log_path, "r+b") as f:
+                f.truncate(valid_size)
+
+
+def run_config(metric: Faithfulness) -> Dict[str, Any]:
+    # Outputs recorded under one prompt or model must not be mixed with another's on resume.
+    config: Dict[str, Any] = {}
+    for name, component, request in (
+        ("claim_extractor", metric.claim_extractor, metric.claim_extractor.build_request("", "")),
+        ("faithfulness_judge", metric.faithfulness_judge, metric.faithfulness_judge.build_request("", [])),
+    ):
+        config[name] = {
+            "model_id": getattr(component.client, "model_id", None),
+            "prompt_fingerprint": VerdictCache.prompt_fingerprint(
+                request["instruction"],
+                request["fewshot_examples"],
+                request["output_json_schema"]
+            ),
+        }
+
+    context_reducer = getattr(metric.faithfulness_judge, "context_reducer", None)
+    if context_reducer is not None:
+        config["faithfulness_judge"]["context_reducer"] = context_reducer.fingerprint
+
+    return config
@@ -0,0 +1,171 @@
+import logging
+import os
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from myllmet.metrics import Faithfulness
+from myllmet.metrics._batch import imap_bounded, imap_bounded_grouped
+from myllmet.pipeline._checkpoint import RunCheckpoint
+from myllmet.pipeline._progress import ProgressReporter
+from myllmet.pipeline._readers import iter_rows
+from myllmet.pipeline._writers import open_result_writer
+from myllmet.pipeline.interface import ResultWriterInterface
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnMapping(NamedTuple):
+    question: str = "question"
+    answer: str = "answer"
+    context: str = "context"
+    ground_truth: str = "ground_truth"
+    id: Optional[str] = None
+
+
+class EvaluationSummary(NamedTuple):
+    total: int
+    failed: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def evaluate_rows(
+    metric: Faithfulness,
+    rows: Iterable[Dict[str, Any]],
+    writer: ResultWriterInterface,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    columns: Optional[ColumnMapping] = None,
+    progress: Optional[ProgressReporter] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+    affinity_window: Optional[int] = None,
+) -> EvaluationSummary:
+
+    columns = columns or ColumnMapping()
+    progress = progress or ProgressReporter(interval=float("inf"))
+
+    def score_row(
+        indexed_row: Tuple[int, Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Optional[float], Optional[BaseException]]:
+
+        index, row = indexed_row
+        try:
+            if checkpoint is None:
+                score = metric.score(
+                    question=row[columns.question],
+                    answer=row[columns.answer],
+                    context=row.get(columns.context),
+                    ground_truth=row.get(columns.ground_truth),
+                    timeout=timeout
+                )
+            else:
+                score = _score_with_checkpoint(
+                    metric,
+                    checkpoint,
+                    row_id=str(index if columns.id is None else row[columns.id]),
+                    question=row[columns.question],
+                    answer=row[columns.answer],
+                    context=row.get(columns.context),
+                    timeout=timeout
+                )
+        except Exception as e:
+            return row, None, e
+        return row, score, None
+
+    # Rows are read lazily and written in input order as soon as they are scored, so memory
+    # stays bounded by the in-flight window rather than the dataset size.
+    total = 0
+    failed = 0
+    if affinity_window is None:
+        outcomes = imap_bounded(score_row, enumerate(rows), max_in_flight=max_workers)
+    else:
+        # Rows sharing a context are scored back to back within the window; output order is unchanged.
+        outcomes = imap_bounded_grouped(
+            score_row,
+            enumerate(rows),
+            max_in_flight=max_workers,
+            key=lambda indexed_row: indexed_row[1].get(columns.context),
+            window_size=affinity_window
+        )
+
+    for outcome, _ in outcomes:
+        assert outcome is not None
+        row, score, error = outcome
+        if error is not None:
+            logger.warning("Failed to score row %s: %r", total, error)
+            failed += 1
+
+        writer.write({**row, "score": score, "error": None if error is None else repr(error)})
+        progress.update(failed=error is not None)
+        total += 1
+
+    progress.report()
+    return EvaluationSummary(total=total, failed=failed, elapsed=progress.elapsed)
+
+
+def _score_with_checkpoint(
+    metric: Faithfulness,
+    checkpoint: RunCheckpoint,
+    row_id: str,
+    question: str,
+    answer: str,
+    context: Optional[str],
+    timeout: Optional[float],
+) -> float:
+
+    # Completed rows are not scored again. Rows whose claims were extracted before the
+    # interruption only need the judge stage.
+    state = checkpoint.get(row_id)
+    if state.score is not None:
+        return state.score
+
+    if context is None:
+        raise ValueError(f"`context` must be provided for row {row_id}.")
+
+    score, claim_extractor_output, faithfulness_judge_output = metric.score_stages(
+        question,
+        answer,
+        context,
+        timeout=timeout,
+        claim_extractor_output=state.claim_extractor_output,
+        on_claims_extracted=lambda output: checkpoint.record_claims(row_id, output)
+    )
+    checkpoint.record_score(row_id, score, claim_extractor_output, faithfulness_judge_output)
+
+    return score
+
+
+def evaluate_file(
+    metric: Faithfulness,
+    input_path: Union[str, os.PathLike],
+    output_path: Union[str, os.PathLike],
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    columns: Optional[ColumnMapping] = None,
+    progress: Optional[ProgressReporter] = None,
+    checkpoint_dir: Optional[Union[str, os.PathLike]] = None,
+    affinity_window: Optional[int] = None,
+) -> EvaluationSummary:
+
+    rows = iter_rows(input_path, file_format=input_format)
+    checkpoint = None if checkpoint_dir is None else RunCheckpoint.for_metric(checkpoint_dir, metric)
+    try:
+        with open_result_writer(output_path, file_format=output_format) as writer:
+            return evaluate_rows(
+                metric,
+                rows,
+                writer,
+                max_workers=max_workers,
+                timeout=timeout,
+                columns=columns,
+                progress=progress,
+                checkpoint=checkpoint,
+                affinity_window=affinity_window
+            )
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
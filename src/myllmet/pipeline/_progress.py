@@ -0,0 +1,61 @@
+import sys
+import threading
+import time
+from typing import Callable, Optional, TextIO
+
+
+class ProgressReporter:
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        interval: float = 5.0,
+        total: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval = interval
+        self.total = total
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = clock()
+        self._last_reported_at = self._started_at
+        self._completed = 0
+        self._failed = 0
+
+    @property
+    def completed(self) -> int:
+        return self._completed
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self._started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self._completed / elapsed if elapsed > 0 else 0.0
+
+    def update(self, failed: bool = False) -> None:
+        with self._lock:
+            self._completed += 1
+            if failed:
+                self._failed += 1
+
+            now = self._clock()
+            if now - self._last_reported_at < self.interval:
+                return
+            self._last_reported_at = now
+
+        self.report()
+
+    def report(self) -> None:
+        completed = f"{self._completed}/{self.total}" if self.total is not None else f"{self._completed}"
+        self.stream.write(
+            f"{completed} rows ({self._failed} failed) | {self.rows_per_second:.2f} rows/s | {self.elapsed:.1f}s\n"
+        )
+        self.stream.flush()
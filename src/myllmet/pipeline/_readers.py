@@ -0,0 +1,73 @@
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, Optional, Union
+
+SUPPORTED_FORMATS = ("jsonl", "csv", "parquet")
+
+_SUFFIX_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def infer_format(path: Union[str, os.PathLike]) -> str:
+    _, suffix = os.path.splitext(os.fspath(path))
+    file_format = _SUFFIX_FORMATS.get(suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Cannot infer the file format from {os.fspath(path)!r}. "
+            f"Specify one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+    return file_format
+
+
+def iter_rows(
+    path: Union[str, os.PathLike],
+    file_format: Optional[str] = None,
+    batch_size: int = 1024,
+) -> Iterator[Dict[str, Any]]:
+
+    file_format = file_format or infer_format(path)
+    if file_format == "jsonl":
+        return _iter_jsonl(path)
+    if file_format == "csv":
+        return _iter_csv(path)
+    if file_format == "parquet":
+        return _iter_parquet(path, batch_size)
+
+    raise ValueError(f"Unsupported file format: {file_format}. Expected one of: {', '.join(SUPPORTED_FORMATS)}")
+
+
+def _iter_jsonl(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"Expected a JSON object on line {line_number} of {os.fspath(path)!r}.")
+            yield row
+
+
+def _iter_csv(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def _iter_parquet(path: Union[str, os.PathLike], batch_size: int) -> Iterator[Dict[str, Any]]:
+    try:
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "`pyarrow` is required to read Parquet files. Install it with `pip install myllmet[parquet]`."
+        ) from e
+
+    # Reading one record batch at a time keeps memory bounded regardless of row group sizes.
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
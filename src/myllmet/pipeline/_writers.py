@@ -0,0 +1,80 @@
+import csv
+import json
+import os
+from typing import IO, Any, Dict, List, Optional, Union
+
+from myllmet.pipeline._readers import infer_format
+
+
+class JSONLResultWriter:
+    def __init__(self, path: Union[str, os.PathLike], flush_every: int = 1):
+        self.path = os.fspath(path)
+        self.flush_every = flush_every
+
+        self._file: IO[str] = open(self.path, "w", encoding="utf-8")
+        self._pending = 0
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._file.write("\n")
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "JSONLResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CSVResultWriter:
+    def __init__(self, path: Union[str, os.PathLike], flush_every: int = 1):
+        self.path = os.fspath(path)
+        self.flush_every = flush_every
+
+        self._file: IO[str] = open(self.path, "w", encoding="utf-8", newline="")
+        self._writer: Optional[csv.DictWriter] = None
+        self._pending = 0
+
+    def write(self, row: Dict[str, Any]) -> None:
+        # The header is taken from the first row. Keys that first appear in later rows are
+        # dropped rather than failing a long run halfway through; use JSONL for ragged rows.
+        if self._writer is None:
+            fieldnames: List[str] = list(row)
+            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction="ignore")
+            self._writer.writeheader()
+
+        self._writer.writerow(row)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "CSVResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_result_writer(
+    path: Union[str, os.PathLike],
+    file_format: Optional[str] = None,
+    flush_every: int = 1,
+) -> Union[JSONLResultWriter, CSVResultWriter]:
+
+    file_format = file_format or infer_format(path)
+    if file_format == "jsonl":
+        return JSONLResultWriter(path, flush_every=flush_every)
+    if file_format == "csv":
+        return CSVResultWriter(path, flush_every=flush_every)
+
+    raise ValueError(f"Unsupported output format: {file_format}. Expected one of: jsonl, csv")
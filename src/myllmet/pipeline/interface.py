@@ -0,0 +1,6 @@
+from typing import Any, Dict, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ResultWriterInterface(Protocol):
+    def write(self, row: Dict[str, Any]) -> None: ...
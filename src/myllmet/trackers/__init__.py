@@ -1,7 +1,29 @@
-from ._list import ListTracker
-from ._noop import NoOPTracker
+from typing import TYPE_CHECKING
+
+from myllmet._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._background import BackgroundTracker
+    from ._jsonl import JSONLTracker
+    from ._list import ListTracker
+    from ._noop import NoOPTracker
+    from ._parquet import ParquetTracker
+    from ._sqlite import SQLiteTracker
 
 __all__ = [
+    "BackgroundTracker",
+    "JSONLTracker",
     "NoOPTracker",
-    "ListTracker"
+    "ListTracker",
+    "ParquetTracker",
+    "SQLiteTracker",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BackgroundTracker": "._background",
+    "JSONLTracker": "._jsonl",
+    "NoOPTracker": "._noop",
+    "ListTracker": "._list",
+    "ParquetTracker": "._parquet",
+    "SQLiteTracker": "._sqlite",
+})
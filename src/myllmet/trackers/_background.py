@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from myllmet.metrics.interface import TrackerInterface
+
+logger = logging.getLogger(__name__)
+
+
+OverflowPolicy = Literal["block", "drop", "spill"]
+
+_STOP = object()
+
+
+class BackgroundTracker(TrackerInterface):
+    def __init__(
+        self,
+        tracker: TrackerInterface,
+        max_queue_size: int = 10_000,
+        overflow: OverflowPolicy = "block",
+        batch_size: int = 256,
+        spill_path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        if overflow not in ("block", "drop", "spill"):
+            raise ValueError(f"Unknown overflow policy: {overflow}. Expected one of: block, drop, spill")
+
+        self.tracker = tracker
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._closed = False
+
+        self._spill_path = None if spill_path is None else os.fspath(spill_path)
+        self._spilled_pending = 0
+
+        self._logged = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._errors = 0
+        self._max_queue_depth = 0
+        self._write_seconds = 0.0
+        self._max_write_seconds = 0.0
+        self._batches = 0
+
+        self._thread = threading.Thread(target=self._run, name="myllmet-background-tracker", daemon=True)
+        self._thread.start()
+
+    def log(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        ground_truth: str,
+        score: float,
+        intermediates: Dict[str, Any],
+        prompts: Dict[str, Any],
+    ) -> None:
+        record = {
+            "question": question,
+            "answer": answer,
+            "context": context,
+            "ground_truth": ground_truth,
+            "score": score,
+            "intermediates": intermediates,
+            "prompts": prompts,
+        }
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"{self.__class__.__name__} is closed.")
+            self._pending += 1
+
+        if self.overflow == "block":
+            self._queue.put(record)
+        else:
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self._on_overflow(record)
+                return
+
+        depth = self._queue.qsize()
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "pending": self._pending,
+                "logged": self._logged,
+                "dropped": self._dropped,
+                "spilled": self._spilled,
+                "errors": self._errors,
+                "batches": self._batches,
+                "mean_write_seconds": self._write_seconds / self._batches if self._batches else 0.0,
+                "max_write_seconds": self._max_write_seconds,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            flushed = self._condition.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+        tracker_flush = getattr(self.tracker, "flush", None)
+        if flushed and callable(tracker_flush):
+            tracker_flush()
+
+        return flushed
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+
+        self.flush(timeout=timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+
+        tracker_close = getattr(self.tracker, "close", None)
+        if callable(tracker_close):
+            tracker_close()
+
+    def __enter__(self) -> "BackgroundTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _on_overflow(self, record: Dict[str, Any]) -> None:
+        if self.overflow == "drop":
+            with self._condition:
+                self._dropped += 1
+                self._pending -= 1
+                self._condition.notify_all()
+            if self._dropped == 1:
+                logger.warning("Tracker queue is full. Dropping records.")
+            return
+
+        # Records that do not fit in the queue are appended to a file and replayed by the
+        # writer thread whenever it catches up, so producers never wait on the tracker.
+        with self._condition:
+            if self._spill_path is None:
+                fd, self._spill_path = tempfile.mkstemp(prefix="myllmet-tracker-spill-", suffix=".jsonl")
+                os.close(fd)
+            with open(self._spill_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            self._spilled += 1
+            self._spilled_pending += 1
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Any] = []
+            try:
+                batch.append(self._queue.get(timeout=0.1))
+            except queue.Empty:
+                self._drain_spill()
+                continue
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is _STOP
+            records = [record for record in batch if record is not _STOP]
+            if records:
+                self._write(records)
+            if self._queue.empty():
+                self._drain_spill()
+            if stop:
+                return
+
+    def _drain_spill(self) -> None:
+        with self._condition:
+            if self._spilled_pending == 0 or self._spill_path is None:
+                return
+            drain_path = f"{self._spill_path}.draining"
+            os.replace(self._spill_path, drain_path)
+            self._spilled_pending = 0
+
+        records: List[Dict[str, Any]] = []
+        with open(drain_path, encoding="utf-8") as f:
+            for line in f:
+                records.append(json.loads(line))
+                if len(records) >= self.batch_size:
+                    self._write(records)
+                    records = []
+        if records:
+            self._write(records)
+
+        os.remove(drain_path)
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        started_at = time.monotonic()
+        errors = 0
+        for record in records:
+            try:
+                self.tracker.log(**record)
+            except Exception:
+                logger.exception("Failed to log a record to %s", type(self.tracker).__name__)
+                errors += 1
+        elapsed = time.monotonic() - started_at
+
+        with self._condition:
+            self._logged += len(records) - errors
+            self._errors += errors
+            self._batches += 1
+            self._write_seconds += elapsed
+            self._max_write_seconds = max(self._max_write_seconds, elapsed)
+            self._pending -= len(records)
+            self._condition.notify_all()
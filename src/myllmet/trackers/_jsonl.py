@@ -0,0 +1,315 @@
+import glob
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Literal, Optional, Union
+from uuid import uuid4
+
+from myllmet.metrics.interface import TrackerInterface
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+
+
+def _default_encoder() -> Callable[[Dict[str, Any]], bytes]:
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ImportError:
+        return lambda record: json.dumps(record, ensure_ascii=False, default=str).encode("utf-8")
+
+    return lambda record: orjson.dumps(record, default=str)
+
+
+_FILE_PATTERN = re.compile(r"^(?P<prefix>.+)-(?P<index>\d{5})\.jsonl(?:\.gz)?$")
+
+
+class JSONLTracker(TrackerInterface):
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        prefix: str = "tracker",
+        flush_every: int = 1000,
+        flush_interval: float = 1.0,
+        fsync_interval: Optional[float] = 5.0,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        compress: bool = True,
+    ):
+        self.directory = os.fspath(directory)
+        self.prefix = prefix
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._encode = _default_encoder()
+        self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._file: Optional[IO[bytes]] = None
+        self._file_size = 0
+        self._file_index = self._next_file_index()
+        self._last_flush_at = time.monotonic()
+        self._last_fsync_at = time.monotonic()
+        self._unsynced = False
+
+        # Records buffered after a burst are flushed (and fsynced) by a background thread once
+        # `flush_interval` passes, even if nothing else is logged.
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+
+        # Finished segments are compressed on a background thread so `log()` never waits on gzip.
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._compressions: List[Future] = []
+
+    def log(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        ground_truth: str,
+        score: float,
+        intermediates: Dict[str, Any],
+        prompts: Dict[str, Any],
+    ) -> None:
+        # Encoding happens outside the lock, so concurrent scorers only serialize on the append.
+        line = self._encode({
+            "id": str(uuid4()),
+            "logged_at": time.time(),
+            "question": question,
+            "answer": answer,
+            "context": context,
+            "ground_truth": ground_truth,
+            "score": score,
+            "intermediates": intermediates,
+            "prompts": prompts,
+        }) + b"\n"
+
+        with self._lock:
+            self._buffer.append(line)
+            if self._flusher is None:
+                self._start_flusher_locked()
+            if (
+                len(self._buffer) >= self.flush_every
+                or time.monotonic() - self._last_flush_at >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked(force_fsync=True)
+        self._wait_for_compressions()
+
+    def close(self) -> None:
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._flusher_stop.set()
+            flusher.join()
+            self._flusher_stop.clear()
+
+        with self._lock:
+            self._flush_locked(force_fsync=True)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._wait_for_compressions()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+
+    def __enter__(self) -> "JSONLTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def iter_records(
+        self,
+        kind: Literal["standard", "prompts", "intermediates", "raw"] = "raw",
+    ) -> Iterator[Dict[str, Any]]:
+
+        self.flush()
+        for path in self._file_paths():
+            with (gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")) as f:
+                for line in f:
+                    if line.strip():
+                        yield _to_view(json.loads(line), kind)
+
+    def to_pandas(
+        self,
+        kind: Literal["standard", "prompts", "intermediates"],
+        chunksize: Optional[int] = None,
+    ) -> Union["pd.DataFrame", Iterator["pd.DataFrame"]]:
+
+        import pandas as pd  # type: ignore[import]
+
+        if kind not in ("standard", "prompts", "intermediates"):
+            raise ValueError(f"Unknown kind: {kind}")
+
+        records = self.iter_records(kind)
+        if chunksize is None:
+            return pd.DataFrame(list(records))
+
+        def chunks() -> Iterator["pd.DataFrame"]:
+            chunk: List[Dict[str, Any]] = []
+            for record in records:
+                chunk.append(record)
+                if len(chunk) >= chunksize:
+                    yield pd.DataFrame(chunk)
+                    chunk = []
+            if chunk:
+                yield pd.DataFrame(chunk)
+
+        return chunks()
+
+    def _flush_locked(self, force_fsync: bool = False) -> None:
+        self._last_flush_at = time.monotonic()
+        if self._buffer:
+            data = b"".join(self._buffer)
+            self._buffer = []
+
+            if self._file is None:
+                self._file = open(self._current_path(), "ab")
+                self._file_size = self._file.tell()
+            self._file.write(data)
+            self._file.flush()
+            self._file_size += len(data)
+            self._unsynced = True
+
+        if self._file is None:
+            return
+
+        now = time.monotonic()
+        if force_fsync or (self.fsync_interval is not None and now - self._last_fsync_at >= self.fsync_interval):
+            os.fsync(self._file.fileno())
+            self._last_fsync_at = now
+            self._unsynced = False
+
+        if self.max_bytes is not None and self._file_size >= self.max_bytes:
+            self._rotate_locked()
+
+    def _start_flusher_locked(self) -> None:
+        intervals = [self.flush_interval] + ([] if self.fsync_interval is None else [self.fsync_interval])
+        period = max(min(intervals), 0.01)
+        self._flusher = threading.Thread(
+            target=_run_flusher,
+            args=(weakref.ref(self), self._flusher_stop, period),
+            name="myllmet-jsonl-flush",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if (self._buffer and now - self._last_flush_at >= self.flush_interval) or (
+                self._unsynced
+                and self.fsync_interval is not None
+                and now - self._last_fsync_at >= self.fsync_interval
+            ):
+                self._flush_locked()
+
+    def _rotate_locked(self) -> None:
+        assert self._file is not None
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._unsynced = False
+
+        path = self._current_path()
+        self._file_index += 1
+        self._file_size = 0
+
+        if self.compress:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="myllmet-jsonl-compress")
+            self._compressions = [f for f in self._compressions if not f.done()]
+            self._compressions.append(self._compressor.submit(_compress_segment, path))
+
+    def _wait_for_compressions(self) -> None:
+        with self._lock:
+            compressions, self._compressions = self._compressions, []
+        for future in compressions:
+            error = future.exception()
+            if error is not None:
+                # The uncompressed segment is kept and stays readable.
+                logger.error("Failed to compress a tracker segment: %r", error)
+
+    def _current_path(self) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{self._file_index:05d}.jsonl")
+
+    def _file_paths(self) -> List[str]:
+        paths: Dict[int, str] = {}
+        for path in glob.glob(os.path.join(self.directory, f"{glob.escape(self.prefix)}-*.jsonl*")):
+            match = _FILE_PATTERN.match(os.path.basename(path))
+            if match is None or match.group("prefix") != self.prefix:
+                continue
+            # A crash during rotation can leave both files. The compressed one is complete.
+            index = int(match.group("index"))
+            if index not in paths or path.endswith(".gz"):
+                paths[index] = path
+
+        return [paths[index] for index in sorted(paths)]
+
+    def _next_file_index(self) -> int:
+        # Reopening a directory appends to a fresh file after the existing ones.
+        paths = self._file_paths()
+        if not paths:
+            return 0
+
+        match = _FILE_PATTERN.match(os.path.basename(paths[-1]))
+        assert match is not None
+        return int(match.group("index")) + 1
+
+
+def _run_flusher(tracker_ref: "weakref.ref[JSONLTracker]", stop: threading.Event, period: float) -> None:
+    # Holds the tracker only weakly between checks, so an unclosed tracker can still be collected.
+    while not stop.wait(period):
+        tracker = tracker_ref()
+        if tracker is None:
+            return
+        try:
+            tracker._flush_if_due()
+        except Exception as e:
+            logger.error("Failed to flush tracker records: %r", e)
+        del tracker
+
+
+def _compress_segment(path: str) -> None:
+    # Readers prefer the `.gz` file once it exists, and it only appears complete.
+    tmp_path = f"{path}.gz.tmp"
+    with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(tmp_path, f"{path}.gz")
+    os.remove(path)
+
+
+def _to_view(record: Dict[str, Any], kind: str) -> Dict[str, Any]:
+    if kind == "raw":
+        return record
+    if kind == "standard":
+        return {
+            "id": record["id"],
+            "question": record["question"],
+            "answer": record["answer"],
+            "context": record["context"],
+            "ground_truth": record["ground_truth"],
+            "score": record["score"]
+        }
+    if kind == "intermediates":
+        return {"id": record["id"], **record["intermediates"]}
+    if kind == "prompts":
+        return {"id": record["id"], **record["prompts"]}
+
+    raise ValueError(f"Unknown kind: {kind}")
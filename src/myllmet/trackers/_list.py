@@ -1,4 +1,11 @@
-from typing import TYPE_CHECKING, Any, Dict, Literal
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Union
 from uuid import uuid4
 
 from myllmet.metrics.interface import TrackerInterface
@@ -7,11 +14,53 @@ if TYPE_CHECKING:
     import pandas as pd  # type: ignore[import]
 
 
+class _Row:
+    __slots__ = ("id", "question", "answer", "context_key", "ground_truth", "score", "intermediates", "prompts_key")
+
+    def __init__(
+        self,
+        id: str,
+        question: str,
+        answer: str,
+        context_key: str,
+        ground_truth: str,
+        score: float,
+        intermediates: Dict[str, Any],
+        prompts_key: str,
+    ):
+        self.id = id
+        self.question = question
+        self.answer = answer
+        self.context_key = context_key
+        self.ground_truth = ground_truth
+        self.score = score
+        self.intermediates = intermediates
+        self.prompts_key = prompts_key
+
+
 class ListTracker(TrackerInterface):
-    def __init__(self):
-        self._standard_records = []
-        self._prompt_records = []
-        self._intermediate_records = []
+    def __init__(
+        self,
+        spill_threshold_bytes: Optional[int] = None,
+        spill_dir: Optional[Union[str, os.PathLike]] = None,
+    ):
+        self.spill_threshold_bytes = spill_threshold_bytes
+
+        # Prompts and contexts repeat across rows, so each distinct value is stored once and
+        # rows keep only its content hash.
+        self._rows: List[_Row] = []
+        self._contexts: Dict[str, str] = {}
+        self._prompts: Dict[str, Dict[str, Any]] = {}
+        self._last_prompts: Optional[Dict[str, Any]] = None
+        self._last_prompts_key = ""
+
+        self._lock = threading.Lock()
+        self._memory_bytes = 0
+        self._segments: List[str] = []
+        self._spilled_count = 0
+        self._spill_root = None if spill_dir is None else os.fspath(spill_dir)
+        self._spill_dir: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
 
     def log(
         self,
@@ -23,36 +72,141 @@ class ListTracker(TrackerInterface):
         intermediates: Dict[str, Any],
         prompts: Dict[str, Any],
     ) -> None:
-        id_ = str(uuid4())
-        self._standard_records.append({
-            "id": id_,
-            "question": question,
-            "answer": answer,
-            "context": context,
-            "ground_truth": ground_truth,
-            "score": score
-        })
-
-        self._intermediate_records.append({
-            "id": id_,
-            **intermediates
-        })
-
-        self._prompt_records.append({
-            "id": id_,
-            **prompts
-        })
+        with self._lock:
+            context_key = _hash_text(context)
+            if context_key not in self._contexts:
+                self._contexts[context_key] = context
+                self._memory_bytes += len(context)
+
+            self._rows.append(_Row(
+                id=str(uuid4()),
+                question=question,
+                answer=answer,
+                context_key=context_key,
+                ground_truth=ground_truth,
+                score=score,
+                intermediates=intermediates,
+                prompts_key=self._intern_prompts(prompts)
+            ))
+
+            if self.spill_threshold_bytes is not None:
+                self._memory_bytes += len(question) + len(answer) + len(ground_truth) + _approx_size(intermediates)
+                if self._memory_bytes > self.spill_threshold_bytes:
+                    self._spill()
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._rows)
 
     def to_pandas(self, kind: Literal["standard", "prompts", "intermediates"]) -> "pd.DataFrame":
         import pandas as pd  # type: ignore[import]
 
         if kind == "standard":
-            df = pd.DataFrame(self._standard_records)
+            df = pd.DataFrame([
+                {
+                    "id": record["id"],
+                    "question": record["question"],
+                    "answer": record["answer"],
+                    "context": record["context"],
+                    "ground_truth": record["ground_truth"],
+                    "score": record["score"]
+                }
+                for record in self._iter_records()
+            ])
         elif kind == "prompts":
-            df = pd.DataFrame(self._prompt_records)
+            df = pd.DataFrame([
+                {"id": record["id"], **self._prompts[record["prompts_key"]]}
+                for record in self._iter_records()
+            ])
         elif kind == "intermediates":
-            df = pd.DataFrame(self._intermediate_records)
+            df = pd.DataFrame([
+                {"id": record["id"], **record["intermediates"]}
+                for record in self._iter_records()
+            ])
         else:
             raise ValueError(f"Unknown kind: {kind}")
 
         return df
+
+    def close(self) -> None:
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+                self._spill_dir = None
+            self._segments = []
+            self._spilled_count = 0
+
+    def _intern_prompts(self, prompts: Dict[str, Any]) -> str:
+        # Components hand out the same instruction and few-shot objects on every call, so
+        # comparing against the previous prompts is usually an identity check per field.
+        if self._last_prompts is not None and prompts == self._last_prompts:
+            return self._last_prompts_key
+
+        key = _hash_text(json.dumps(prompts, ensure_ascii=False, sort_keys=True, default=str))
+        self._prompts.setdefault(key, prompts)
+        self._last_prompts = prompts
+        self._last_prompts_key = key
+
+        return key
+
+    def _spill(self) -> None:
+        if self._spill_dir is None:
+            # Each tracker spills into its own new directory, so trackers sharing a `spill_dir`
+            # never write to or delete each other's segments.
+            if self._spill_root is not None:
+                os.makedirs(self._spill_root, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="myllmet-tracker-", dir=self._spill_root)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+
+        # Segments store contexts inline, so the in-memory context table can be dropped with
+        # the rows. Prompts stay in memory as there are only a handful of distinct sets.
+        path = os.path.join(self._spill_dir, f"segment-{len(self._segments):05d}.jsonl")
+        with open(path, "x", encoding="utf-8") as f:
+            for row in self._rows:
+                f.write(json.dumps(self._row_to_record(row), ensure_ascii=False, default=str))
+                f.write("\n")
+
+        self._segments.append(path)
+        self._spilled_count += len(self._rows)
+        self._rows = []
+        self._contexts = {}
+        self._memory_bytes = 0
+
+    def _row_to_record(self, row: _Row) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "question": row.question,
+            "answer": row.answer,
+            "context": self._contexts[row.context_key],
+            "ground_truth": row.ground_truth,
+            "score": row.score,
+            "intermediates": row.intermediates,
+            "prompts_key": row.prompts_key,
+        }
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            segments = list(self._segments)
+            records = [self._row_to_record(row) for row in self._rows]
+
+        for path in segments:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+
+        yield from records
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _approx_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(k)) + _approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_approx_size(v) for v in value)
+
+    return 8
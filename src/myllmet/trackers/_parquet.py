@@ -0,0 +1,193 @@
+import glob
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
+from uuid import uuid4
+
+from myllmet.metrics.interface import TrackerInterface
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+
+_KINDS = ("standard", "prompts", "intermediates")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "`pyarrow` is required to use ParquetTracker. Install it with `pip install myllmet[parquet]`."
+        ) from e
+
+    return pa, pq
+
+
+class ParquetTracker(TrackerInterface):
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        row_group_size: int = 10_000,
+        compression: str = "none",
+    ):
+        if row_group_size < 1:
+            raise ValueError(f"`row_group_size` must be >= 1. Got: {row_group_size}")
+
+        self._pa, self._pq = _import_pyarrow()
+
+        self.directory = os.fspath(directory)
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+        for kind in _KINDS:
+            os.makedirs(os.path.join(self.directory, kind), exist_ok=True)
+
+        # Rows are buffered column-wise and written as one Parquet part file per row group.
+        # Finished parts are complete files, so they can be read while the run continues.
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, Dict[str, List[Any]]] = {kind: {} for kind in _KINDS}
+        self._buffered_rows = 0
+        self._part_count = len(glob.glob(os.path.join(self.directory, "standard", "part-*.parquet")))
+        self._last_prompts: Optional[Dict[str, Any]] = None
+        self._last_encoded_prompts: Dict[str, str] = {}
+
+    def log(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        ground_truth: str,
+        score: float,
+        intermediates: Dict[str, Any],
+        prompts: Dict[str, Any],
+    ) -> None:
+        id_ = str(uuid4())
+        with self._lock:
+            self._append("standard", {
+                "id": id_,
+                "question": question,
+                "answer": answer,
+                "context": context,
+                "ground_truth": ground_truth,
+                "score": score
+            })
+            # Nested values are stored as JSON text. Their shapes vary between rows (e.g. empty
+            # claim lists), which Arrow cannot infer into one stable schema.
+            self._append("intermediates", {"id": id_, **_encode_json_values(intermediates)})
+            self._append("prompts", {"id": id_, **self._encode_prompts(prompts)})
+
+            self._buffered_rows += 1
+            if self._buffered_rows >= self.row_group_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "ParquetTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def to_arrow(self, kind: Literal["standard", "prompts", "intermediates"]) -> "pa.Table":
+        if kind not in _KINDS:
+            raise ValueError(f"Unknown kind: {kind}")
+
+        with self._lock:
+            paths = self._part_paths(kind)
+            buffered = self._buffer_to_table(kind)
+
+        # Parts are memory-mapped and concatenated as chunks, so they are not read into memory up
+        # front or copied when combined. Parquet pages are still decoded into Arrow buffers on
+        # read. Uncompressed parts (the default) skip decompression; a codec such as "zstd" makes
+        # parts several times smaller at the cost of decompressing every page on each read.
+        tables = [self._pq.read_table(path, memory_map=True) for path in paths]
+        if buffered is not None:
+            tables.append(buffered)
+        if not tables:
+            return self._pa.table({})
+
+        return self._pa.concat_tables(tables, promote_options="default")
+
+    def to_pandas(
+        self,
+        kind: Literal["standard", "prompts", "intermediates"],
+        decode_json: bool = True,
+    ) -> "pd.DataFrame":
+
+        df = self.to_arrow(kind).to_pandas()
+        if decode_json and kind != "standard":
+            for column in df.columns:
+                if column != "id":
+                    df[column] = df[column].map(lambda v: json.loads(v) if isinstance(v, str) else None)
+
+        return df
+
+    def _append(self, kind: str, row: Dict[str, Any]) -> None:
+        buffer = self._buffers[kind]
+        for key in row:
+            if key not in buffer:
+                # Rows logged before this key appeared get nulls.
+                buffer[key] = [None] * self._buffered_rows
+        for key, values in buffer.items():
+            values.append(row.get(key))
+
+    def _flush_locked(self) -> None:
+        if self._buffered_rows == 0:
+            return
+
+        for kind in _KINDS:
+            table = self._buffer_to_table(kind)
+            path = os.path.join(self.directory, kind, f"part-{self._part_count:05d}.parquet")
+            tmp_path = f"{path}.tmp"
+            self._pq.write_table(table, tmp_path, row_group_size=self.row_group_size, compression=self.compression)
+            os.replace(tmp_path, path)
+            self._buffers[kind] = {}
+
+        self._part_count += 1
+        self._buffered_rows = 0
+
+    def _buffer_to_table(self, kind: str) -> Optional["pa.Table"]:
+        if self._buffered_rows == 0:
+            return None
+
+        buffer = self._buffers[kind]
+        if kind == "standard":
+            return self._pa.table(buffer, schema=self._standard_schema())
+
+        return self._pa.table({key: self._pa.array(values, type=self._pa.string()) for key, values in buffer.items()})
+
+    def _standard_schema(self) -> "pa.Schema":
+        pa = self._pa
+        return pa.schema([
+            ("id", pa.string()),
+            ("question", pa.string()),
+            ("answer", pa.string()),
+            ("context", pa.string()),
+            ("ground_truth", pa.string()),
+            ("score", pa.float64()),
+        ])
+
+    def _encode_prompts(self, prompts: Dict[str, Any]) -> Dict[str, str]:
+        # Components hand out the same instruction and few-shot objects on every call, so
+        # comparing against the previous prompts is usually an identity check per field.
+        if self._last_prompts is None or prompts != self._last_prompts:
+            self._last_prompts = prompts
+            self._last_encoded_prompts = _encode_json_values(prompts)
+
+        return self._last_encoded_prompts
+
+    def _part_paths(self, kind: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, kind, "part-*.parquet")))
+
+
+def _encode_json_values(values: Dict[str, Any]) -> Dict[str, str]:
+    return {key: json.dumps(value, ensure_ascii=False, default=str) for key, value in values.items()}
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
+from uuid import uuid4
+
+from myllmet.metrics.interface import TrackerInterface
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contexts (
+    hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prompts (
+    hash TEXT PRIMARY KEY,
+    json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    id TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    logged_at REAL NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    context_hash TEXT NOT NULL REFERENCES contexts (hash),
+    ground_truth TEXT NOT NULL,
+    score REAL NOT NULL,
+    intermediates TEXT NOT NULL,
+    prompts_hash TEXT NOT NULL REFERENCES prompts (hash)
+);
+CREATE TABLE IF NOT EXISTS claim_verdicts (
+    record_id TEXT NOT NULL REFERENCES records (id),
+    position INTEGER NOT NULL,
+    claim TEXT NOT NULL,
+    verdict INTEGER NOT NULL,
+    reason TEXT,
+    PRIMARY KEY (record_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_records_run_id_score ON records (run_id, score);
+CREATE INDEX IF NOT EXISTS idx_records_score ON records (score);
+CREATE INDEX IF NOT EXISTS idx_records_logged_at ON records (logged_at);
+CREATE INDEX IF NOT EXISTS idx_claim_verdicts_claim ON claim_verdicts (claim, verdict);
+"""
+
+_RECORD_COLUMNS = "r.id, r.run_id, r.logged_at, r.question, r.answer, c.text, r.ground_truth, r.score"
+
+
+class SQLiteTracker(TrackerInterface):
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        run_id: Optional[str] = None,
+        batch_size: int = 500,
+        busy_timeout: float = 30.0,
+    ):
+        self.path = os.fspath(path)
+        self.run_id = run_id or str(uuid4())
+        self.batch_size = batch_size
+
+        # A single connection is shared under a lock; WAL lets other processes read the
+        # database while a run is writing to it.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_contexts: Dict[str, str] = {}
+        self._pending_prompts: Dict[str, str] = {}
+        self._pending_verdicts: List[Tuple[Any, ...]] = []
+        self._last_prompts: Optional[Dict[str, Any]] = None
+        self._last_prompts_hash = ""
+
+    def log(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        ground_truth: str,
+        score: float,
+        intermediates: Dict[str, Any],
+        prompts: Dict[str, Any],
+    ) -> None:
+        id_ = str(uuid4())
+        context_hash = _hash_text(context)
+        intermediates_json = json.dumps(intermediates, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._pending_contexts[context_hash] = context
+            prompts_hash = self._prompts_hash(prompts)
+            self._pending.append((
+                id_, self.run_id, time.time(), question, answer, context_hash, ground_truth, score,
+                intermediates_json, prompts_hash
+            ))
+            for position, verdict in enumerate(intermediates.get("verdicts") or []):
+                self._pending_verdicts.append(
+                    (id_, position, verdict["claim"], verdict["verdict"], verdict.get("reason"))
+                )
+
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def __enter__(self) -> "SQLiteTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def bottom_k(self, k: int, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        query = (
+            f"SELECT {_RECORD_COLUMNS} FROM records r JOIN contexts c ON c.hash = r.context_hash"
+            " WHERE r.run_id = ? ORDER BY r.score ASC, r.logged_at ASC LIMIT ?"
+        )
+        return self._query_records(query, (run_id or self.run_id, k))
+
+    def verdict_distribution(
+        self,
+        run_id: Optional[str] = None,
+        claim: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+
+        query = (
+            "SELECT v.claim, v.verdict, COUNT(*) FROM claim_verdicts v JOIN records r ON r.id = v.record_id"
+            " WHERE r.run_id = ?"
+        )
+        params: List[Any] = [run_id or self.run_id]
+        if claim is not None:
+            query += " AND v.claim = ?"
+            params.append(claim)
+        query += " GROUP BY v.claim, v.verdict ORDER BY v.claim, v.verdict"
+
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [{"claim": claim, "verdict": verdict, "count": count} for claim, verdict, count in rows]
+
+    def run_ids(self) -> List[str]:
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute("SELECT DISTINCT run_id FROM records ORDER BY run_id").fetchall()
+
+        return [run_id for (run_id,) in rows]
+
+    def to_pandas(
+        self,
+        kind: Literal["standard", "prompts", "intermediates"],
+        run_id: Optional[str] = None,
+    ) -> "pd.DataFrame":
+
+        import pandas as pd  # type: ignore[import]
+
+        params = (run_id or self.run_id,)
+        with self._lock:
+            self._flush_locked()
+            if kind == "standard":
+                rows = self._conn.execute(
+                    "SELECT r.id, r.question, r.answer, c.text, r.ground_truth, r.score"
+                    " FROM records r JOIN contexts c ON c.hash = r.context_hash"
+                    " WHERE r.run_id = ? ORDER BY r.rowid",
+                    params
+                ).fetchall()
+                return pd.DataFrame(
+                    rows,
+                    columns=["id", "question", "answer", "context", "ground_truth", "score"]
+                )
+
+            if kind == "prompts":
+                query = (
+                    "SELECT r.id, p.json FROM records r JOIN prompts p ON p.hash = r.prompts_hash"
+                    " WHERE r.run_id = ? ORDER BY r.rowid"
+                )
+            elif kind == "intermediates":
+                query = "SELECT r.id, r.intermediates FROM records r WHERE r.run_id = ? ORDER BY r.rowid"
+            else:
+                raise ValueError(f"Unknown kind: {kind}")
+            rows = self._conn.execute(query, params).fetchall()
+
+        return pd.DataFrame([{"id": id_, **json.loads(value)} for id_, value in rows])
+
+    def _prompts_hash(self, prompts: Dict[str, Any]) -> str:
+        if self._last_prompts is not None and prompts == self._last_prompts:
+            return self._last_prompts_hash
+
+        prompts_json = json.dumps(prompts, ensure_ascii=False, sort_keys=True, default=str)
+        prompts_hash = _hash_text(prompts_json)
+        self._pending_prompts[prompts_hash] = prompts_json
+        self._last_prompts = prompts
+        self._last_prompts_hash = prompts_hash
+
+        return prompts_hash
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO contexts (hash, text) VALUES (?, ?)",
+                self._pending_contexts.items()
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO prompts (hash, json) VALUES (?, ?)",
+                self._pending_prompts.items()
+            )
+            self._conn.executemany(
+                "INSERT INTO records (id, run_id, logged_at, question, answer, context_hash, ground_truth, score,"
+                " intermediates, prompts_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._pending
+            )
+            self._conn.executemany(
+                "INSERT INTO claim_verdicts (record_id, position, claim, verdict, reason) VALUES (?, ?, ?, ?, ?)",
+                self._pending_verdicts
+            )
+
+        self._pending = []
+        self._pending_contexts = {}
+        self._pending_prompts = {}
+        self._pending_verdicts = []
+
+    def _query_records(self, query: str, params: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(query, params).fetchall()
+
+        columns = ["id", "run_id", "logged_at", "question", "answer", "context", "ground_truth", "score"]
+        return [dict(zip(columns, row)) for row in rows]
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
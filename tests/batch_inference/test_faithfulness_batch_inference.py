@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+from myllmet import Faithfulness
+from myllmet.batch_inference import FaithfulnessBatchInference, LocalBatchJobRunner, LocalBatchStorage
+from myllmet.io_aws import BedrockChatClient
+
+
+def _converse_output(payload):
+    return {
+        "stopReason": "end_turn",
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": json.dumps(payload, ensure_ascii=False)}]
+            }
+        }
+    }
+
+
+def stub_handler(model_id, model_input):
+    input_json = json.loads(model_input["messages"][-1]["content"][0]["text"])
+
+    if model_id == "extractor-model":
+        if input_json["answer"] == "broken":
+            raise RuntimeError("model error")
+        return _converse_output({"claims": input_json["answer"].split(",")})
+
+    verdicts = [
+        {"claim": claim, "verdict": int(claim in input_json["context"]), "reason": "r"}
+        for claim in input_json["claims"]
+    ]
+    return _converse_output({"verdicts": verdicts})
+
+
+@pytest.fixture
+def metric(mocker):
+    return Faithfulness.from_clients(
+        claim_extractor_client=BedrockChatClient(model_id="extractor-model", bedrock_runtime_client=mocker.Mock()),
+        faithfulness_judge_client=BedrockChatClient(model_id="judge-model", bedrock_runtime_client=mocker.Mock()),
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalBatchStorage(tmp_path)
+
+
+def test_run_scores_all_records(metric, storage):
+    logged = []
+
+    class Tracker:
+        def log(self, question, answer, context, ground_truth, score, intermediates, prompts):
+            logged.append((question, score))
+
+    metric.set_tracker(Tracker())
+    batch = FaithfulnessBatchInference(metric, storage, LocalBatchJobRunner(storage, stub_handler))
+
+    records = [
+        ("q1", "a,b", "a b"),
+        ("q2", "a,c", "a b"),
+        ("q3", "broken", "a b"),
+    ]
+    result = batch.run("run-1", records)
+
+    assert result.scores == [1.0, 0.5, None]
+    assert [e.row_index for e in result.errors] == [2]
+    assert sorted(logged) == [("q1", 1.0), ("q2", 0.5)]
+
+
+def test_stages_write_jsonl_requests(metric, storage):
+    batch = FaithfulnessBatchInference(metric, storage)
+
+    input_name = batch.prepare_claim_extraction("run-1", [("q1", "a,b", "ctx")])
+    requests = [json.loads(line) for line in storage.read_lines(input_name)]
+
+    assert len(requests) == 1
+    assert requests[0]["recordId"] == "00000000000"
+    assert requests[0]["modelInput"]["inferenceConfig"] == {"temperature": 0.0}
+    assert json.loads(requests[0]["modelInput"]["messages"][-1]["content"][0]["text"]) == {
+        "question": "q1",
+        "answer": "a,b",
+    }
+
+    output_name = LocalBatchJobRunner(storage, stub_handler).run("job", "extractor-model", input_name, "run-1/out")
+    judge_input_name = batch.prepare_faithfulness_judge("run-1", output_name)
+    judge_requests = [json.loads(line) for line in storage.read_lines(judge_input_name)]
+
+    assert json.loads(judge_requests[0]["modelInput"]["messages"][-1]["content"][0]["text"]) == {
+        "context": "ctx",
+        "claims": ["a", "b"],
+    }
+
+
+def test_run_requires_job_runner(metric, storage):
+    with pytest.raises(ValueError):
+        FaithfulnessBatchInference(metric, storage).run("run-1", [])
+
+
+def test_requires_batch_capable_client(llm_client_stub_factory, storage):
+    metric = Faithfulness.from_clients(
+        claim_extractor_client=llm_client_stub_factory(return_value={"claims": []}),
+        faithfulness_judge_client=llm_client_stub_factory(return_value={"verdicts": []}),
+    )
+
+    with pytest.raises(TypeError):
+        FaithfulnessBatchInference(metric, storage).prepare_claim_extraction("run-1", [("q", "a", "c")])
+
+
+def test_judge_requests_are_chunked_and_reduced_like_online_scoring(mocker, storage):
+    from myllmet.metrics.components import ContextReducer
+
+    metric = Faithfulness.from_clients(
+        claim_extractor_client=BedrockChatClient(model_id="extractor-model", bedrock_runtime_client=mocker.Mock()),
+        faithfulness_judge_client=BedrockChatClient(model_id="judge-model", bedrock_runtime_client=mocker.Mock()),
+        kwargs_faithfulness_judge={
+            "max_claims_per_call": 1,
+            "context_reducer": ContextReducer(top_k=1, passage_chars=10, min_context_chars=0),
+        },
+    )
+    batch = FaithfulnessBatchInference(metric, storage, LocalBatchJobRunner(storage, stub_handler))
+    context = "りんごは赤い。" + "無関係な文章。" * 5 + "空は青い。"
+
+    extractor_input = batch.prepare_claim_extraction("run-1", [("q1", "りんごは赤い,空は青い", context)])
+    extractor_output = LocalBatchJobRunner(storage, stub_handler).run("job", "extractor-model", extractor_input, "out")
+    judge_input = batch.prepare_faithfulness_judge("run-1", extractor_output)
+    judge_requests = [json.loads(line) for line in storage.read_lines(judge_input)]
+
+    assert [r["recordId"] for r in judge_requests] == ["0000000c000", "0000000c001"]
+    judge_inputs = [json.loads(r["modelInput"]["messages"][-1]["content"][0]["text"]) for r in judge_requests]
+    assert judge_inputs == [
+        {"context": "りんごは赤い。", "claims": ["りんごは赤い"]},
+        {"context": "空は青い。", "claims": ["空は青い"]},
+    ]
+
+    judge_output = LocalBatchJobRunner(storage, stub_handler).run("job", "judge-model", judge_input, "judge-out")
+    result = batch.finalize("run-1", extractor_output, judge_output)
+
+    assert result.scores == [1.0]
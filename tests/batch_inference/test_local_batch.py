@@ -0,0 +1,31 @@
+import json
+
+from myllmet.batch_inference import LocalBatchJobRunner, LocalBatchStorage
+
+
+def test_storage_roundtrip(tmp_path):
+    storage = LocalBatchStorage(tmp_path)
+    storage.write_lines("run/input.jsonl", ["line1", "line2"])
+
+    assert list(storage.read_lines("run/input.jsonl")) == ["line1", "line2"]
+    assert storage.uri("run/input.jsonl") == str(tmp_path / "run" / "input.jsonl")
+
+
+def test_job_runner_records_errors_per_record(tmp_path):
+    storage = LocalBatchStorage(tmp_path)
+    storage.write_lines("in.jsonl", [
+        json.dumps({"recordId": "1", "modelInput": {"ok": True}}),
+        json.dumps({"recordId": "2", "modelInput": {"ok": False}}),
+    ])
+
+    def handler(model_id, model_input):
+        if not model_input["ok"]:
+            raise ValueError("bad input")
+        return {"model": model_id}
+
+    output_name = LocalBatchJobRunner(storage, handler).run("job", "model", "in.jsonl", "out")
+    outputs = [json.loads(line) for line in storage.read_lines(output_name)]
+
+    assert output_name == "out/in.jsonl.out"
+    assert outputs[0]["modelOutput"] == {"model": "model"}
+    assert "bad input" in outputs[1]["error"]["errorMessage"]
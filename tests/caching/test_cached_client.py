@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from myllmet.caching import CachedLLMClient, SQLiteCacheStore
+from myllmet.io_aws import BedrockChatClient
+
+
+def _invoke(client, input_json, instruction="instruction"):
+    return client.invoke(
+        instruction=instruction,
+        fewshot_examples=[],
+        input_json=input_json,
+        output_json_schema={"type": "object"}
+    )
+
+
+def test_second_identical_call_is_served_from_cache(llm_client_stub_factory, tmp_path):
+    inner = llm_client_stub_factory(return_value={"claims": ["c1"]})
+    client = CachedLLMClient(inner, SQLiteCacheStore(tmp_path / "cache.sqlite3"))
+
+    first = _invoke(client, {"question": "q"})
+    inner.received_invoke_params = None
+    second = _invoke(client, {"question": "q"})
+
+    assert first == second == {"claims": ["c1"]}
+    assert inner.received_invoke_params is None
+    assert (client.hits, client.misses) == (1, 1)
+
+
+def test_different_inputs_miss(llm_client_stub_factory, tmp_path):
+    inner = llm_client_stub_factory(return_value={"claims": ["c1"]})
+    client = CachedLLMClient(inner, SQLiteCacheStore(tmp_path / "cache.sqlite3"))
+
+    _invoke(client, {"question": "q1"})
+    _invoke(client, {"question": "q2"})
+    _invoke(client, {"question": "q1"}, instruction="other instruction")
+
+    assert (client.hits, client.misses) == (0, 3)
+
+
+def test_rerun_with_new_store_instance_costs_no_calls(llm_client_stub_factory, tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    inner = llm_client_stub_factory(return_value={"claims": ["c1"]})
+    _invoke(CachedLLMClient(inner, SQLiteCacheStore(path)), {"question": "q"})
+
+    inner.received_invoke_params = None
+    rerun = CachedLLMClient(inner, SQLiteCacheStore(path))
+    _invoke(rerun, {"question": "q"})
+
+    assert inner.received_invoke_params is None
+    assert rerun.hits == 1
+
+
+def test_key_uses_bedrock_request_rendering(mocker, tmp_path):
+    store = SQLiteCacheStore(tmp_path / "cache.sqlite3")
+    cold = CachedLLMClient(
+        BedrockChatClient(model_id="model-a", bedrock_runtime_client=mocker.Mock()),
+        store
+    )
+    warm = CachedLLMClient(
+        BedrockChatClient(model_id="model-a", bedrock_runtime_client=mocker.Mock(), inference_config={"topP": 0.5}),
+        store
+    )
+    other_model = CachedLLMClient(
+        BedrockChatClient(model_id="model-b", bedrock_runtime_client=mocker.Mock()),
+        store
+    )
+
+    args = ("instruction", [], {"question": "q"}, {"type": "object"})
+    keys = {cold.cache_key(*args), warm.cache_key(*args), other_model.cache_key(*args)}
+
+    assert len(keys) == 3
+
+
+def test_ainvoke_is_cached(async_llm_client_stub_factory, tmp_path):
+    inner = async_llm_client_stub_factory(return_value={"claims": ["c1"]})
+    client = CachedLLMClient(inner, SQLiteCacheStore(tmp_path / "cache.sqlite3"))
+
+    async def run():
+        for _ in range(2):
+            await client.ainvoke(
+                instruction="instruction",
+                fewshot_examples=[],
+                input_json={"question": "q"},
+                output_json_schema={"type": "object"}
+            )
+
+    asyncio.run(run())
+
+    assert (client.hits, client.misses) == (1, 1)
+
+
+def test_invalid_response_is_not_served_from_cache(tmp_path):
+    from jsonschema import ValidationError
+
+    from myllmet.metrics.components import FaithfulnessJudge
+    from myllmet.metrics.components.faithfulness_judge import OUTPUT_JSON_SCHEMA
+
+    responses = [
+        {"verdicts": "not a list"},
+        {"verdicts": [{"claim": "c1", "verdict": 1, "reason": "r"}]},
+        {"verdicts": [{"claim": "c1", "verdict": 1, "reason": "r"}, {"claim": "c2", "verdict": 0, "reason": "r"}]},
+    ]
+
+    class Inner:
+        calls = 0
+
+        def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+            Inner.calls += 1
+            return responses[Inner.calls - 1]
+
+    inner = Inner()
+    client = CachedLLMClient(
+        inner,
+        SQLiteCacheStore(tmp_path / "cache.sqlite3"),
+        validate=FaithfulnessJudge.check_verdict_count
+    )
+
+    def judge():
+        return client.invoke(
+            instruction="instruction",
+            fewshot_examples=[],
+            input_json={"context": "ctx", "claims": ["c1", "c2"]},
+            output_json_schema=OUTPUT_JSON_SCHEMA
+        )
+
+    with pytest.raises(ValidationError):
+        judge()
+    with pytest.raises(ValueError):
+        judge()
+    assert len(judge()["verdicts"]) == 2
+    assert len(judge()["verdicts"]) == 2
+
+    assert Inner.calls == 3
+    assert (client.hits, client.misses) == (1, 3)
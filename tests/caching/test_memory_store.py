@@ -0,0 +1,21 @@
+from myllmet.caching import MemoryCacheStore
+
+
+def test_get_set_roundtrip():
+    store = MemoryCacheStore()
+    store.set("key", "value")
+
+    assert store.get("key") == "value"
+    assert store.get("missing") is None
+
+
+def test_evicts_least_recently_used():
+    store = MemoryCacheStore(max_entries=2)
+    store.set("a", "1")
+    store.set("b", "2")
+    store.get("a")
+    store.set("c", "3")
+
+    assert store.get("a") == "1"
+    assert store.get("b") is None
+    assert len(store) == 2
@@ -0,0 +1,71 @@
+import pytest
+
+from myllmet.caching import SQLiteCacheStore
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "cache.sqlite3"
+
+
+def test_get_set_roundtrip(store_path):
+    store = SQLiteCacheStore(store_path)
+
+    assert store.get("key") is None
+    store.set("key", '{"claims": []}')
+
+    assert store.get("key") == '{"claims": []}'
+    assert len(store) == 1
+
+
+def test_entries_persist_across_instances(store_path):
+    SQLiteCacheStore(store_path).set("key", "value")
+
+    assert SQLiteCacheStore(store_path).get("key") == "value"
+
+
+def test_expired_entry_is_a_miss(store_path, mocker):
+    store = SQLiteCacheStore(store_path, max_age=10)
+    mocker.patch("time.time", return_value=1000.0)
+    store.set("key", "value")
+
+    mocker.patch("time.time", return_value=1011.0)
+    assert store.get("key") is None
+    assert len(store) == 0
+
+
+def test_evict_by_max_entries_keeps_recently_accessed(store_path, mocker):
+    store = SQLiteCacheStore(store_path, max_entries=2)
+    clock = mocker.patch("time.time")
+    for i, key in enumerate(["a", "b", "c"]):
+        clock.return_value = float(i)
+        store.set(key, "value")
+
+    clock.return_value = 10.0
+    store.get("a")
+    store.evict()
+
+    assert store.get("a") == "value"
+    assert store.get("b") is None
+    assert store.get("c") == "value"
+
+
+def test_evict_by_max_bytes(store_path, mocker):
+    store = SQLiteCacheStore(store_path, max_bytes=10)
+    clock = mocker.patch("time.time")
+    for i, key in enumerate(["a", "b", "c"]):
+        clock.return_value = float(i)
+        store.set(key, "12345")
+
+    removed = store.evict()
+
+    assert removed == 1
+    assert store.get("a") is None
+
+
+def test_eviction_runs_periodically_on_set(store_path):
+    store = SQLiteCacheStore(store_path, max_entries=1, evict_every=2)
+    store.set("a", "value")
+    store.set("b", "value")
+
+    assert len(store) == 1
@@ -1,6 +1,6 @@
 import pytest
 
-from myllmet.metrics.interface import LLMClientInterface
+from myllmet.metrics.interface import AsyncLLMClientInterface, LLMClientInterface
 
 
 @pytest.fixture
@@ -20,3 +20,22 @@ def llm_client_stub_factory():
             return self._return_value
 
     return DummyLLMClient
+
+
+@pytest.fixture
+def async_llm_client_stub_factory():
+    class DummyAsyncLLMClient(AsyncLLMClientInterface):
+        def __init__(self, return_value):
+            self._return_value = return_value
+            self.received_invoke_params = None
+
+        async def ainvoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+            self.received_invoke_params = {
+                "instruction": instruction,
+                "fewshot_examples": fewshot_examples,
+                "input_json": input_json,
+                "output_json_schema": output_json_schema,
+            }
+            return self._return_value
+
+    return DummyAsyncLLMClient
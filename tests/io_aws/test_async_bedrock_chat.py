@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from myllmet.io_aws import AsyncBedrockChatClient
+
+
+def _response(text):
+    return {
+        "stopReason": "end_turn",
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": text}]
+            }
+        }
+    }
+
+
+@pytest.fixture
+def chat_client(mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse = mocker.AsyncMock()
+    return AsyncBedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client)
+
+
+@pytest.fixture
+def json_schema():
+    return {
+        "type": "object",
+        "properties": {
+            "output": {"type": "string"}
+        },
+        "required": ["output"]
+    }
+
+
+def test_ainvoke_valid(chat_client, json_schema):
+    chat_client._client.converse.return_value = _response(json.dumps({"output": "output_text"}))
+
+    actual = asyncio.run(chat_client.ainvoke(
+        instruction="instruction",
+        fewshot_examples=[],
+        input_json={"input": "input_text"},
+        output_json_schema=json_schema
+    ))
+
+    assert actual == {"output": "output_text"}
+    assert chat_client._client.converse.await_args.kwargs["modelId"] == "dummy-model"
+
+
+def test_ainvoke_throttling_retry_uses_async_sleep(chat_client, json_schema, mocker):
+    chat_client._client.converse.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "converse"),
+        _response(json.dumps({"output": "output_text"})),
+    ]
+    async_sleep = mocker.patch("asyncio.sleep", new=mocker.AsyncMock())
+    blocking_sleep = mocker.patch("time.sleep")
+
+    asyncio.run(chat_client.ainvoke(
+        instruction="instruction",
+        fewshot_examples=[],
+        input_json={"input": "input_text"},
+        output_json_schema=json_schema
+    ))
+
+    assert chat_client._client.converse.await_count == 2
+    async_sleep.assert_awaited_once()
+    blocking_sleep.assert_not_called()
+
+
+def test_ainvoke_non_throttling_error_raises(chat_client, json_schema):
+    chat_client._client.converse.side_effect = ClientError({"Error": {"Code": "ValidationException"}}, "converse")
+
+    with pytest.raises(ClientError):
+        asyncio.run(chat_client.ainvoke(
+            instruction="instruction",
+            fewshot_examples=[],
+            input_json={"input": "input_text"},
+            output_json_schema=json_schema
+        ))
+
+
+def test_owned_client_uses_region_and_pool_config(monkeypatch):
+    pytest.importorskip("aiobotocore")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+    async def run():
+        async with AsyncBedrockChatClient(
+            model_id="dummy-model",
+            region_name="eu-west-1",
+            max_pool_connections=128,
+            read_timeout=30.0
+        ) as chat_client:
+            return chat_client._client.meta
+
+    meta = asyncio.run(run())
+
+    assert meta.region_name == "eu-west-1"
+    assert meta.config.max_pool_connections == 128
+    assert meta.config.read_timeout == 30.0
+    assert meta.config.retries == {"total_max_attempts": 1, "mode": "standard"}
@@ -0,0 +1,58 @@
+import pytest
+
+from myllmet.io_aws import BedrockBatchJobRunner, S3BatchStorage
+
+
+@pytest.fixture
+def s3_client(mocker):
+    return mocker.Mock()
+
+
+def test_s3_storage_uri_and_upload(s3_client):
+    storage = S3BatchStorage("bucket", prefix="/evals/", s3_client=s3_client)
+    uploaded = {}
+    s3_client.upload_fileobj.side_effect = lambda f, bucket, key: uploaded.update({key: f.read()})
+
+    storage.write_lines("run/input.jsonl", ["a", "b"])
+
+    assert storage.uri("run/input.jsonl") == "s3://bucket/evals/run/input.jsonl"
+    assert uploaded == {"evals/run/input.jsonl": b"a\nb\n"}
+
+
+def test_s3_storage_read_lines(s3_client, mocker):
+    body = mocker.Mock()
+    body.iter_lines.return_value = iter([b"a", b"", b"b"])
+    s3_client.get_object.return_value = {"Body": body}
+    storage = S3BatchStorage("bucket", s3_client=s3_client)
+
+    assert list(storage.read_lines("out.jsonl")) == ["a", "b"]
+    s3_client.get_object.assert_called_once_with(Bucket="bucket", Key="out.jsonl")
+
+
+def test_job_runner_polls_until_completed(s3_client, mocker):
+    bedrock = mocker.Mock()
+    bedrock.create_model_invocation_job.return_value = {"jobArn": "arn:aws:bedrock:1:job/abc"}
+    bedrock.get_model_invocation_job.side_effect = [{"status": "InProgress"}, {"status": "Completed"}]
+    mocker.patch("time.sleep")
+    runner = BedrockBatchJobRunner(
+        S3BatchStorage("bucket", s3_client=s3_client),
+        role_arn="role",
+        bedrock_client=bedrock
+    )
+
+    output_name = runner.run("job", "model", "run/input.jsonl", "run/output")
+
+    assert output_name == "run/output/abc/input.jsonl.out"
+    kwargs = bedrock.create_model_invocation_job.call_args.kwargs
+    assert kwargs["inputDataConfig"]["s3InputDataConfig"]["s3Uri"] == "s3://bucket/run/input.jsonl"
+    assert kwargs["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"] == "s3://bucket/run/output/"
+
+
+def test_job_runner_raises_on_failure(s3_client, mocker):
+    bedrock = mocker.Mock()
+    bedrock.create_model_invocation_job.return_value = {"jobArn": "arn/abc"}
+    bedrock.get_model_invocation_job.return_value = {"status": "Failed", "message": "boom"}
+    runner = BedrockBatchJobRunner(S3BatchStorage("bucket", s3_client=s3_client), "role", bedrock_client=bedrock)
+
+    with pytest.raises(RuntimeError):
+        runner.run("job", "model", "input.jsonl", "output")
@@ -4,6 +4,8 @@ import pytest
 from botocore.exceptions import ClientError
 
 from myllmet.io_aws import BedrockChatClient
+from myllmet.metrics._call_metrics import collect_call_metrics
+from myllmet.metrics.interface import TruncatedResponseError
 
 
 @pytest.fixture
@@ -134,3 +136,207 @@ def test_invoke_throttling_retry(chat_client, json_schema, mocker):
     )
 
     assert chat_client._client.converse.call_count == 2
+
+
+def test_invoke_sends_inference_config(json_schema, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = {
+        "stopReason": "end_turn",
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": json.dumps({"output": "output_text"})}]
+            }
+        }
+    }
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        inference_config={"temperature": 0.5, "maxTokens": 1024}
+    )
+
+    chat_client.invoke(
+        instruction="instruction",
+        fewshot_examples=[],
+        input_json={"input": "input_text"},
+        output_json_schema=json_schema
+    )
+
+    assert fake_client.converse.call_args.kwargs["inferenceConfig"] == {"temperature": 0.5, "maxTokens": 1024}
+
+
+@pytest.fixture
+def fewshot_examples():
+    return [{"user": {"input": "example"}, "assistant": {"output": "example"}}]
+
+
+@pytest.fixture
+def converse_response():
+    return {
+        "stopReason": "end_turn",
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": json.dumps({"output": "output_text"})}]
+            }
+        },
+        "usage": {
+            "inputTokens": 10,
+            "outputTokens": 5,
+            "cacheReadInputTokens": 100,
+            "cacheWriteInputTokens": 0
+        }
+    }
+
+
+def test_invoke_with_prompt_caching_places_cache_points(json_schema, fewshot_examples, converse_response, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = converse_response
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        prompt_caching=True
+    )
+
+    chat_client.invoke(
+        instruction="instruction",
+        fewshot_examples=fewshot_examples,
+        input_json={"input": "input_text"},
+        output_json_schema=json_schema
+    )
+
+    kwargs = fake_client.converse.call_args.kwargs
+    assert kwargs["system"][-1] == {"cachePoint": {"type": "default"}}
+    assert kwargs["messages"][1]["role"] == "assistant"
+    assert kwargs["messages"][1]["content"][-1] == {"cachePoint": {"type": "default"}}
+    assert kwargs["messages"][-1]["content"] == [{"text": json.dumps({"input": "input_text"})}]
+
+
+def test_invoke_without_prompt_caching_has_no_cache_points(json_schema, fewshot_examples, converse_response, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = converse_response
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client)
+
+    chat_client.invoke(
+        instruction="instruction",
+        fewshot_examples=fewshot_examples,
+        input_json={"input": "input_text"},
+        output_json_schema=json_schema
+    )
+
+    kwargs = fake_client.converse.call_args.kwargs
+    assert "cachePoint" not in json.dumps(kwargs)
+    assert kwargs["messages"] == chat_client._build_messages(fewshot_examples, {"input": "input_text"})
+
+
+def test_invoke_reuses_serialized_prompt_prefix(json_schema, fewshot_examples, converse_response, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = converse_response
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, prompt_caching=True)
+    build_system_prompt = mocker.spy(chat_client, "_build_system_prompt")
+
+    for i in range(3):
+        chat_client.invoke(
+            instruction="instruction",
+            fewshot_examples=fewshot_examples,
+            input_json={"input": f"input_text_{i}"},
+            output_json_schema=json_schema
+        )
+
+    assert build_system_prompt.call_count == 1
+    assert len(fake_client.converse.call_args_list[0].kwargs["messages"]) == 3
+    assert fake_client.converse.call_args_list[2].kwargs["messages"][-1]["content"][0]["text"] == (
+        json.dumps({"input": "input_text_2"})
+    )
+
+
+def test_invoke_records_cache_token_usage(json_schema, converse_response, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = converse_response
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, prompt_caching=True)
+
+    for _ in range(2):
+        chat_client.invoke(
+            instruction="instruction",
+            fewshot_examples=[],
+            input_json={"input": "input_text"},
+            output_json_schema=json_schema
+        )
+
+    assert chat_client.usage_totals == {
+        "input_tokens": 20,
+        "output_tokens": 10,
+        "cache_read_input_tokens": 200,
+        "cache_write_input_tokens": 0,
+    }
+
+
+def test_invoke_reports_call_metrics(json_schema, converse_response, mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "converse"),
+        {**converse_response, "metrics": {"latencyMs": 120}},
+    ]
+    mocker.patch("time.sleep", lambda x: None)
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client)
+
+    with collect_call_metrics() as calls:
+        chat_client.invoke(
+            instruction="instruction",
+            fewshot_examples=[],
+            input_json={"input": "input_text"},
+            output_json_schema=json_schema
+        )
+
+    assert len(calls) == 1
+    assert calls[0]["input_tokens"] == 10
+    assert calls[0]["output_tokens"] == 5
+    assert calls[0]["cache_read_input_tokens"] == 100
+    assert calls[0]["latency_ms"] == 120
+    assert calls[0]["attempts"] == 2
+    assert calls[0]["backoff_seconds"] > 0
+
+
+def test_invoke_max_tokens_raises_truncated_response_error(chat_client, json_schema, mocker):
+    client_return = {
+        "stopReason": "max_tokens",
+        "output": {"message": {"role": "assistant", "content": [{"text": '{"output": "out'}]}}
+    }
+    mocker.patch.object(chat_client._client, "converse", return_value=client_return)
+
+    with pytest.raises(TruncatedResponseError):
+        chat_client.invoke(
+            instruction="instruction",
+            fewshot_examples=[],
+            input_json={"input": "input_text"},
+            output_json_schema=json_schema
+        )
+
+
+def test_prompt_caching_places_cache_point_after_judge_context(converse_response, mocker):
+    from myllmet.metrics.components import FaithfulnessJudge
+
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = {
+        **converse_response,
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": json.dumps({"verdicts": [{"claim": "c1", "verdict": 1, "reason": "r"}]})}]
+            }
+        }
+    }
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, prompt_caching=True)
+
+    FaithfulnessJudge(client=chat_client).invoke("共有コンテキスト", ["c1"])
+
+    content = fake_client.converse.call_args.kwargs["messages"][-1]["content"]
+    assert content == [
+        {"text": '{"context": "共有コンテキスト", '},
+        {"cachePoint": {"type": "default"}},
+        {"text": '"claims": ["c1"]}'},
+    ]
+    assert content[0]["text"] + content[2]["text"] == json.dumps(
+        {"context": "共有コンテキスト", "claims": ["c1"]},
+        ensure_ascii=False
+    )
@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from myllmet.io_aws import BedrockChatClient
+from myllmet.metrics.interface import Deadline
+
+
+def _response(output):
+    return {
+        "stopReason": "end_turn",
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"text": json.dumps({"output": output})}]
+            }
+        }
+    }
+
+
+def _invoke(chat_client, deadline=None):
+    return chat_client.invoke(
+        instruction="instruction",
+        fewshot_examples=[],
+        input_json={"input": "input_text"},
+        output_json_schema={"type": "object"},
+        deadline=deadline
+    )
+
+
+def test_call_timeout_raises(mocker):
+    release = threading.Event()
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = lambda **kwargs: release.wait(1.0) and _response("late")
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, call_timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        _invoke(chat_client)
+    release.set()
+
+    assert chat_client.hedge_stats["timeouts"] == 1
+
+
+def test_expired_deadline_skips_call(mocker):
+    fake_client = mocker.Mock()
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client)
+
+    with pytest.raises(TimeoutError):
+        _invoke(chat_client, deadline=Deadline(time.monotonic() - 1))
+
+    fake_client.converse.assert_not_called()
+
+
+def test_deadline_bounds_throttling_backoff(mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = ClientError({"Error": {"Code": "ThrottlingException"}}, "converse")
+    mocker.patch("random.uniform", return_value=5.0)
+    sleep = mocker.patch("time.sleep")
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client)
+
+    with pytest.raises(TimeoutError):
+        _invoke(chat_client, deadline=Deadline.after(1.0))
+
+    sleep.assert_not_called()
+
+
+def test_hedged_request_wins_over_slow_primary(mocker):
+    release = threading.Event()
+    calls = []
+
+    def converse(**kwargs):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            release.wait(1.0)
+            return _response("primary")
+        return _response("hedge")
+
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = converse
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        hedge_percentile=50,
+        hedge_min_samples=1
+    )
+    chat_client._latencies.extend([0.01, 0.01])
+
+    actual = _invoke(chat_client)
+    release.set()
+
+    assert actual == {"output": "hedge"}
+    assert chat_client.hedge_stats == {"hedges_issued": 1, "hedges_won": 1, "timeouts": 0}
+
+
+def test_no_hedge_before_enough_samples(mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = _response("primary")
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        hedge_percentile=90,
+        hedge_min_samples=5
+    )
+
+    for _ in range(3):
+        _invoke(chat_client)
+
+    assert fake_client.converse.call_count == 3
+    assert chat_client.hedge_stats["hedges_issued"] == 0
+
+
+def test_hung_calls_exhausting_the_pool_fail_fast(mocker):
+    release = threading.Event()
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = lambda **kwargs: release.wait(5.0) and _response("late")
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        call_timeout=0.05,
+        executor_max_workers=2
+    )
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            _invoke(chat_client)
+    assert chat_client.abandoned_calls == 2
+
+    started_at = time.monotonic()
+    with pytest.raises(TimeoutError, match="saturated"):
+        _invoke(chat_client)
+    assert time.monotonic() - started_at < 0.05
+    assert fake_client.converse.call_count == 2
+
+    release.set()
+    chat_client._executor.shutdown(wait=True)
+    chat_client._executor = None
+    assert chat_client.abandoned_calls == 0
+    assert _invoke(chat_client) == {"output": "late"}
+
+
+def test_pooled_client_read_timeout_follows_call_timeout(mocker, monkeypatch):
+    from myllmet.io_aws import _client_pool
+
+    monkeypatch.setattr(_client_pool, "_clients", {})
+    boto3_client = mocker.patch("boto3.client")
+
+    BedrockChatClient(model_id="dummy-model", call_timeout=5.0)
+
+    assert boto3_client.call_args.kwargs["config"].read_timeout == 5.0
+
+
+def test_no_hedge_while_primary_waits_for_rate_limiter(mocker):
+    from myllmet.io_aws import AdaptiveRateLimiter
+
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = _response("primary")
+    limiter = AdaptiveRateLimiter(max_concurrency=1)
+    limiter.acquire()
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        rate_limiter=limiter,
+        hedge_percentile=50,
+        hedge_min_samples=1
+    )
+    chat_client._latencies.extend([0.01, 0.01])
+
+    timer = threading.Timer(0.2, limiter.release)
+    timer.start()
+    actual = _invoke(chat_client)
+    timer.join()
+
+    assert actual == {"output": "primary"}
+    assert fake_client.converse.call_count == 1
+    assert chat_client.hedge_stats["hedges_issued"] == 0
+    # Latency is measured from the send, not from when the call started waiting for the limiter.
+    assert chat_client._latencies[-1] < 0.1
+
+
+def test_call_abandoned_while_waiting_for_rate_limiter_is_not_sent(mocker):
+    from myllmet.io_aws import AdaptiveRateLimiter
+
+    fake_client = mocker.Mock()
+    fake_client.converse.return_value = _response("late")
+    limiter = AdaptiveRateLimiter(max_concurrency=1)
+    limiter.acquire()
+    chat_client = BedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        rate_limiter=limiter,
+        call_timeout=0.05
+    )
+
+    with pytest.raises(TimeoutError):
+        _invoke(chat_client)
+    limiter.release()
+    chat_client._executor.shutdown(wait=True)
+
+    fake_client.converse.assert_not_called()
+    assert limiter.in_flight == 0
@@ -0,0 +1,130 @@
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+from myllmet.io_aws import BedrockChatClient, _client_pool, get_runtime_client, prewarm_client
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(_client_pool, "_clients", {})
+
+
+@pytest.fixture
+def boto3_client(mocker):
+    return mocker.patch("boto3.client", side_effect=lambda *args, **kwargs: mocker.Mock())
+
+
+def test_get_runtime_client_shares_client_per_key(boto3_client):
+    client = get_runtime_client(region_name="us-east-1", max_pool_connections=32)
+
+    assert get_runtime_client(region_name="us-east-1", max_pool_connections=32) is client
+    assert get_runtime_client(region_name="us-west-2", max_pool_connections=32) is not client
+    assert get_runtime_client(region_name="us-east-1", max_pool_connections=16) is not client
+    assert boto3_client.call_count == 3
+
+    config = boto3_client.call_args_list[0].kwargs["config"]
+    assert config.max_pool_connections == 32
+    assert config.tcp_keepalive is True
+    assert config.connect_timeout == 60
+    assert config.read_timeout == 60
+    assert config.retries == {"total_max_attempts": 1, "mode": "standard"}
+
+
+class _ThrottlingBody:
+    def stream(self, **kwargs):
+        yield b'{"message": "Too many requests"}'
+
+
+@pytest.mark.parametrize("failure", ["throttle", "read_timeout"])
+def test_pooled_client_sends_one_http_attempt_per_call(monkeypatch, failure):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    client = get_runtime_client(region_name="us-east-1")
+    attempts = []
+
+    def send(request, **kwargs):
+        attempts.append(request.url)
+        if failure == "read_timeout":
+            raise ReadTimeoutError(endpoint_url=request.url)
+        return AWSResponse(request.url, 429, {"x-amzn-ErrorType": "ThrottlingException"}, _ThrottlingBody())
+
+    client.meta.events.register("before-send.bedrock-runtime.Converse", send)
+
+    with pytest.raises((ClientError, ReadTimeoutError)):
+        client.converse(modelId="model", messages=[{"role": "user", "content": [{"text": "hi"}]}])
+
+    assert len(attempts) == 1
+
+
+def test_get_runtime_client_uses_given_session(mocker, boto3_client):
+    session = mocker.Mock()
+
+    client = get_runtime_client(session=session, read_timeout=30.0)
+
+    assert client is session.client.return_value
+    assert get_runtime_client(session=session, read_timeout=30.0) is client
+    assert session.client.call_args.kwargs["config"].read_timeout == 30.0
+    boto3_client.assert_not_called()
+
+
+def test_get_runtime_client_rejects_invalid_pool_size(boto3_client):
+    with pytest.raises(ValueError):
+        get_runtime_client(max_pool_connections=0)
+
+
+def test_prewarm_client_sends_read_only_requests(mocker):
+    client = mocker.Mock()
+
+    assert prewarm_client(client, connections=4) == 4
+    assert client.list_async_invokes.call_count == 4
+    client.converse.assert_not_called()
+
+
+def test_prewarm_client_ignores_error_responses(mocker):
+    client = mocker.Mock()
+    client.list_async_invokes.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException"}},
+        "ListAsyncInvokes"
+    )
+
+    assert prewarm_client(client, connections=2) == 2
+
+
+def test_prewarm_client_counts_connection_failures(mocker):
+    client = mocker.Mock()
+    client.list_async_invokes.side_effect = EndpointConnectionError(endpoint_url="https://example.com")
+
+    assert prewarm_client(client, connections=2) == 0
+
+
+def test_get_runtime_client_prewarms_new_client(mocker, boto3_client):
+    prewarm = mocker.patch.object(_client_pool, "prewarm_client")
+
+    client = get_runtime_client(max_pool_connections=4, prewarm_connections=8)
+
+    prewarm.assert_called_once_with(client, 4)
+
+
+def test_bedrock_chat_clients_share_pooled_client(boto3_client):
+    first = BedrockChatClient(model_id="model-a", region_name="us-east-1")
+    second = BedrockChatClient(model_id="model-b", region_name="us-east-1")
+
+    assert first._client is second._client
+    assert boto3_client.call_args.kwargs["config"].max_pool_connections == 64
+
+
+def test_build_client_config_supports_config_subclasses():
+    from botocore.config import Config
+
+    from myllmet.io_aws._client_pool import build_client_config
+
+    class SubConfig(Config):
+        pass
+
+    config = build_client_config(max_pool_connections=128, read_timeout=5.0, config_class=SubConfig)
+
+    assert isinstance(config, SubConfig)
+    assert config.max_pool_connections == 128
+    assert config.read_timeout == 5.0
+    assert config.retries == {"total_max_attempts": 1, "mode": "standard"}
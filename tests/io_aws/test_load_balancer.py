@@ -0,0 +1,189 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from myllmet.io_aws import LoadBalancedChatClient, _client_pool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class StubBackend:
+    def __init__(self, model_id, errors=()):
+        self.model_id = model_id
+        self.errors = list(errors)
+        self.calls = 0
+
+    def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"backend": self.model_id}
+
+
+def _throttle():
+    return ClientError({"Error": {"Code": "ThrottlingException"}}, "converse")
+
+
+def _invoke(client):
+    return client.invoke(instruction="i", fewshot_examples=[], input_json={}, output_json_schema={})
+
+
+def test_least_outstanding_spreads_requests_by_weight():
+    backends = [StubBackend("a"), StubBackend("b")]
+    client = LoadBalancedChatClient(backends, weights=[3, 1])
+
+    for _ in range(8):
+        _invoke(client)
+
+    assert [b.calls for b in backends] == [6, 2]
+
+
+def test_least_outstanding_prefers_idle_backend():
+    backends = [StubBackend("a"), StubBackend("b")]
+    client = LoadBalancedChatClient(backends)
+    client._backends[0].outstanding = 2
+
+    assert _invoke(client) == {"backend": "b"}
+
+
+def test_weighted_routing_uses_weights(mocker):
+    backends = [StubBackend("a"), StubBackend("b")]
+    client = LoadBalancedChatClient(backends, weights=[1, 9], routing="weighted")
+    choices = mocker.patch("random.choices", side_effect=lambda items, weights: [items[1]])
+
+    assert _invoke(client) == {"backend": "b"}
+    assert choices.call_args.kwargs["weights"] == [1, 9]
+
+
+def test_throttled_backend_is_ejected_and_request_fails_over():
+    clock = FakeClock()
+    backends = [StubBackend("a", errors=[_throttle()]), StubBackend("b")]
+    client = LoadBalancedChatClient(backends, ejection_seconds=5.0, clock=clock, sleep=clock.sleep)
+
+    assert _invoke(client) == {"backend": "b"}
+    assert _invoke(client) == {"backend": "b"}
+
+    health = {h["name"]: h for h in client.health}
+    assert health["0:a"]["available"] is False
+    assert health["0:a"]["throttles"] == 1
+    assert health["1:b"]["successes"] == 2
+
+    clock.now = 5.0
+    assert client.health[0]["available"] is True
+
+
+def test_errors_eject_backend_after_threshold():
+    clock = FakeClock()
+    error = ClientError({"Error": {"Code": "ServiceUnavailableException"}}, "converse")
+    backends = [StubBackend("a", errors=[error, error]), StubBackend("b", errors=[error])]
+    client = LoadBalancedChatClient(backends, failure_threshold=2, clock=clock, sleep=clock.sleep)
+
+    assert _invoke(client)["backend"] in ("a", "b")
+    assert [h["available"] for h in client.health] == [False, True]
+    assert client.health[0]["ejections"] == 1
+
+
+def test_all_backends_ejected_waits_for_first_to_recover():
+    clock = FakeClock()
+    backends = [StubBackend("a", errors=[_throttle()]), StubBackend("b", errors=[_throttle()])]
+    client = LoadBalancedChatClient(backends, ejection_seconds=5.0, clock=clock, sleep=clock.sleep)
+
+    assert _invoke(client)["backend"] in ("a", "b")
+    assert clock.now == 5.0
+
+
+def test_exhausted_attempts_raise_last_error():
+    backends = [StubBackend("a", errors=[_throttle()] * 10)]
+    clock = FakeClock()
+    client = LoadBalancedChatClient(backends, max_attempts=3, clock=clock, sleep=clock.sleep)
+
+    with pytest.raises(ClientError):
+        _invoke(client)
+    assert backends[0].calls == 3
+
+
+def test_request_errors_are_not_retried():
+    backends = [StubBackend("a", errors=[ValueError("bad output")]), StubBackend("b")]
+    client = LoadBalancedChatClient(backends)
+
+    with pytest.raises(ValueError):
+        _invoke(client)
+    assert client.health[0]["failures"] == 0
+    assert client.health[0]["outstanding"] == 0
+
+
+def test_model_id_includes_all_backend_models():
+    client = LoadBalancedChatClient([StubBackend("m2"), StubBackend("m1"), StubBackend("m1")])
+
+    assert client.model_id == "m1|m2"
+
+
+def test_from_regions_builds_fail_fast_backends(mocker, monkeypatch):
+    monkeypatch.setattr(_client_pool, "_clients", {})
+    boto3_client = mocker.patch("boto3.client", side_effect=lambda *args, **kwargs: mocker.Mock())
+
+    client = LoadBalancedChatClient.from_regions([("us-east-1", "model-a"), ("us-west-2", "model-a")])
+
+    assert [h["name"] for h in client.health] == ["us-east-1/model-a", "us-west-2/model-a"]
+    assert [b.client.max_attempts for b in client._backends] == [1, 1]
+    assert [c.kwargs["region_name"] for c in boto3_client.call_args_list] == ["us-east-1", "us-west-2"]
+
+
+def test_validation_errors_are_raised_without_failover_or_ejection():
+    error = ClientError(
+        {"Error": {"Code": "ValidationException"}, "ResponseMetadata": {"HTTPStatusCode": 400}},
+        "converse"
+    )
+    backends = [StubBackend("a", errors=[error] * 10), StubBackend("b", errors=[error] * 10)]
+    client = LoadBalancedChatClient(backends, failure_threshold=1)
+
+    with pytest.raises(ClientError):
+        _invoke(client)
+
+    assert sum(b.calls for b in backends) == 1
+    assert all(h["available"] and h["failures"] == 0 and h["outstanding"] == 0 for h in client.health)
+
+
+def test_server_errors_fail_over():
+    error = ClientError(
+        {"Error": {"Code": "InternalFailure"}, "ResponseMetadata": {"HTTPStatusCode": 503}},
+        "converse"
+    )
+    backends = [StubBackend("a", errors=[error]), StubBackend("b")]
+    client = LoadBalancedChatClient(backends)
+
+    assert _invoke(client) == {"backend": "b"}
+    assert client.health[0]["failures"] == 1
+
+
+def test_expired_caller_deadline_is_not_a_backend_failure():
+    from myllmet.metrics.interface import Deadline
+
+    class ExpiringBackend(StubBackend):
+        def invoke(self, instruction, fewshot_examples, input_json, output_json_schema, deadline=None):
+            self.calls += 1
+            deadline.expires_at = 0.0
+            raise TimeoutError("Deadline exceeded.")
+
+    backends = [ExpiringBackend("a"), ExpiringBackend("b")]
+    client = LoadBalancedChatClient(backends, failure_threshold=1)
+
+    with pytest.raises(TimeoutError):
+        client.invoke(
+            instruction="i",
+            fewshot_examples=[],
+            input_json={},
+            output_json_schema={},
+            deadline=Deadline.after(60)
+        )
+
+    assert sum(b.calls for b in backends) == 1
+    assert all(h["available"] and h["failures"] == 0 and h["outstanding"] == 0 for h in client.health)
@@ -0,0 +1,219 @@
+import json
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from myllmet.io_aws import AdaptiveRateLimiter, BedrockChatClient, get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_acquire_blocks_at_concurrency_limit():
+    limiter = AdaptiveRateLimiter(max_concurrency=1)
+    limiter.acquire()
+
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+
+    assert not acquired.wait(timeout=0.05)
+    limiter.release()
+    assert acquired.wait(timeout=1.0)
+    thread.join()
+
+
+def test_acquire_gives_up_at_deadline():
+    from myllmet.metrics.interface import Deadline
+
+    limiter = AdaptiveRateLimiter(max_concurrency=1)
+    limiter.acquire()
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(deadline=Deadline.after(0.05))
+    assert limiter.in_flight == 1
+
+
+def test_throttle_decreases_concurrency_multiplicatively():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(max_concurrency=16, decrease_cooldown=1.0, clock=clock)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.concurrency_limit == 8
+
+    # A second throttle within the cooldown belongs to the same burst.
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.concurrency_limit == 8
+
+    clock.now = 2.0
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.concurrency_limit == 4
+    assert limiter.throttle_count == 3
+
+
+def test_success_increases_concurrency_additively():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=2, clock=clock)
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+
+    assert limiter.concurrency_limit == 3
+
+
+def test_concurrency_never_drops_below_minimum():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(max_concurrency=4, min_concurrency=2, decrease_cooldown=0.0, clock=clock)
+
+    for _ in range(5):
+        clock.now += 1
+        limiter.acquire()
+        limiter.release(throttled=True)
+
+    assert limiter.concurrency_limit == 2
+
+
+def test_request_bucket_limits_rate():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(requests_per_minute=60, burst_seconds=1.0, clock=clock)
+
+    limiter.acquire()
+    limiter.release()
+
+    assert limiter._try_acquire_locked(0) == pytest.approx(1.0)
+    clock.now = 1.0
+    assert limiter._try_acquire_locked(0) is None
+
+
+def test_token_bucket_settles_against_actual_usage():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(tokens_per_minute=600, burst_seconds=10.0, clock=clock)
+
+    limiter.acquire(estimated_tokens=100)
+    limiter.release(estimated_tokens=100, actual_tokens=40)
+
+    assert limiter._token_bucket.tokens == pytest.approx(60)
+
+
+def test_get_rate_limiter_shares_instances_per_model_and_region():
+    first = get_rate_limiter("shared-model", "us-east-1", max_concurrency=4)
+
+    assert get_rate_limiter("shared-model", "us-east-1") is first
+    assert get_rate_limiter("shared-model", "us-west-2") is not first
+
+
+def test_client_reports_throttles_to_limiter(mocker):
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "converse"),
+        {
+            "stopReason": "end_turn",
+            "output": {"message": {"role": "assistant", "content": [{"text": json.dumps({"output": "o"})}]}},
+            "usage": {"inputTokens": 10, "outputTokens": 2},
+        },
+    ]
+    mocker.patch("time.sleep")
+    limiter = AdaptiveRateLimiter(max_concurrency=8)
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, rate_limiter=limiter)
+
+    chat_client.invoke(
+        instruction="instruction",
+        fewshot_examples=[],
+        input_json={"input": "input_text"},
+        output_json_schema={"type": "object"}
+    )
+
+    assert limiter.throttle_count == 1
+    assert limiter.in_flight == 0
+    assert limiter.concurrency_limit == 4
+
+
+def test_aacquire_wakes_on_release_without_polling():
+    import asyncio
+
+    limiter = AdaptiveRateLimiter(max_concurrency=1)
+    limiter.acquire()
+
+    async def main():
+        waiter = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        assert len(limiter._async_waiters) == 1
+
+        # Released from another thread, like a call finishing in a worker thread.
+        threading.Thread(target=limiter.release).start()
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    asyncio.run(main())
+
+    assert limiter.in_flight == 1
+    assert not limiter._async_waiters
+
+
+@pytest.mark.parametrize("error, expected_limit", [
+    (TimeoutError("Converse call timed out"), 2),
+    (ClientError({"Error": {"Code": "InternalServer"}, "ResponseMetadata": {"HTTPStatusCode": 500}}, "c"), 2),
+    (ClientError({"Error": {"Code": "ValidationException"}, "ResponseMetadata": {"HTTPStatusCode": 400}}, "c"), 4),
+])
+def test_client_reports_failures_to_limiter(mocker, error, expected_limit):
+    fake_client = mocker.Mock()
+    fake_client.converse.side_effect = error
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=4, decrease_cooldown=0.0)
+    chat_client = BedrockChatClient(model_id="dummy-model", bedrock_runtime_client=fake_client, rate_limiter=limiter)
+
+    for _ in range(1 if expected_limit < 4 else 20):
+        with pytest.raises(type(error)):
+            chat_client.invoke(
+                instruction="instruction",
+                fewshot_examples=[],
+                input_json={"input": "input_text"},
+                output_json_schema={"type": "object"}
+            )
+
+    assert limiter.in_flight == 0
+    assert limiter.throttle_count == 0
+    assert limiter.concurrency_limit == expected_limit
+
+
+def test_async_calls_cancelled_by_attempt_timeout_decrease_limit(mocker):
+    import asyncio
+
+    from myllmet.io_aws import AsyncBedrockChatClient
+
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
+
+    fake_client = mocker.Mock()
+    fake_client.converse = hang
+    limiter = AdaptiveRateLimiter(max_concurrency=8, initial_concurrency=4)
+    chat_client = AsyncBedrockChatClient(
+        model_id="dummy-model",
+        bedrock_runtime_client=fake_client,
+        rate_limiter=limiter,
+        call_timeout=0.01
+    )
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await chat_client.ainvoke(
+                instruction="instruction",
+                fewshot_examples=[],
+                input_json={"input": "input_text"},
+                output_json_schema={"type": "object"}
+            )
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert limiter.in_flight == 0
+    assert limiter.concurrency_limit == 2
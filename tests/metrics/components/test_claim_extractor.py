@@ -1,3 +1,5 @@
+import asyncio
+
 import jsonschema
 import pytest
 
@@ -8,6 +10,7 @@ from myllmet.metrics.components.claim_extractor import (
     OUTPUT_JSON_SCHEMA,
     OutputSchema,
 )
+from myllmet.metrics.interface import Deadline
 
 
 def test_invoke_valid(llm_client_stub_factory):
@@ -80,3 +83,35 @@ def test_invoke_invalid_schema(llm_client_stub_factory):
 
     with pytest.raises(jsonschema.ValidationError):
         extractor.invoke("question", "answer")
+
+
+def test_ainvoke_valid(async_llm_client_stub_factory):
+    return_value: OutputSchema = {"claims": ["c1", "c2"]}
+    client = async_llm_client_stub_factory(return_value=return_value)
+    extractor = ClaimExtractor(client=client)
+
+    actual = asyncio.run(extractor.ainvoke("question", "answer"))
+
+    assert actual == return_value
+    assert client.received_invoke_params["input_json"] == {"question": "question", "answer": "answer"}
+
+
+def test_ainvoke_requires_async_client(llm_client_stub_factory):
+    client = llm_client_stub_factory(return_value={"claims": []})
+    extractor = ClaimExtractor(client=client)
+
+    with pytest.raises(TypeError):
+        asyncio.run(extractor.ainvoke("question", "answer"))
+
+
+def test_invoke_forwards_deadline_to_client():
+    class Client:
+        def invoke(self, instruction, fewshot_examples, input_json, output_json_schema, deadline=None):
+            self.deadline = deadline
+            return {"claims": []}
+
+    client = Client()
+    deadline = Deadline.after(10)
+    ClaimExtractor(client=client).invoke("question", "answer", deadline=deadline)
+
+    assert client.deadline is deadline
@@ -0,0 +1,79 @@
+import pytest
+
+from myllmet.metrics.components import ContextReducer, FaithfulnessJudge
+from myllmet.metrics.components.context_reducer import PassageIndex, char_ngrams, split_passages
+
+
+def _document():
+    filler = "この段落は本件とは関係のない説明文です。" * 20
+    return (
+        filler
+        + "富士山の標高は3776メートルで、日本で最も高い山です。"
+        + filler
+        + "東京タワーは1958年に完成した電波塔です。"
+        + filler
+    )
+
+
+def test_char_ngrams_normalizes_text():
+    assert char_ngrams("ＡＢ c。", n=2) == ["ab", "bc"]
+    assert char_ngrams("山", n=2) == ["山"]
+    assert char_ngrams("。 ", n=2) == []
+
+
+def test_split_passages_packs_sentences():
+    passages = split_passages("一文目です。二文目です。三文目です。", passage_chars=12)
+
+    assert passages == ["一文目です。二文目です。", "三文目です。"]
+    assert all(len(p) <= 5 for p in split_passages("あ" * 12, passage_chars=5))
+
+
+def test_passage_index_ranks_relevant_passage_first():
+    index = PassageIndex(["猫が好きです。", "富士山は高い山です。", "犬を飼っています。"])
+
+    assert index.top_k("富士山の高さ", k=1) == [1]
+    assert index.top_k("関係ない", k=3) == []
+
+
+def test_reduce_keeps_relevant_passages_in_document_order():
+    reducer = ContextReducer(top_k=1, passage_chars=100, min_context_chars=100)
+    context = _document()
+
+    reduced = reducer.reduce(context, ["東京タワーは1958年に完成した", "富士山の標高は3776メートル"])
+
+    assert len(reduced) < len(context) / 4
+    assert reduced.index("富士山") < reduced.index("東京タワー")
+
+
+def test_reduce_returns_short_context_unchanged():
+    reducer = ContextReducer(min_context_chars=10_000)
+
+    assert reducer.reduce(_document(), ["富士山"]) == _document()
+
+
+def test_get_index_is_cached_per_context():
+    reducer = ContextReducer(cache_size=1)
+    context = _document()
+
+    index = reducer.get_index(context)
+
+    assert reducer.get_index(context) is index
+    reducer.get_index("別の文脈です。")
+    assert reducer.get_index(context) is not index
+
+
+def test_invalid_top_k():
+    with pytest.raises(ValueError):
+        ContextReducer(top_k=0)
+
+
+def test_judge_sends_reduced_context(llm_client_stub_factory):
+    client = llm_client_stub_factory(return_value={"verdicts": [{"claim": "c", "verdict": 1, "reason": "r"}]})
+    reducer = ContextReducer(top_k=1, passage_chars=100, min_context_chars=100)
+    judge = FaithfulnessJudge(client=client, context_reducer=reducer)
+
+    judge.invoke(_document(), ["富士山の標高は3776メートル"])
+
+    sent_context = client.received_invoke_params["input_json"]["context"]
+    assert "富士山" in sent_context
+    assert "東京タワー" not in sent_context
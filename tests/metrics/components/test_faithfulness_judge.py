@@ -1,13 +1,17 @@
+import asyncio
+
 import jsonschema
 import pytest
 
-from myllmet.metrics.components import FaithfulnessJudge
+from myllmet.caching import MemoryCacheStore
+from myllmet.metrics.components import FaithfulnessJudge, VerdictCache
 from myllmet.metrics.components.faithfulness_judge import (
     DEFAULT_FEWSHOT_EXAMPLES,
     DEFAULT_INSTRUCTION,
     OUTPUT_JSON_SCHEMA,
     OutputSchema,
 )
+from myllmet.metrics.interface import TruncatedResponseError
 
 
 def test_invoke_valid(llm_client_stub_factory):
@@ -81,3 +85,172 @@ def test_invoke_invalid_schema(llm_client_stub_factory):
 
     with pytest.raises(jsonschema.ValidationError):
         judge.invoke("context", ["c1"])
+
+
+def test_ainvoke_valid(async_llm_client_stub_factory):
+    return_value: OutputSchema = {
+        "verdicts": [
+            {"claim": "c1", "verdict": 1, "reason": "r1"},
+        ]
+    }
+    client = async_llm_client_stub_factory(return_value=return_value)
+    judge = FaithfulnessJudge(client=client)
+
+    actual = asyncio.run(judge.ainvoke("context", ["c1"]))
+
+    assert actual == return_value
+    assert client.received_invoke_params["input_json"] == {"context": "context", "claims": ["c1"]}
+
+
+def test_invoke_requires_sync_client(async_llm_client_stub_factory):
+    client = async_llm_client_stub_factory(return_value={"verdicts": []})
+    judge = FaithfulnessJudge(client=client)
+
+    with pytest.raises(TypeError):
+        judge.invoke("context", ["c1"])
+
+
+@pytest.fixture
+def echo_judge_client():
+    class EchoJudgeClient:
+        model_id = "judge-model"
+
+        def __init__(self):
+            self.received_claims = []
+
+        def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+            self.received_claims.append(list(input_json["claims"]))
+            return {
+                "verdicts": [
+                    {"claim": c, "verdict": int(c.startswith("ok")), "reason": f"reason for {c}"}
+                    for c in input_json["claims"]
+                ]
+            }
+
+    return EchoJudgeClient()
+
+
+def test_invoke_with_verdict_cache_only_sends_uncached_claims(echo_judge_client):
+    judge = FaithfulnessJudge(client=echo_judge_client, verdict_cache=VerdictCache(MemoryCacheStore()))
+
+    judge.invoke("ctx", ["ok1", "ng2"])
+    actual = judge.invoke("ctx", ["ng2", "ok3", "ok1"])
+
+    assert echo_judge_client.received_claims == [["ok1", "ng2"], ["ok3"]]
+    assert [v["claim"] for v in actual["verdicts"]] == ["ng2", "ok3", "ok1"]
+    assert [v["verdict"] for v in actual["verdicts"]] == [0, 1, 1]
+    assert actual["verdicts"][0]["reason"] == "reason for ng2"
+
+
+def test_invoke_with_verdict_cache_skips_client_on_full_hit(echo_judge_client):
+    cache = VerdictCache(MemoryCacheStore())
+    judge = FaithfulnessJudge(client=echo_judge_client, verdict_cache=cache)
+
+    judge.invoke("ctx", ["ok1"])
+    actual = judge.invoke("ctx", ["  ok1 "])
+
+    assert echo_judge_client.received_claims == [["ok1"]]
+    assert actual["verdicts"] == [{"claim": "  ok1 ", "verdict": 1, "reason": "reason for ok1"}]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_verdict_cache_is_scoped_by_context_and_prompt(echo_judge_client):
+    cache = VerdictCache(MemoryCacheStore())
+
+    FaithfulnessJudge(client=echo_judge_client, verdict_cache=cache).invoke("ctx", ["ok1"])
+    FaithfulnessJudge(client=echo_judge_client, verdict_cache=cache).invoke("other ctx", ["ok1"])
+    FaithfulnessJudge(client=echo_judge_client, verdict_cache=cache, instruction="custom").invoke("ctx", ["ok1"])
+
+    assert echo_judge_client.received_claims == [["ok1"], ["ok1"], ["ok1"]]
+
+
+def test_verdict_cache_rejects_mismatched_fresh_verdicts(llm_client_stub_factory):
+    client = llm_client_stub_factory(return_value={"verdicts": []})
+    judge = FaithfulnessJudge(client=client, verdict_cache=VerdictCache(MemoryCacheStore()))
+
+    with pytest.raises(ValueError):
+        judge.invoke("ctx", ["c1"])
+
+
+class _EchoingJudgeClient:
+    def __init__(self, truncate_above=None):
+        self.truncate_above = truncate_above
+        self.received_claims = []
+
+    def _respond(self, input_json):
+        claims = input_json["claims"]
+        self.received_claims.append(claims)
+        if self.truncate_above is not None and len(claims) > self.truncate_above:
+            raise TruncatedResponseError("truncated")
+        return {"verdicts": [{"claim": c, "verdict": 1, "reason": "r"} for c in claims]}
+
+    def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+        return self._respond(input_json)
+
+    async def ainvoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+        return self._respond(input_json)
+
+
+def test_split_claims_by_count_and_tokens():
+    judge = FaithfulnessJudge(client=_EchoingJudgeClient(), max_claims_per_call=2)
+    assert judge.split_claims(["a", "b", "c"]) == [["a", "b"], ["c"]]
+
+    judge = FaithfulnessJudge(client=_EchoingJudgeClient(), max_output_tokens_per_call=150)
+    assert judge.split_claims(["a" * 10, "b" * 10, "c" * 100]) == [["a" * 10, "b" * 10], ["c" * 100]]
+
+    assert FaithfulnessJudge(client=_EchoingJudgeClient()).split_claims(["a", "b"]) == [["a", "b"]]
+
+
+def test_invoke_chunks_claims_and_merges_in_order():
+    client = _EchoingJudgeClient()
+    judge = FaithfulnessJudge(client=client, max_claims_per_call=3)
+    claims = [f"c{i}" for i in range(10)]
+
+    actual = judge.invoke("ctx", claims)
+
+    assert [v["claim"] for v in actual["verdicts"]] == claims
+    assert sorted(len(c) for c in client.received_claims) == [1, 3, 3, 3]
+
+
+def test_invoke_splits_truncated_response():
+    client = _EchoingJudgeClient(truncate_above=2)
+    judge = FaithfulnessJudge(client=client)
+    claims = [f"c{i}" for i in range(7)]
+
+    actual = judge.invoke("ctx", claims)
+
+    assert [v["claim"] for v in actual["verdicts"]] == claims
+    assert client.received_claims[0] == claims
+
+
+def test_invoke_truncated_single_claim_raises():
+    judge = FaithfulnessJudge(client=_EchoingJudgeClient(truncate_above=0))
+
+    with pytest.raises(TruncatedResponseError):
+        judge.invoke("ctx", ["c1", "c2"])
+
+
+def test_ainvoke_chunks_claims_and_splits_truncated_response():
+    client = _EchoingJudgeClient(truncate_above=1)
+    judge = FaithfulnessJudge(client=client, max_claims_per_call=3)
+    claims = [f"c{i}" for i in range(5)]
+
+    actual = asyncio.run(judge.ainvoke("ctx", claims))
+
+    assert [v["claim"] for v in actual["verdicts"]] == claims
+
+
+def test_invoke_rejects_chunk_with_wrong_verdict_count():
+    class MiscountingClient(_EchoingJudgeClient):
+        def _respond(self, input_json):
+            output = super()._respond(input_json)
+            if input_json["claims"][0] == "c0":
+                output["verdicts"].pop()
+            else:
+                output["verdicts"].append({"claim": "extra", "verdict": 1, "reason": "r"})
+            return output
+
+    judge = FaithfulnessJudge(client=MiscountingClient(), max_claims_per_call=2)
+
+    with pytest.raises(ValueError, match="chunk"):
+        judge.invoke("ctx", ["c0", "c1", "c2", "c3"])
@@ -0,0 +1,43 @@
+import jsonschema
+import pytest
+
+from myllmet.metrics.components.faithfulness_judge import OUTPUT_JSON_SCHEMA
+from myllmet.metrics.components.schema_validator import get_validator, validate
+
+
+def _available_backends():
+    backends = ["auto", "jsonschema"]
+    try:
+        import fastjsonschema  # noqa: F401
+    except ImportError:
+        return backends
+    return backends + ["fastjsonschema"]
+
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_valid_instance(backend):
+    validate({"verdicts": [{"claim": "c", "verdict": 1, "reason": "r"}]}, OUTPUT_JSON_SCHEMA, backend=backend)
+
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_invalid_instance_raises_jsonschema_error(backend):
+    instance = {"verdicts": [{"claim": "c", "verdict": 2, "reason": "r"}]}
+
+    with pytest.raises(jsonschema.ValidationError) as excinfo:
+        validate(instance, OUTPUT_JSON_SCHEMA, backend=backend)
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance, OUTPUT_JSON_SCHEMA)
+    assert excinfo.value.message == expected.value.message
+
+
+def test_validators_are_cached_per_schema():
+    schema = {"type": "object"}
+
+    assert get_validator(schema) is get_validator(schema)
+    assert get_validator(schema) is not get_validator({"type": "object"})
+
+
+def test_invalid_schema_is_rejected_at_compile_time():
+    with pytest.raises(jsonschema.SchemaError):
+        get_validator({"type": 1})
@@ -0,0 +1,27 @@
+from myllmet.caching import MemoryCacheStore
+from myllmet.metrics.components.verdict_cache import VerdictCache, normalize_claim
+
+
+def test_normalize_claim():
+    assert normalize_claim("  ＡＢＣ　は\n 正しい ") == "ABC は 正しい"
+
+
+def test_keys_depend_on_every_component():
+    cache = VerdictCache(MemoryCacheStore())
+    base = cache.keys("model", "fp", "ctx", ["claim"])[0]
+
+    assert cache.keys("model", "fp", "ctx", [" claim "])[0] == base
+    assert cache.keys("other-model", "fp", "ctx", ["claim"])[0] != base
+    assert cache.keys("model", "other-fp", "ctx", ["claim"])[0] != base
+    assert cache.keys("model", "fp", "other ctx", ["claim"])[0] != base
+    assert cache.keys("model", "fp", "ctx", ["other claim"])[0] != base
+
+
+def test_get_many_counts_hits_and_misses():
+    cache = VerdictCache(MemoryCacheStore())
+    cache.set_many(["k1"], [{"claim": "c1", "verdict": 1, "reason": "r"}])
+
+    actual = cache.get_many(["k1", "k2"])
+
+    assert actual == [{"claim": "c1", "verdict": 1, "reason": "r"}, None]
+    assert (cache.hits, cache.misses) == (1, 1)
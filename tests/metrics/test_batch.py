@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from myllmet.metrics._batch import agather_bounded, group_by_affinity, imap_bounded, imap_bounded_grouped
+
+
+def test_imap_bounded_preserves_order():
+    def slow_identity(x):
+        time.sleep(0.001 * (10 - x))
+        return x
+
+    actual = [result for result, _ in imap_bounded(slow_identity, range(10), max_in_flight=4)]
+    assert actual == list(range(10))
+
+
+def test_imap_bounded_limits_concurrency():
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def work(x):
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.005)
+        with lock:
+            state["current"] -= 1
+        return x
+
+    list(imap_bounded(work, range(30), max_in_flight=3))
+    assert state["peak"] <= 3
+
+
+def test_imap_bounded_yields_errors():
+    def fail_on_odd(x):
+        if x % 2:
+            raise RuntimeError(x)
+        return x
+
+    outcomes = list(imap_bounded(fail_on_odd, range(4), max_in_flight=2))
+
+    assert [result for result, _ in outcomes] == [0, None, 2, None]
+    assert [type(error) for _, error in outcomes] == [type(None), RuntimeError, type(None), RuntimeError]
+
+
+def test_imap_bounded_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        list(imap_bounded(lambda x: x, [1], max_in_flight=0))
+
+
+def test_agather_bounded_limits_concurrency():
+    state = {"current": 0, "peak": 0}
+
+    async def work(x):
+        state["current"] += 1
+        state["peak"] = max(state["peak"], state["current"])
+        await asyncio.sleep(0.001)
+        state["current"] -= 1
+        if x == 3:
+            raise RuntimeError(x)
+        return x
+
+    outcomes = asyncio.run(agather_bounded(work, range(10), max_in_flight=4))
+
+    assert state["peak"] <= 4
+    assert [result for result, _ in outcomes] == [0, 1, 2, None, 4, 5, 6, 7, 8, 9]
+    assert isinstance(outcomes[3][1], RuntimeError)
+
+
+def test_group_by_affinity_groups_within_window():
+    items = ["a", "b", "a", "c", "b", "a"]
+
+    scheduled = list(group_by_affinity(items, key=lambda x: x, window_size=4))
+
+    assert scheduled == [(0, "a"), (2, "a"), (1, "b"), (3, "c"), (4, "b"), (5, "a")]
+
+    with pytest.raises(ValueError):
+        list(group_by_affinity(items, key=lambda x: x, window_size=0))
+
+
+def test_imap_bounded_grouped_runs_groups_back_to_back_in_input_order():
+    started = []
+
+    def func(item):
+        started.append(item)
+        if item[1] == "x":
+            raise ValueError(item)
+        return item[0]
+
+    items = [(i, key) for i, key in enumerate("abxabab")]
+    outcomes = list(imap_bounded_grouped(func, items, max_in_flight=1, key=lambda item: item[1], window_size=7))
+
+    assert [key for _, key in started] == list("aaabbbx")
+    assert [result for result, _ in outcomes] == [0, 1, None, 3, 4, 5, 6]
+    assert isinstance(outcomes[2][1], ValueError)
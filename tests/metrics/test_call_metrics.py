@@ -0,0 +1,51 @@
+import pytest
+
+from myllmet.metrics import CallMetricsAggregator
+from myllmet.metrics._call_metrics import collect_call_metrics, record_call_metrics, summarize_calls
+
+
+def _call(**fields):
+    return {"input_tokens": 10, "output_tokens": 5, "latency_ms": 100, "attempts": 1, **fields}
+
+
+def test_record_call_metrics_without_collector_is_noop():
+    record_call_metrics(_call())
+
+
+def test_collect_call_metrics_nests():
+    with collect_call_metrics() as outer:
+        record_call_metrics(_call())
+        with collect_call_metrics() as inner:
+            record_call_metrics(_call())
+        record_call_metrics(_call())
+
+    assert len(outer) == 2
+    assert len(inner) == 1
+
+
+def test_summarize_calls_sums_fields():
+    summary = summarize_calls([_call(), _call(output_tokens=7, attempts=3)])
+
+    assert summary["calls"] == 2
+    assert summary["input_tokens"] == 20
+    assert summary["output_tokens"] == 12
+    assert summary["attempts"] == 4
+    assert summary["cache_read_input_tokens"] == 0
+
+
+def test_aggregator_summary_has_totals_and_percentiles():
+    aggregator = CallMetricsAggregator()
+    aggregator.add("judge", [_call(latency_ms=ms) for ms in range(1, 101)])
+    aggregator.add("extractor", [_call(latency_ms=50)])
+    aggregator.add("extractor", [])
+
+    summary = aggregator.summary()
+
+    assert summary["judge"]["calls"] == 100
+    assert summary["judge"]["input_tokens"] == 1000
+    assert summary["judge"]["latency_ms_p50"] == pytest.approx(50.5)
+    assert summary["judge"]["latency_ms_p99"] == pytest.approx(99.01)
+    assert summary["extractor"]["latency_ms_p90"] == 50
+
+    aggregator.reset()
+    assert aggregator.summary() == {}
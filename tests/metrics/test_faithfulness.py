@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from myllmet.metrics import Faithfulness
@@ -13,6 +15,9 @@ def claim_extractor_stub_factory():
         def invoke(self, question, answer):
             return {"claims": self.return_claims}
 
+        async def ainvoke(self, question, answer):
+            return self.invoke(question, answer)
+
         @property
         def instruction(self):
             return "instruction"
@@ -34,6 +39,9 @@ def faithfulness_judge_stub_factory():
             verdicts = [{"claim": c, "verdict": v, "reason": "r"} for c, v in zip(claims, self.return_verdicts)]
             return {"verdicts": verdicts}
 
+        async def ainvoke(self, context, claims):
+            return self.invoke(context, claims)
+
         @property
         def instruction(self):
             return "instruction"
@@ -144,3 +152,228 @@ def test_score_logs_to_tracker(
     assert logged["score"] == expected_logged_score
     assert logged["intermediates"] == expected_logged_intermediates
     assert logged["prompts"] == expected_logged_promts
+
+
+def test_score_batch_returns_scores_in_input_order(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1", "c2"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1, 0])
+    metrics = Faithfulness(ce, fj)
+
+    records = [("q", "a", f"ctx{i}") for i in range(20)]
+    result = metrics.score_batch(records, max_workers=4)
+
+    assert result.scores == [0.5] * 20
+    assert result.errors == []
+
+
+def test_score_batch_collects_errors(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1])
+    metrics = Faithfulness(ce, fj)
+
+    records = [("q", "a", "ctx"), ("q", "a", None), ("q", "a", "ctx")]
+    result = metrics.score_batch(records, max_workers=2)
+
+    assert result.scores == [1.0, None, 1.0]
+    assert len(result.errors) == 1
+    assert result.errors[0].row_index == 1
+    assert isinstance(result.errors[0].exception, ValueError)
+
+
+def test_score_batch_logs_each_row(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1])
+    metrics = Faithfulness(ce, fj)
+
+    logged_contexts = []
+
+    class Tracker:
+        def log(self, question, answer, context, ground_truth, score, intermediates, prompts):
+            logged_contexts.append(context)
+
+    metrics.set_tracker(Tracker())
+    metrics.score_batch([("q", "a", f"ctx{i}") for i in range(10)], max_workers=3)
+
+    assert sorted(logged_contexts) == sorted(f"ctx{i}" for i in range(10))
+
+
+def test_ascore_valid(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory,
+    tracker_stub
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1", "c2", "c3", "c4"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1, 0, 1, 1])
+    metrics = Faithfulness(ce, fj)
+    metrics.set_tracker(tracker_stub)
+
+    actual = asyncio.run(metrics.ascore(question="q", answer="a", context="ctx"))
+
+    assert actual == 0.75
+    assert tracker_stub.logged["score"] == 0.75
+
+
+def test_ascore_batch_collects_errors(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1", "c2"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1, 0])
+    metrics = Faithfulness(ce, fj)
+
+    records = [("q", "a", "ctx"), ("q", "a", None), ("q", "a", "ctx")]
+    result = asyncio.run(metrics.ascore_batch(records, max_concurrency=2))
+
+    assert result.scores == [0.5, None, 0.5]
+    assert [e.row_index for e in result.errors] == [1]
+
+
+def test_score_contexts_extracts_claims_once(
+    claim_extractor_stub_factory,
+    faithfulness_judge_stub_factory
+):
+    ce = claim_extractor_stub_factory(return_claims=["c1", "c2"])
+    fj = faithfulness_judge_stub_factory(return_verdicts=[1, 0])
+    extract_calls = []
+    original_invoke = ce.invoke
+    ce.invoke = lambda question, answer: extract_calls.append((question, answer)) or original_invoke(question, answer)
+    metrics = Faithfulness(ce, fj)
+
+    logged_contexts = []
+
+    class Tracker:
+        def log(self, question, answer, context, ground_truth, score, intermediates, prompts):
+            logged_contexts.append(context)
+
+    metrics.set_tracker(Tracker())
+    actual = metrics.score_contexts(question="q", answer="a", contexts=["ctx1", "ctx2", "ctx3"], max_workers=2)
+
+    assert actual == [0.5, 0.5, 0.5]
+    assert extract_calls == [("q", "a")]
+    assert sorted(logged_contexts) == ["ctx1", "ctx2", "ctx3"]
+
+
+def test_score_contexts_returns_scores_per_context(claim_extractor_stub_factory):
+    ce = claim_extractor_stub_factory(return_claims=["c1", "c2"])
+
+    class ContextDependentJudge:
+        instruction = "instruction"
+        fewshot_examples = []
+
+        def invoke(self, context, claims):
+            verdict = 1 if context == "good" else 0
+            return {"verdicts": [{"claim": c, "verdict": verdict, "reason": "r"} for c in claims]}
+
+        async def ainvoke(self, context, claims):
+            return self.invoke(context, claims)
+
+    metrics = Faithfulness(ce, ContextDependentJudge())
+
+    assert metrics.score_contexts("q", "a", ["good", "bad", "good"]) == [1.0, 0.0, 1.0]
+    assert asyncio.run(metrics.ascore_contexts("q", "a", ["bad", "good"])) == [0.0, 1.0]
+
+
+def test_ascore_contexts_bounds_concurrent_judge_calls(claim_extractor_stub_factory):
+    ce = claim_extractor_stub_factory(return_claims=["c1"])
+    in_flight = []
+
+    class SlowJudge:
+        instruction = "instruction"
+        fewshot_examples = []
+
+        async def ainvoke(self, context, claims):
+            in_flight.append(context)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(context)
+            return {"verdicts": [{"claim": c, "verdict": 1, "reason": "r"} for c in claims]}
+
+    peak = []
+    metrics = Faithfulness(ce, SlowJudge())
+    contexts = [f"ctx{i}" for i in range(10)]
+
+    assert asyncio.run(metrics.ascore_contexts("q", "a", contexts, max_concurrency=3)) == [1.0] * 10
+    assert max(peak) == 3
+
+
+def test_score_with_timeout_passes_shared_deadline_to_components():
+    received = {}
+
+    class Extractor:
+        instruction = "instruction"
+        fewshot_examples = []
+
+        def invoke(self, question, answer, deadline=None):
+            received["extractor"] = deadline
+            return {"claims": ["c1"]}
+
+    class Judge:
+        instruction = "instruction"
+        fewshot_examples = []
+
+        def invoke(self, context, claims, deadline=None):
+            received["judge"] = deadline
+            return {"verdicts": [{"claim": "c1", "verdict": 1, "reason": "r"}]}
+
+    metrics = Faithfulness(Extractor(), Judge())
+    metrics.score(question="q", answer="a", context="ctx", timeout=30)
+
+    assert received["extractor"] is received["judge"]
+    assert 0 < received["extractor"].remaining() <= 30
+
+
+def test_score_attaches_call_metrics_per_stage(faithfulness_judge_stub_factory, tracker_stub):
+    from myllmet.metrics._call_metrics import record_call_metrics
+
+    class ReportingClaimExtractor:
+        instruction = "instruction"
+        fewshot_examples: list = []
+
+        def invoke(self, question, answer):
+            record_call_metrics({"input_tokens": 10, "output_tokens": 3, "latency_ms": 40, "attempts": 1})
+            return {"claims": ["c1"]}
+
+    metrics = Faithfulness(ReportingClaimExtractor(), faithfulness_judge_stub_factory(return_verdicts=[1]))
+    metrics.set_tracker(tracker_stub)
+
+    metrics.score(question="q", answer="a", context="ctx")
+
+    call_metrics = tracker_stub.logged["intermediates"]["call_metrics"]
+    assert call_metrics["claim_extractor"]["calls"] == 1
+    assert call_metrics["claim_extractor"]["input_tokens"] == 10
+    assert call_metrics["faithfulness_judge"]["calls"] == 0
+    assert metrics.call_metrics.summary()["claim_extractor"]["latency_ms_p50"] == 40
+
+
+def test_score_batch_with_affinity_window_returns_scores_in_input_order(claim_extractor_stub_factory):
+    judged_contexts = []
+
+    class ContextJudge:
+        instruction = "instruction"
+        fewshot_examples: list = []
+
+        def invoke(self, context, claims):
+            judged_contexts.append(context)
+            return {"verdicts": [{"claim": c, "verdict": int(context == "good"), "reason": "r"} for c in claims]}
+
+        async def ainvoke(self, context, claims):
+            return self.invoke(context, claims)
+
+    metrics = Faithfulness(claim_extractor_stub_factory(return_claims=["c1"]), ContextJudge())
+    records = [("q", "a", context) for context in ["good", "bad", "good", "bad"]]
+
+    result = metrics.score_batch(records, max_workers=1, affinity_window=4)
+    assert result.scores == [1.0, 0.0, 1.0, 0.0]
+    assert judged_contexts == ["good", "good", "bad", "bad"]
+
+    result = asyncio.run(metrics.ascore_batch(records, affinity_window=4))
+    assert result.scores == [1.0, 0.0, 1.0, 0.0]
@@ -0,0 +1,156 @@
+import json
+
+import pytest
+
+from myllmet import Faithfulness
+from myllmet.pipeline import ColumnMapping, RunCheckpoint, evaluate_rows
+from myllmet.pipeline._checkpoint import LOG_NAME, run_config
+
+
+class CountingClient:
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+        self.calls += 1
+        return self.fn(input_json)
+
+
+def _judge(input_json):
+    if input_json["context"] == "fail":
+        raise RuntimeError("throttled")
+    return {"verdicts": [{"claim": c, "verdict": 1, "reason": "r"} for c in input_json["claims"]]}
+
+
+@pytest.fixture
+def clients():
+    return (
+        CountingClient(lambda input_json: {"claims": [input_json["answer"]]}),
+        CountingClient(_judge),
+    )
+
+
+@pytest.fixture
+def metric(clients):
+    extractor, judge = clients
+    return Faithfulness.from_clients(claim_extractor_client=extractor, faithfulness_judge_client=judge)
+
+
+class ListWriter:
+    def __init__(self):
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+
+
+def test_resume_skips_completed_and_reuses_claims(tmp_path, metric, clients):
+    extractor, judge = clients
+    rows = [
+        {"id": "a", "question": "q", "answer": "x", "context": "ok"},
+        {"id": "b", "question": "q", "answer": "y", "context": "fail"},
+    ]
+    columns = ColumnMapping(id="id")
+
+    with RunCheckpoint.for_metric(tmp_path, metric) as checkpoint:
+        summary = evaluate_rows(metric, rows, ListWriter(), columns=columns, checkpoint=checkpoint)
+    assert summary.failed == 1
+    assert (extractor.calls, judge.calls) == (2, 2)
+
+    rows[1]["context"] = "ok now"
+    writer = ListWriter()
+    with RunCheckpoint.for_metric(tmp_path, metric) as checkpoint:
+        assert (checkpoint.completed_count, checkpoint.partial_count) == (1, 1)
+        summary = evaluate_rows(metric, rows, writer, columns=columns, checkpoint=checkpoint)
+
+    assert summary.failed == 0
+    assert [row["score"] for row in writer.rows] == [1.0, 1.0]
+    # Row "a" was skipped; row "b" reused its extracted claims and only ran the judge.
+    assert (extractor.calls, judge.calls) == (2, 3)
+
+
+def test_log_records_claims_and_verdicts(tmp_path, metric):
+    with RunCheckpoint.for_metric(tmp_path, metric) as checkpoint:
+        evaluate_rows(metric, [{"question": "q", "answer": "x", "context": "ok"}], ListWriter(), checkpoint=checkpoint)
+
+    entries = [json.loads(line) for line in (tmp_path / LOG_NAME).read_text(encoding="utf-8").splitlines()]
+    assert entries == [
+        {"row_id": "0", "claims": {"claims": ["x"]}},
+        {
+            "row_id": "0",
+            "claims": {"claims": ["x"]},
+            "verdicts": {"verdicts": [{"claim": "x", "verdict": 1, "reason": "r"}]},
+            "score": 1.0,
+        },
+    ]
+
+
+def test_torn_last_line_is_discarded(tmp_path, metric):
+    with RunCheckpoint.for_metric(tmp_path, metric) as checkpoint:
+        checkpoint.record_claims("0", {"claims": ["x"]})
+
+    log_path = tmp_path / LOG_NAME
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write('{"row_id": "1", "cla')
+
+    with RunCheckpoint.for_metric(tmp_path, metric) as checkpoint:
+        assert checkpoint.get("0").claim_extractor_output == {"claims": ["x"]}
+        assert checkpoint.get("1").claim_extractor_output is None
+        checkpoint.record_claims("1", {"claims": ["y"]})
+
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_config_mismatch_is_rejected(tmp_path, metric, llm_client_stub_factory):
+    RunCheckpoint.for_metric(tmp_path, metric).close()
+
+    other = Faithfulness.from_clients(
+        claim_extractor_client=llm_client_stub_factory(return_value=None),
+        faithfulness_judge_client=llm_client_stub_factory(return_value=None),
+        kwargs_claim_extractor={"instruction": "another instruction"},
+    )
+
+    with pytest.raises(ValueError):
+        RunCheckpoint.for_metric(tmp_path, other)
+
+
+def test_run_config_includes_model_ids(metric):
+    metric.claim_extractor.client.model_id = "extractor-model"
+
+    config = run_config(metric)
+
+    assert config["claim_extractor"]["model_id"] == "extractor-model"
+    assert config["faithfulness_judge"]["model_id"] is None
+
+
+def test_checkpointed_rows_report_call_metrics(tmp_path):
+    from myllmet.metrics._call_metrics import record_call_metrics
+
+    class ReportingClient(CountingClient):
+        def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+            record_call_metrics({"input_tokens": 10, "output_tokens": 2, "latency_ms": 50, "attempts": 1})
+            return super().invoke(instruction, fewshot_examples, input_json, output_json_schema)
+
+    class IntermediatesTracker:
+        def __init__(self):
+            self.intermediates = []
+
+        def log(self, question, answer, context, ground_truth, score, intermediates, prompts):
+            self.intermediates.append(intermediates)
+
+    metric = Faithfulness.from_clients(
+        claim_extractor_client=ReportingClient(lambda input_json: {"claims": [input_json["answer"]]}),
+        faithfulness_judge_client=ReportingClient(_judge),
+    )
+    tracker = IntermediatesTracker()
+    metric.set_tracker(tracker)
+    checkpoint = RunCheckpoint.for_metric(tmp_path, metric)
+
+    evaluate_rows(metric, [{"question": "q", "answer": "a", "context": "ctx"}], ListWriter(), checkpoint=checkpoint)
+    checkpoint.close()
+
+    call_metrics = tracker.intermediates[0]["call_metrics"]
+    assert call_metrics["claim_extractor"]["calls"] == 1
+    assert call_metrics["faithfulness_judge"]["input_tokens"] == 10
+    assert set(metric.call_metrics.summary()) == {"claim_extractor", "faithfulness_judge"}
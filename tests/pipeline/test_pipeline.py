@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+
+from myllmet import Faithfulness
+from myllmet.pipeline import ColumnMapping, ProgressReporter, evaluate_file, evaluate_rows
+
+
+class StubClient:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def invoke(self, instruction, fewshot_examples, input_json, output_json_schema):
+        return self.fn(input_json)
+
+
+def _build_metric():
+    def extract(input_json):
+        if input_json["answer"] == "broken":
+            raise RuntimeError("boom")
+        return {"claims": input_json["answer"].split(",")}
+
+    def judge(input_json):
+        return {
+            "verdicts": [
+                {"claim": c, "verdict": int(c in input_json["context"]), "reason": "r"}
+                for c in input_json["claims"]
+            ]
+        }
+
+    return Faithfulness.from_clients(
+        claim_extractor_client=StubClient(extract),
+        faithfulness_judge_client=StubClient(judge),
+    )
+
+
+class ListWriter:
+    def __init__(self):
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+
+
+def test_evaluate_rows_writes_in_input_order():
+    rows = [
+        {"id": i, "question": "q", "answer": answer, "context": "a b"}
+        for i, answer in enumerate(["a,b", "a,c", "broken", "c"])
+    ]
+    writer = ListWriter()
+
+    summary = evaluate_rows(_build_metric(), iter(rows), writer, max_workers=2)
+
+    assert [row["id"] for row in writer.rows] == [0, 1, 2, 3]
+    assert [row["score"] for row in writer.rows] == [1.0, 0.5, None, 0.0]
+    assert writer.rows[2]["error"] == "RuntimeError('boom')"
+    assert summary.total == 4
+    assert summary.failed == 1
+
+
+def test_evaluate_rows_missing_column_is_row_error():
+    writer = ListWriter()
+
+    summary = evaluate_rows(_build_metric(), [{"question": "q", "context": "a"}], writer)
+
+    assert summary.failed == 1
+    assert "KeyError" in writer.rows[0]["error"]
+
+
+def test_evaluate_file_with_column_mapping(tmp_path):
+    input_path = tmp_path / "data.csv"
+    input_path.write_text('q,a,ctx\nq1,"a,b",a b\n', encoding="utf-8")
+    output_path = tmp_path / "result.jsonl"
+
+    summary = evaluate_file(
+        _build_metric(),
+        input_path,
+        output_path,
+        columns=ColumnMapping(question="q", answer="a", context="ctx"),
+    )
+
+    results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert summary.total == 1
+    assert results == [{"q": "q1", "a": "a,b", "ctx": "a b", "score": 1.0, "error": None}]
+
+
+def test_evaluate_file_writes_csv(tmp_path):
+    input_path = tmp_path / "data.jsonl"
+    input_path.write_text(
+        json.dumps({"question": "q1", "answer": "a", "context": "a"}) + "\n",
+        encoding="utf-8"
+    )
+    output_path = tmp_path / "result.csv"
+
+    evaluate_file(_build_metric(), input_path, output_path)
+
+    with open(output_path, encoding="utf-8", newline="") as f:
+        assert list(csv.DictReader(f)) == [
+            {"question": "q1", "answer": "a", "context": "a", "score": "1.0", "error": ""}
+        ]
+
+
+def test_progress_reporter_reports_throughput():
+    now = [0.0]
+    stream = io.StringIO()
+    progress = ProgressReporter(stream=stream, interval=1.0, total=4, clock=lambda: now[0])
+
+    now[0] = 0.5
+    progress.update()
+    now[0] = 2.0
+    progress.update(failed=True)
+
+    assert stream.getvalue() == "2/4 rows (1 failed) | 1.00 rows/s | 2.0s\n"
+
+
+def test_evaluate_rows_with_affinity_window_keeps_input_order():
+    rows = [
+        {"id": i, "question": "q", "answer": "a,b", "context": context}
+        for i, context in enumerate(["a b", "a", "a b", "b", "a"])
+    ]
+    writer = ListWriter()
+
+    summary = evaluate_rows(_build_metric(), iter(rows), writer, max_workers=2, affinity_window=3)
+
+    assert [row["id"] for row in writer.rows] == [0, 1, 2, 3, 4]
+    assert [row["score"] for row in writer.rows] == [1.0, 0.5, 1.0, 0.5, 0.5]
+    assert summary.total == 5
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from myllmet.pipeline import iter_rows
+
+
+def test_iter_rows_jsonl_skips_blank_lines(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"question": "q1"}\n\n{"question": "q2"}\n', encoding="utf-8")
+
+    assert list(iter_rows(path)) == [{"question": "q1"}, {"question": "q2"}]
+
+
+def test_iter_rows_jsonl_rejects_non_objects(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text(json.dumps(["q1"]) + "\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_rows(path))
+
+
+def test_iter_rows_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("question,answer\nq1,a1\nq2,a2\n", encoding="utf-8")
+
+    assert list(iter_rows(path)) == [
+        {"question": "q1", "answer": "a1"},
+        {"question": "q2", "answer": "a2"},
+    ]
+
+
+def test_iter_rows_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table({"question": ["q1", "q2", "q3"], "answer": ["a1", "a2", "a3"]}), path)
+
+    rows = list(iter_rows(path, batch_size=2))
+
+    assert [row["question"] for row in rows] == ["q1", "q2", "q3"]
+
+
+def test_iter_rows_is_lazy(tmp_path):
+    rows = iter_rows(tmp_path / "missing.jsonl")
+
+    with pytest.raises(FileNotFoundError):
+        next(rows)
+
+
+def test_iter_rows_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        iter_rows(tmp_path / "data.txt")
@@ -0,0 +1,51 @@
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+
+
+@pytest.fixture
+def benchmarks(monkeypatch):
+    monkeypatch.syspath_prepend(str(BENCHMARKS_DIR))
+    return importlib.import_module
+
+
+@pytest.mark.parametrize(
+    "module, argv",
+    [
+        (
+            "bench_scoring",
+            [
+                "--rows", "2", "--claims", "2", "--concurrency", "2",
+                "--latency-distribution", "constant", "--latency-mean", "0", "--seconds", "0.01",
+            ],
+        ),
+        ("bench_schema_validation", ["--claims", "1", "2", "--seconds", "0.01"]),
+    ],
+)
+def test_benchmark_output_round_trips_through_compare(benchmarks, tmp_path, capsys, module, argv):
+    compare = benchmarks("compare")
+    baseline_path = tmp_path / "baseline.jsonl"
+    current_path = tmp_path / "current.jsonl"
+
+    benchmarks(module).main([*argv, "--output", str(baseline_path)])
+    benchmarks(module).main([*argv, "--output", str(current_path)])
+
+    lines = baseline_path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        result = json.loads(line)
+        assert {"benchmark", "params", "metrics", "commit", "python", "timestamp"} <= result.keys()
+
+    baseline = compare.load(str(baseline_path))
+    assert len(baseline) == len(lines)
+    assert baseline.keys() == compare.load(str(current_path)).keys()
+
+    capsys.readouterr()
+    compare.main([str(baseline_path), str(current_path), "--threshold", "1000"])
+    compared = capsys.readouterr().out.splitlines()
+    assert compared
+    assert {line.split()[0] for line in compared} == {json.loads(line)["benchmark"] for line in lines}
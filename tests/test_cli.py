@@ -0,0 +1,25 @@
+import json
+
+from myllmet import cli
+
+
+def test_eval_command(tmp_path, mocker, llm_client_stub_factory):
+    from myllmet import Faithfulness
+
+    metric = Faithfulness.from_clients(
+        claim_extractor_client=llm_client_stub_factory(return_value={"claims": ["c"]}),
+        faithfulness_judge_client=llm_client_stub_factory(
+            return_value={"verdicts": [{"claim": "c", "verdict": 1, "reason": "r"}]}
+        ),
+    )
+    build_metric = mocker.patch.object(cli, "build_metric", return_value=metric)
+
+    input_path = tmp_path / "data.jsonl"
+    input_path.write_text(json.dumps({"question": "q", "answer": "a", "context": "c"}) + "\n", encoding="utf-8")
+    output_path = tmp_path / "result.jsonl"
+
+    exit_code = cli.main(["eval", str(input_path), "-o", str(output_path), "--model-id", "model"])
+
+    assert exit_code == 0
+    assert build_metric.call_args.args[0].model_id == "model"
+    assert json.loads(output_path.read_text(encoding="utf-8"))["score"] == 1.0
@@ -0,0 +1,64 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["boto3", "botocore", "jsonschema", "pandas", "pyarrow", "sqlite3"]
+
+# Generous enough for slow CI runners; the regression this catches is a heavy dependency
+# being imported eagerly again, which costs hundreds of milliseconds.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("MYLLMET_IMPORT_TIME_BUDGET_MS", "150"))
+
+
+def _run_python(code, *args):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("statement", [
+    "import myllmet",
+    "import myllmet.metrics",
+    "import myllmet.io_aws",
+    "import myllmet.trackers",
+])
+def test_import_does_not_load_heavy_dependencies(statement):
+    result = _run_python(f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+
+    assert result.stdout.strip() == ""
+
+
+def test_exports_resolve_lazily():
+    result = _run_python(
+        "import sys, myllmet\n"
+        "from myllmet.io_aws import AdaptiveRateLimiter\n"
+        "assert 'boto3' not in sys.modules\n"
+        "from myllmet.io_aws import BedrockChatClient\n"
+        "assert 'boto3' in sys.modules\n"
+        "print(myllmet.Faithfulness.__name__, sorted(dir(myllmet))[:1])"
+    )
+
+    assert result.stdout.strip() == "Faithfulness ['Faithfulness']"
+
+
+def test_unknown_attribute_raises():
+    import myllmet
+
+    with pytest.raises(AttributeError):
+        myllmet.DoesNotExist
+
+
+def test_import_time_budget():
+    result = _run_python("import myllmet", "-X", "importtime")
+
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| myllmet$", result.stderr, flags=re.MULTILINE)
+    assert match is not None
+    cumulative_ms = int(match.group(1)) / 1000
+    assert cumulative_ms < IMPORT_TIME_BUDGET_MS
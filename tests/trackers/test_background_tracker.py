@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from myllmet.trackers import BackgroundTracker
+
+
+class RecordingTracker:
+    def __init__(self, gate=None):
+        self.gate = gate
+        self.records = []
+        self.flushed = 0
+        self.closed = False
+
+    def log(self, question, answer, context, ground_truth, score, intermediates, prompts):
+        if self.gate is not None:
+            self.gate.wait()
+        if question == "bad":
+            raise RuntimeError("boom")
+        self.records.append(question)
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _log(tracker, question):
+    tracker.log(
+        question=question,
+        answer="a",
+        context="c",
+        ground_truth="",
+        score=1.0,
+        intermediates={"claims": []},
+        prompts={},
+    )
+
+
+def test_records_are_forwarded_in_order():
+    inner = RecordingTracker()
+    with BackgroundTracker(inner, batch_size=3) as tracker:
+        for i in range(10):
+            _log(tracker, f"q{i}")
+        assert tracker.flush(timeout=5)
+        assert inner.flushed == 1
+
+    assert inner.records == [f"q{i}" for i in range(10)]
+    assert inner.closed
+    assert tracker.stats["logged"] == 10
+    assert tracker.stats["pending"] == 0
+
+
+def test_drop_policy_counts_dropped_records():
+    gate = threading.Event()
+    inner = RecordingTracker(gate=gate)
+    tracker = BackgroundTracker(inner, max_queue_size=1, overflow="drop", batch_size=1)
+
+    for i in range(20):
+        _log(tracker, f"q{i}")
+    gate.set()
+    tracker.close()
+
+    stats = tracker.stats
+    assert stats["dropped"] > 0
+    assert stats["logged"] + stats["dropped"] == 20
+    assert len(inner.records) == stats["logged"]
+
+
+def test_spill_policy_replays_records(tmp_path):
+    gate = threading.Event()
+    inner = RecordingTracker(gate=gate)
+    tracker = BackgroundTracker(inner, max_queue_size=1, overflow="spill", spill_path=tmp_path / "spill.jsonl")
+
+    for i in range(20):
+        _log(tracker, f"q{i}")
+    assert tracker.stats["spilled"] > 0
+
+    gate.set()
+    tracker.close()
+
+    assert sorted(inner.records) == sorted(f"q{i}" for i in range(20))
+    assert tracker.stats["logged"] == 20
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_tracker_errors_do_not_stop_the_writer():
+    inner = RecordingTracker()
+    with BackgroundTracker(inner) as tracker:
+        _log(tracker, "bad")
+        _log(tracker, "good")
+
+    assert inner.records == ["good"]
+    assert tracker.stats["errors"] == 1
+
+
+def test_log_after_close_raises():
+    tracker = BackgroundTracker(RecordingTracker())
+    tracker.close()
+
+    with pytest.raises(RuntimeError):
+        _log(tracker, "q")
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        BackgroundTracker(RecordingTracker(), overflow="ignore")
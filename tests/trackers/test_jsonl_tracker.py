@@ -0,0 +1,114 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from myllmet.trackers import JSONLTracker, _jsonl
+
+
+def _log(tracker, i):
+    tracker.log(
+        question=f"q{i}",
+        answer=f"a{i}",
+        context="context",
+        ground_truth="",
+        score=i / 10,
+        intermediates={"claims": [f"c{i}"]},
+        prompts={"claim_extractor": {"instruction": "extract"}},
+    )
+
+
+def test_buffers_until_flush_every(tmp_path):
+    tracker = JSONLTracker(tmp_path, flush_every=3, flush_interval=3600)
+    _log(tracker, 0)
+    _log(tracker, 1)
+    assert list(tmp_path.iterdir()) == []
+
+    _log(tracker, 2)
+    lines = (tmp_path / "tracker-00000.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["question"] for line in lines] == ["q0", "q1", "q2"]
+    tracker.close()
+
+
+def test_idle_buffer_is_flushed_after_flush_interval(tmp_path, mocker):
+    fsync = mocker.spy(_jsonl.os, "fsync")
+    tracker = JSONLTracker(tmp_path, flush_every=1000, flush_interval=0.05, fsync_interval=0.05)
+    _log(tracker, 0)
+    _log(tracker, 1)
+
+    path = tmp_path / "tracker-00000.jsonl"
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and not (path.exists() and fsync.call_count):
+        time.sleep(0.01)
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert fsync.call_count >= 1
+    tracker.close()
+    assert tracker._flusher is None
+
+
+def test_rotates_and_compresses(tmp_path):
+    with JSONLTracker(tmp_path, flush_every=1, max_bytes=200) as tracker:
+        for i in range(10):
+            _log(tracker, i)
+
+    rotated = sorted(tmp_path.glob("tracker-*.jsonl.gz"))
+    assert len(rotated) > 1
+    with gzip.open(rotated[0], "rt", encoding="utf-8") as f:
+        assert json.loads(f.readline())["question"] == "q0"
+
+    assert [record["question"] for record in tracker.iter_records()] == [f"q{i}" for i in range(10)]
+
+
+def test_views_match_list_tracker(tmp_path):
+    pytest.importorskip("pandas")
+    with JSONLTracker(tmp_path) as tracker:
+        for i in range(5):
+            _log(tracker, i)
+
+    standard = tracker.to_pandas("standard")
+    assert list(standard.columns) == ["id", "question", "answer", "context", "ground_truth", "score"]
+    assert tracker.to_pandas("intermediates")["claims"].tolist() == [[f"c{i}"] for i in range(5)]
+    assert tracker.to_pandas("prompts").columns.tolist() == ["id", "claim_extractor"]
+
+    chunks = list(tracker.to_pandas("standard", chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_reopen_appends_to_new_file(tmp_path):
+    with JSONLTracker(tmp_path) as tracker:
+        _log(tracker, 0)
+    with JSONLTracker(tmp_path) as tracker:
+        _log(tracker, 1)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tracker-00000.jsonl", "tracker-00001.jsonl"]
+    assert [record["question"] for record in tracker.iter_records("standard")] == ["q0", "q1"]
+
+
+def test_unknown_kind(tmp_path):
+    with pytest.raises(ValueError):
+        JSONLTracker(tmp_path).to_pandas("unknown")
+
+
+def test_rotation_compresses_in_background(tmp_path, monkeypatch):
+    release = threading.Event()
+    compress_segment = _jsonl._compress_segment
+
+    def blocking_compress(path):
+        release.wait(5.0)
+        compress_segment(path)
+
+    monkeypatch.setattr(_jsonl, "_compress_segment", blocking_compress)
+    tracker = JSONLTracker(tmp_path, flush_every=1, max_bytes=200)
+
+    for i in range(5):
+        _log(tracker, i)
+
+    assert not list(tmp_path.glob("tracker-*.jsonl.gz"))
+    release.set()
+    tracker.close()
+
+    assert list(tmp_path.glob("tracker-*.jsonl.gz"))
+    assert [record["question"] for record in tracker.iter_records()] == [f"q{i}" for i in range(5)]
@@ -0,0 +1,84 @@
+import pytest
+
+from myllmet.trackers import ListTracker
+
+pytest.importorskip("pandas")
+
+
+def _log(tracker, i, context="shared context", prompts=None):
+    tracker.log(
+        question=f"q{i}",
+        answer=f"a{i}",
+        context=context,
+        ground_truth="",
+        score=i / 10,
+        intermediates={"claims": [f"c{i}"], "verdicts": [{"claim": f"c{i}", "verdict": 1, "reason": "r"}]},
+        prompts=prompts or {"claim_extractor": {"instruction": "extract", "fewshot_examples": []}},
+    )
+
+
+def test_to_pandas_tables():
+    tracker = ListTracker()
+    _log(tracker, 1)
+    _log(tracker, 2, context="other context")
+
+    standard = tracker.to_pandas("standard")
+    prompts = tracker.to_pandas("prompts")
+    intermediates = tracker.to_pandas("intermediates")
+
+    assert list(standard.columns) == ["id", "question", "answer", "context", "ground_truth", "score"]
+    assert standard["context"].tolist() == ["shared context", "other context"]
+    assert prompts.columns.tolist() == ["id", "claim_extractor"]
+    assert prompts["claim_extractor"].tolist()[0] == {"instruction": "extract", "fewshot_examples": []}
+    assert intermediates["claims"].tolist() == [["c1"], ["c2"]]
+    assert standard["id"].tolist() == prompts["id"].tolist() == intermediates["id"].tolist()
+
+
+def test_prompts_and_contexts_are_stored_once():
+    tracker = ListTracker()
+    for i in range(100):
+        _log(tracker, i, prompts={"claim_extractor": {"instruction": "extract", "fewshot_examples": []}})
+
+    assert len(tracker) == 100
+    assert len(tracker._prompts) == 1
+    assert len(tracker._contexts) == 1
+
+
+def test_spill_to_disk_is_transparent(tmp_path):
+    tracker = ListTracker(spill_threshold_bytes=200, spill_dir=tmp_path)
+    for i in range(50):
+        _log(tracker, i, context=f"context {i}")
+
+    assert tracker._segments
+    assert len(tracker._rows) < 50
+
+    standard = tracker.to_pandas("standard")
+    assert len(tracker) == 50
+    assert standard["question"].tolist() == [f"q{i}" for i in range(50)]
+    assert standard["context"].tolist() == [f"context {i}" for i in range(50)]
+    assert tracker.to_pandas("prompts")["claim_extractor"].tolist()[-1]["instruction"] == "extract"
+
+    tracker.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_trackers_sharing_spill_dir_keep_separate_segments(tmp_path):
+    (tmp_path / "segment-00000.jsonl").write_text("unrelated\n", encoding="utf-8")
+    first = ListTracker(spill_threshold_bytes=200, spill_dir=tmp_path)
+    second = ListTracker(spill_threshold_bytes=200, spill_dir=tmp_path)
+    for i in range(20):
+        _log(first, i, context=f"first {i}")
+        _log(second, i, context=f"second {i}")
+
+    assert first.to_pandas("standard")["context"].tolist() == [f"first {i}" for i in range(20)]
+    assert second.to_pandas("standard")["context"].tolist() == [f"second {i}" for i in range(20)]
+
+    first.close()
+    assert second.to_pandas("standard")["context"].tolist() == [f"second {i}" for i in range(20)]
+    second.close()
+    assert [p.name for p in tmp_path.iterdir()] == ["segment-00000.jsonl"]
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        ListTracker().to_pandas("unknown")
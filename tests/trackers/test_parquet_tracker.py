@@ -0,0 +1,88 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pandas")
+
+from myllmet.trackers import ParquetTracker  # noqa: E402
+
+
+def _log(tracker, i, intermediates=None):
+    tracker.log(
+        question=f"q{i}",
+        answer=f"a{i}",
+        context="context",
+        ground_truth="",
+        score=i / 10,
+        intermediates=intermediates or {"claims": [f"c{i}"], "verdicts": []},
+        prompts={"claim_extractor": {"instruction": "extract", "fewshot_examples": []}},
+    )
+
+
+def test_flushes_row_groups_and_reads_back(tmp_path):
+    tracker = ParquetTracker(tmp_path, row_group_size=2)
+    for i in range(5):
+        _log(tracker, i)
+
+    assert len(list((tmp_path / "standard").glob("part-*.parquet"))) == 2
+
+    standard = tracker.to_pandas("standard")
+    assert standard["question"].tolist() == [f"q{i}" for i in range(5)]
+    assert standard["score"].tolist() == [i / 10 for i in range(5)]
+
+    intermediates = tracker.to_pandas("intermediates")
+    assert intermediates["claims"].tolist() == [[f"c{i}"] for i in range(5)]
+    assert standard["id"].tolist() == intermediates["id"].tolist()
+
+    prompts = tracker.to_pandas("prompts")
+    assert prompts["claim_extractor"].tolist()[0] == {"instruction": "extract", "fewshot_examples": []}
+
+
+def test_close_flushes_and_reopen_appends(tmp_path):
+    with ParquetTracker(tmp_path, row_group_size=100) as tracker:
+        _log(tracker, 0)
+
+    tracker = ParquetTracker(tmp_path, row_group_size=100)
+    _log(tracker, 1)
+    tracker.close()
+
+    assert tracker.to_arrow("standard").num_rows == 2
+    assert tracker.to_pandas("prompts", decode_json=False)["claim_extractor"].map(type).tolist() == [str, str]
+
+
+def test_new_intermediate_keys_are_null_filled(tmp_path):
+    tracker = ParquetTracker(tmp_path)
+    _log(tracker, 0, intermediates={"claims": []})
+    _log(tracker, 1, intermediates={"claims": [], "usage": {"tokens": 3}})
+
+    assert tracker.to_pandas("intermediates")["usage"].tolist() == [None, {"tokens": 3}]
+
+
+def test_repeated_prompts_are_encoded_once(tmp_path, mocker):
+    from myllmet.trackers import _parquet
+
+    encode = mocker.spy(_parquet, "_encode_json_values")
+    tracker = ParquetTracker(tmp_path)
+    for i in range(3):
+        _log(tracker, i)
+    tracker.log("q", "a", "context", "", 0.0, {}, {"claim_extractor": {"instruction": "new", "fewshot_examples": []}})
+
+    prompt_encodings = [call for call in encode.call_args_list if "claim_extractor" in call.args[0]]
+    assert len(prompt_encodings) == 2
+    instructions = [p["instruction"] for p in tracker.to_pandas("prompts")["claim_extractor"]]
+    assert instructions == ["extract", "extract", "extract", "new"]
+
+
+def test_unknown_kind(tmp_path):
+    with pytest.raises(ValueError):
+        ParquetTracker(tmp_path).to_arrow("unknown")
+
+
+def test_parts_are_uncompressed_by_default(tmp_path):
+    import pyarrow.parquet as pq
+
+    with ParquetTracker(tmp_path) as tracker:
+        _log(tracker, 0)
+
+    (part,) = (tmp_path / "standard").glob("part-*.parquet")
+    column = pq.ParquetFile(part).metadata.row_group(0).column(0)
+    assert column.compression == "UNCOMPRESSED"
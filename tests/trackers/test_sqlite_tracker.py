@@ -0,0 +1,92 @@
+import sqlite3
+
+import pytest
+
+from myllmet.trackers import SQLiteTracker
+
+PROMPTS = {"claim_extractor": {"instruction": "extract", "fewshot_examples": []}}
+
+
+def _log(tracker, question, score, verdicts):
+    tracker.log(
+        question=question,
+        answer="a",
+        context="shared context",
+        ground_truth="",
+        score=score,
+        intermediates={
+            "claims": [claim for claim, _ in verdicts],
+            "verdicts": [{"claim": claim, "verdict": verdict, "reason": "r"} for claim, verdict in verdicts],
+        },
+        prompts=PROMPTS,
+    )
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = SQLiteTracker(tmp_path / "tracker.db", run_id="run-1", batch_size=2)
+    yield tracker
+    tracker.close()
+
+
+def test_bottom_k(tracker):
+    _log(tracker, "q1", 1.0, [("x", 1)])
+    _log(tracker, "q2", 0.0, [("x", 0)])
+    _log(tracker, "q3", 0.5, [("x", 1), ("y", 0)])
+
+    rows = tracker.bottom_k(2)
+
+    assert [row["question"] for row in rows] == ["q2", "q3"]
+    assert rows[0]["context"] == "shared context"
+    assert rows[0]["run_id"] == "run-1"
+
+
+def test_verdict_distribution(tracker):
+    _log(tracker, "q1", 1.0, [("x", 1)])
+    _log(tracker, "q2", 0.0, [("x", 0), ("y", 0)])
+    _log(tracker, "q3", 1.0, [("x", 1)])
+
+    assert tracker.verdict_distribution() == [
+        {"claim": "x", "verdict": 0, "count": 1},
+        {"claim": "x", "verdict": 1, "count": 2},
+        {"claim": "y", "verdict": 0, "count": 1},
+    ]
+    assert tracker.verdict_distribution(claim="y") == [{"claim": "y", "verdict": 0, "count": 1}]
+
+
+def test_contexts_and_prompts_are_deduplicated(tmp_path):
+    path = tmp_path / "tracker.db"
+    with SQLiteTracker(path, run_id="run-1") as tracker:
+        for i in range(5):
+            _log(tracker, f"q{i}", 1.0, [("x", 1)])
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM records").fetchone() == (5,)
+    assert conn.execute("SELECT COUNT(*) FROM contexts").fetchone() == (1,)
+    assert conn.execute("SELECT COUNT(*) FROM prompts").fetchone() == (1,)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_runs_are_separated(tmp_path):
+    path = tmp_path / "tracker.db"
+    with SQLiteTracker(path, run_id="run-1") as tracker:
+        _log(tracker, "q1", 0.0, [("x", 0)])
+    with SQLiteTracker(path, run_id="run-2") as tracker:
+        _log(tracker, "q2", 0.5, [("x", 1), ("y", 0)])
+
+        assert tracker.run_ids() == ["run-1", "run-2"]
+        assert [row["question"] for row in tracker.bottom_k(10)] == ["q2"]
+        assert [row["question"] for row in tracker.bottom_k(10, run_id="run-1")] == ["q1"]
+
+
+def test_to_pandas_views(tracker):
+    pytest.importorskip("pandas")
+    _log(tracker, "q1", 1.0, [("x", 1)])
+
+    standard = tracker.to_pandas("standard")
+    assert list(standard.columns) == ["id", "question", "answer", "context", "ground_truth", "score"]
+    assert tracker.to_pandas("intermediates")["claims"].tolist() == [["x"]]
+    assert tracker.to_pandas("prompts")["claim_extractor"].tolist() == [PROMPTS["claim_extractor"]]
+
+    with pytest.raises(ValueError):
+        tracker.to_pandas("unknown")